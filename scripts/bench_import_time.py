@@ -0,0 +1,110 @@
+"""
+Import-time benchmark for the API and worker entry modules.
+
+Imports each module in a fresh interpreter under ``python -X importtime``
+(the same cold start an API or worker process pays) and reports:
+    total  - cumulative import time of the module (best of --repeat runs)
+    heavy  - which heavy stacks the import pulled in (PDF, tables, OCR, LLM SDKs)
+    top    - the slowest nested imports by cumulative time
+
+Modules whose dependencies are not installed are reported as failed with the
+missing import instead of a time.
+
+Usage:
+    python scripts/bench_import_time.py [module ...] [--repeat 3] [--top 8]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = [
+    "src.core.config",
+    "src.api.routes",
+    "src.main",
+    "src.orchestration.document_orchestrator",
+    "src.extraction.extractor",
+    "src.enhancement.enhancer",
+]
+
+# Top-level packages that should only load behind a pipeline entry point
+HEAVY_PACKAGES = [
+    "fitz", "pymupdf", "pandas", "cv2", "camelot", "pdfplumber", "pytesseract", "tesserocr",
+    "openai", "tiktoken", "langchain", "langchain_openai", "pinecone",
+]
+
+
+def import_profile(module: str):
+    """
+    One cold import of `module`: (total microseconds, {package: cumulative us},
+    loaded top-level packages, error message or None)
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys, {module}; print(' '.join(sorted({{m.partition('.')[0] for m in sys.modules}})))"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    # Lines come out in completion order; everything after the previous
+    # top-level entry (interpreter startup: site, encodings, ...) belongs to `module`
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        timings.setdefault(name.strip(), int(cumulative))
+        if name.strip() != module and len(name) - len(name.lstrip()) == 1:
+            timings.clear()
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+        return None, timings, set(), error
+    return timings.get(module), timings, set(proc.stdout.split()), None
+
+
+def run(modules, repeat: int, top: int):
+    results = []
+    for module in modules:
+        runs = [import_profile(module) for _ in range(repeat)]
+        total, timings, loaded, error = min(runs, key=lambda r: r[0] if r[0] is not None else float("inf"))
+        results.append((module, total, error))
+
+        logger.info(f"\n{module}")
+        if error:
+            logger.info(f"    failed: {error}")
+            continue
+        heavy = [name for name in HEAVY_PACKAGES if name in loaded]
+        logger.info(f"    total: {total / 1000:.1f} ms | heavy: {', '.join(heavy) or 'none'}")
+        nested = sorted(
+            ((us, name) for name, us in timings.items() if name != module and "." not in name),
+            reverse=True,
+        )
+        for us, name in nested[:top]:
+            logger.info(f"      {us / 1000:8.1f} ms  {name}")
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Cold imports, best of {repeat}")
+    for module, total, error in results:
+        status = f"{total / 1000:.1f} ms" if total is not None else f"failed ({error})"
+        logger.info(f"{module:45s} {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of entry modules")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level imports to list per module")
+    args = parser.parse_args()
+
+    run(args.modules, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
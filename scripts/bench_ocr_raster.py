@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for the image-block OCR preprocessing path.
+
+Compares, per image block crop:
+    legacy  - clip render (RGB) -> PNG encode -> PNG decode -> PIL grayscale
+              -> ImageEnhance.Contrast -> ImageFilter.SHARPEN
+    raster  - crop from the shared page raster -> grayscale crop -> zero-copy
+              array view -> LUT contrast + integer sharpen (enhance_for_ocr)
+
+The page raster itself is rendered by the extractor for every page anyway
+(debug page PNG), so it is rendered outside the timed section here. Tesseract is not
+called; only the work done before OCR is timed.
+
+Usage:
+    python scripts/bench_ocr_raster.py [path/to/file.pdf] [--dpi 300] [--repeat 3]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import fitz
+from loguru import logger
+from PIL import Image, ImageEnhance, ImageFilter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.raster import PageRenderCache, pixmap_to_array, enhance_for_ocr
+
+DEFAULT_PDF = "artefacts/38559d71-c40a-4f83-9dd1-4bdb16653491/source.pdf"
+ZOOM = 2.5  # same zoom as PDFExtractorV2._ocr_image_block
+
+
+def image_bboxes(page):
+    """Image block bboxes as the extractor sees them"""
+    blocks = page.get_text("dict").get("blocks", [])
+    return [tuple(b["bbox"]) for b in blocks if b.get("type") == 1]
+
+
+def legacy_path(page, bbox):
+    pix = page.get_pixmap(matrix=fitz.Matrix(ZOOM, ZOOM), clip=fitz.Rect(bbox))
+    img = Image.open(io.BytesIO(pix.tobytes("png")))
+    if img.mode != 'L':
+        img = img.convert('L')
+    img = ImageEnhance.Contrast(img).enhance(1.5)
+    return img.filter(ImageFilter.SHARPEN)
+
+
+def raster_path(cache, page, bbox, dpi):
+    pix = cache.crop(page, bbox, dpi, ZOOM, gray=True)
+    gray = pixmap_to_array(pix)
+    img = Image.fromarray(enhance_for_ocr(gray, contrast=1.5))
+    del gray
+    return img
+
+
+def run(pdf_path: str, dpi: int, repeat: int):
+    doc = fitz.open(pdf_path)
+    pages = [(page, image_bboxes(page)) for page in doc]
+    pages = [(page, bboxes) for page, bboxes in pages if bboxes]
+    n_crops = sum(len(bboxes) for _, bboxes in pages)
+    if not n_crops:
+        logger.warning(f"No image blocks in {pdf_path}")
+        return
+
+    legacy_times, raster_times = [], []
+    for _ in range(repeat):
+        legacy_total = raster_total = 0.0
+        cache = PageRenderCache()
+        for page, bboxes in pages:
+            t = time.perf_counter()
+            for bbox in bboxes:
+                legacy_path(page, bbox)
+            legacy_total += time.perf_counter() - t
+
+            # Shared colour raster, as produced for the debug page PNG
+            cache.page_pixmap(page, dpi)
+            t = time.perf_counter()
+            for bbox in bboxes:
+                raster_path(cache, page, bbox, dpi)
+            raster_total += time.perf_counter() - t
+        cache.release()
+        legacy_times.append(legacy_total)
+        raster_times.append(raster_total)
+
+    legacy_best = min(legacy_times)
+    raster_best = min(raster_times)
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"PDF: {pdf_path}")
+    logger.info(f"Pages: {len(doc)} | Image crops: {n_crops} | DPI: {dpi} | Repeat: {repeat}")
+    logger.info(f"{'='*60}")
+    logger.info(f"legacy : {legacy_best:.3f}s total, {legacy_best / n_crops * 1000:.2f} ms/crop")
+    logger.info(f"raster : {raster_best:.3f}s total, {raster_best / n_crops * 1000:.2f} ms/crop")
+    logger.info(f"speedup: {legacy_best / raster_best:.2f}x")
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR crop preprocessing")
+    parser.add_argument("pdf", nargs="?", default=DEFAULT_PDF)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.pdf, args.dpi, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Benchmark for document-property and numeric-pattern extraction.
+
+Runs on one markdown file (default: the 85k-character markdown of our largest
+artefact):
+    legacy  - _extract_document_properties with ~15 uncompiled re calls over the
+              whole text plus per-word padded copies for language detection;
+              WindowAnalyzer.extract_numerical_patterns building one dict (with
+              a 40-character context string) per matched number
+    shared  - src/shared/patterns: precompiled combined alternations, scans
+              that stop at the value limits, NumericPatterns counts + samples
+
+Checks: every property value of the shared path is one the legacy path found
+(the legacy lists are arbitrary set order, the shared ones first-occurrence
+order), and the prompt summary of every window is identical.
+
+Usage:
+    python scripts/bench_patterns.py [path/to/markdown.md] [--window-chars 35000] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.shared.patterns import (
+    EMAIL_PATTERN, TEMPORAL_PATTERN, URL_PATTERN, NumericPatterns, iter_dates, iter_numbers, unique,
+)
+
+DEFAULT_MARKDOWN = "artefacts/38559d71-c40a-4f83-9dd1-4bdb16653491/Product Focus Q1 2025.md"
+
+INDONESIAN_WORDS = ['dan', 'yang', 'untuk', 'dengan', 'pada', 'adalah', 'dari', 'ini', 'dalam']
+ENGLISH_WORDS = ['and', 'the', 'for', 'with', 'this', 'that', 'from', 'are', 'was', 'were']
+
+
+# -- legacy implementations (before src/shared/patterns) --------------------------------
+
+def legacy_properties(full_text):
+    properties = {'dates': [], 'temporal_references': [], 'numbers': []}
+    date_patterns = [
+        r'\b(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+(\d{4})\b',
+        r'\b(Senin|Selasa|Rabu|Kamis|Jumat|Sabtu|Minggu),?\s+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+(\d{4})\b',
+        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})\b',
+        r'\b(\d{4})[-/](\d{1,2})[-/](\d{1,2})\b',
+        r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',
+    ]
+    for pattern in date_patterns:
+        for match in re.findall(pattern, full_text, re.IGNORECASE):
+            properties['dates'].append(' '.join(str(m) for m in match if m))
+    all_dates = set(properties['dates'])
+    properties['dates'] = list(all_dates)[:20]
+
+    for pattern in [r'\b(Q[1-4]\s+\d{4})\b', r'\b(FY\s*\d{4})\b', r'\b(tahun\s+\d{4})\b', r'\b(year\s+\d{4})\b']:
+        properties['temporal_references'].extend(re.findall(pattern, full_text, re.IGNORECASE))
+    all_temporal = set(properties['temporal_references'])
+    properties['temporal_references'] = list(all_temporal)[:10]
+
+    for pattern in [r'\b(\d+[,.]\d+)%', r'\b(\d{1,3}(?:[,.]\d{3})*(?:[,.]\d+)?)\b']:
+        properties['numbers'].extend(re.findall(pattern, full_text))
+    all_numbers = set(properties['numbers'])
+    properties['numbers'] = list(all_numbers)[:30]
+
+    all_urls = set(re.findall(r'https?://[^\s<>"]+|www\.[^\s<>"]+', full_text, re.IGNORECASE))
+    properties['urls'] = list(all_urls)[:10]
+    all_emails = set(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', full_text))
+    properties['emails'] = list(all_emails)[:10]
+
+    text_lower = full_text.lower()
+    id_count = sum(1 for word in INDONESIAN_WORDS if f' {word} ' in f' {text_lower} ')
+    en_count = sum(1 for word in ENGLISH_WORDS if f' {word} ' in f' {text_lower} ')
+    properties['language'] = (id_count, en_count)
+    universe = {'dates': all_dates, 'temporal_references': all_temporal, 'numbers': all_numbers,
+                'urls': all_urls, 'emails': all_emails}
+    return properties, universe
+
+
+def legacy_numerical_patterns(content):
+    patterns = []
+    for pattern, currency_type in [
+        (r'(?:Rp|IDR)\s?([\d,.]+)(?:\s*(?:ribu|juta|miliar|triliun))?', 'idr'),
+        (r'(?:USD|\$)\s?([\d,.]+)(?:\s*(?:thousand|million|billion))?', 'usd'),
+    ]:
+        for match in re.finditer(pattern, content, re.IGNORECASE):
+            patterns.append({'type': 'currency', 'currency': currency_type,
+                             'value': match.group(0), 'position': match.span()})
+    for match in re.finditer(r'(\d+(?:[.,]\d+)?)\s*%', content):
+        patterns.append({'type': 'percentage', 'value': match.group(0), 'position': match.span()})
+    for match in re.finditer(r'(\d+)\s*(tahun|bulan|hari|minggu|kuartal|semester)', content, re.IGNORECASE):
+        patterns.append({'type': 'period', 'value': match.group(0), 'position': match.span()})
+    for match in re.finditer(r'\b(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d+)?)\b', content):
+        start = max(0, match.start() - 20)
+        end = min(len(content), match.end() + 20)
+        patterns.append({'type': 'number', 'value': match.group(0), 'context': content[start:end],
+                         'position': match.span()})
+    return patterns
+
+
+def legacy_summary(patterns):
+    summary = []
+    type_counts = {}
+    for pattern in patterns:
+        type_counts[pattern['type']] = type_counts.get(pattern['type'], 0) + 1
+    for ptype, count in type_counts.items():
+        summary.append(f"- {ptype}: {count} instances")
+    if patterns:
+        summary.append("\nSample values:")
+        for pattern in patterns[:5]:
+            summary.append(f"  - {pattern['value']} ({pattern['type']})")
+    return '\n'.join(summary), len(patterns)
+
+
+# -- shared implementations -------------------------------------------------------------
+
+def shared_properties(full_text):
+    properties = {
+        'dates': unique(iter_dates(full_text), 20),
+        'temporal_references': unique(TEMPORAL_PATTERN.findall(full_text), 10),
+        'numbers': unique(iter_numbers(full_text), 30),
+        'urls': unique(URL_PATTERN.findall(full_text), 10),
+        'emails': unique(EMAIL_PATTERN.findall(full_text), 10),
+    }
+    padded_text = f' {full_text.lower()} '
+    properties['language'] = (sum(1 for word in INDONESIAN_WORDS if f' {word} ' in padded_text),
+                              sum(1 for word in ENGLISH_WORDS if f' {word} ' in padded_text))
+    return properties
+
+
+def shared_summary(patterns):
+    summary = [f"- {ptype}: {count} instances" for ptype, count in patterns.counts.items()]
+    if patterns:
+        summary.append("\nSample values:")
+        summary.extend(f"  - {value} ({ptype})" for value, ptype in patterns.samples(5))
+    return '\n'.join(summary), len(patterns)
+
+
+# -- benchmark --------------------------------------------------------------------------
+
+def split_windows(text, window_chars):
+    windows, current = [], []
+    size = 0
+    for paragraph in text.split('\n\n'):
+        if current and size + len(paragraph) > window_chars:
+            windows.append('\n\n'.join(current))
+            current, size = [], 0
+        current.append(paragraph)
+        size += len(paragraph) + 2
+    if current:
+        windows.append('\n\n'.join(current))
+    return windows
+
+
+def best_of(repeat, fn):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def peak_bytes(fn):
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, result
+
+
+def run(markdown_path, window_chars, repeat):
+    text = Path(markdown_path).read_text(encoding='utf-8')
+    windows = split_windows(text, window_chars)
+
+    legacy_props, universe = legacy_properties(text)
+    props = shared_properties(text)
+    for key, values in universe.items():
+        if not set(props[key]) <= values or len(props[key]) != len(legacy_props[key]):
+            raise SystemExit(f"Property '{key}' differs from the legacy extraction")
+    if props['language'] != legacy_props['language']:
+        raise SystemExit("Language word counts differ")
+
+    for i, window in enumerate(windows):
+        if legacy_summary(legacy_numerical_patterns(window)) != shared_summary(NumericPatterns(window)):
+            raise SystemExit(f"Numeric pattern summary differs for window {i}")
+
+    props_legacy_t = best_of(repeat, lambda: legacy_properties(text))
+    props_shared_t = best_of(repeat, lambda: shared_properties(text))
+    numeric_legacy_t = best_of(repeat, lambda: [legacy_summary(legacy_numerical_patterns(w)) for w in windows])
+    numeric_shared_t = best_of(repeat, lambda: [shared_summary(NumericPatterns(w)) for w in windows])
+
+    legacy_mem, legacy_patterns = peak_bytes(lambda: [legacy_numerical_patterns(w) for w in windows])
+    shared_mem, _ = peak_bytes(lambda: [NumericPatterns(w).counts for w in windows])
+    matches = sum(map(len, legacy_patterns))
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Markdown: {markdown_path}")
+    logger.info(f"Chars: {len(text):,} | Windows: {len(windows)} (~{window_chars} chars) | "
+                f"Numeric matches: {matches:,} | Repeat: {repeat}")
+    logger.info(f"{'='*60}")
+    logger.info("Output: property values found by legacy, identical window summaries")
+    logger.info(f"properties legacy: {props_legacy_t * 1000:.2f} ms | shared: {props_shared_t * 1000:.2f} ms "
+                f"({props_legacy_t / props_shared_t:.1f}x)")
+    logger.info(f"numeric    legacy: {numeric_legacy_t * 1000:.2f} ms | shared: {numeric_shared_t * 1000:.2f} ms "
+                f"({numeric_legacy_t / numeric_shared_t:.1f}x)")
+    logger.info(f"numeric peak memory legacy: {legacy_mem / 1024:.0f} KiB | shared: {shared_mem / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark document-property and numeric-pattern extraction")
+    parser.add_argument("markdown", nargs="?", default=DEFAULT_MARKDOWN)
+    parser.add_argument("--window-chars", type=int, default=35000,
+                        help="Approximate window size (10k-token enhancement windows are ~35k chars)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.markdown, args.window_chars, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
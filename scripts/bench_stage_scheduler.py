@@ -0,0 +1,177 @@
+"""
+Batch throughput benchmark: whole-pipeline slots vs stage-aware scheduling.
+
+Processes every artefacts/<doc_id>/source.pdf (a copy, in a temp directory)
+twice:
+    whole  - legacy MultiFileOrchestrator scheduling: max_concurrent_files
+             semaphore slots, each held for the document's whole pipeline,
+             extraction in a thread with all dedicated cores as page workers
+    staged - StageScheduler: extraction in a process pool (one worker per CPU
+             slot), enhancement and vectorization as async stages with their
+             own limits
+
+Extraction is real (DocumentOrchestrator.run_extraction_stage). Enhancement
+and vectorization need OpenAI/Pinecone, so they are replayed as async waits of
+the durations recorded in each document's processing_state.json, scaled by
+--time-scale.
+
+Usage:
+    python scripts/bench_stage_scheduler.py [artefacts_dir] [--time-scale 0.05]
+        [--cores 4] [--files 2] [--enhancements 2] [--vectorizations 2]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.orchestration.document_orchestrator import DocumentOrchestrator
+from src.orchestration.stage_scheduler import Stage, StageScheduler
+
+DEFAULT_ARTEFACTS = "artefacts"
+
+
+def recorded_io_seconds(doc_dir: Path):
+    """(enhancement + synthesis, vectorization) seconds from processing_state.json"""
+    state_path = doc_dir / "processing_state.json"
+    if not state_path.exists():
+        return 0.0, 0.0
+    durations = json.loads(state_path.read_text(encoding="utf-8")).get("stage_durations", {})
+    enhancement = (durations.get("enhancement_in_progress_to_enhancement_completed", 0.0)
+                   + durations.get("synthesis_in_progress_to_synthesis_completed", 0.0))
+    vectorization = durations.get("vectorization_in_progress_to_vectorization_completed", 0.0)
+    return enhancement, vectorization
+
+
+def prepare_corpus(artefacts_dir: Path, work_dir: Path):
+    """Copy source.pdf + document_meta.json of each document; returns {doc_id: (enh_s, vec_s)}"""
+    corpus = {}
+    for doc_dir in sorted(artefacts_dir.iterdir()):
+        if not (doc_dir / "source.pdf").exists():
+            continue
+        target = work_dir / doc_dir.name
+        target.mkdir(parents=True)
+        shutil.copy2(doc_dir / "source.pdf", target / "source.pdf")
+        if (doc_dir / "document_meta.json").exists():
+            shutil.copy2(doc_dir / "document_meta.json", target / "document_meta.json")
+        corpus[doc_dir.name] = recorded_io_seconds(doc_dir)
+    return corpus
+
+
+def reset_outputs(work_dir: Path):
+    for doc_dir in work_dir.iterdir():
+        for path in doc_dir.iterdir():
+            if path.name in ("source.pdf", "document_meta.json"):
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+
+async def run_whole(corpus, work_dir: Path, files: int, cores: int, time_scale: float):
+    semaphore = asyncio.Semaphore(files)
+
+    async def process(doc_id):
+        async with semaphore:
+            orchestrator = DocumentOrchestrator(doc_id=doc_id, artefacts_dir=str(work_dir))
+            await orchestrator.run_extraction_stage(page_workers=cores)
+            enhancement, vectorization = corpus[doc_id]
+            await asyncio.sleep(enhancement * time_scale)
+            await asyncio.sleep(vectorization * time_scale)
+
+    await asyncio.gather(*(process(doc_id) for doc_id in corpus))
+
+
+async def run_staged(corpus, work_dir: Path, cores: int, enhancements: int, vectorizations: int,
+                     time_scale: float):
+    slots = max(1, min(cores, len(corpus)))
+    page_workers = max(1, cores // slots)
+    pool = ProcessPoolExecutor(max_workers=slots, mp_context=multiprocessing.get_context("spawn"))
+
+    async def extract(doc_id):
+        orchestrator = DocumentOrchestrator(doc_id=doc_id, artefacts_dir=str(work_dir))
+        await orchestrator.run_extraction_stage(executor=pool, page_workers=page_workers)
+
+    async def enhance(doc_id):
+        await asyncio.sleep(corpus[doc_id][0] * time_scale)
+
+    async def vectorize(doc_id):
+        await asyncio.sleep(corpus[doc_id][1] * time_scale)
+
+    scheduler = StageScheduler([
+        Stage("extraction", slots, extract),
+        Stage("enhancement", enhancements, enhance),
+        Stage("vectorization", vectorizations, vectorize),
+    ])
+    try:
+        results = await scheduler.run(list(corpus))
+    finally:
+        pool.shutdown()
+    failed = [doc_id for doc_id, r in results.items() if r["status"] != "completed"]
+    if failed:
+        raise SystemExit(f"Staged run failed for {failed}")
+    return scheduler.stats_dict()
+
+
+def timed(coro):
+    start = time.perf_counter()
+    result = asyncio.run(coro)
+    return time.perf_counter() - start, result
+
+
+def run(artefacts_dir: str, time_scale: float, cores: int, files: int, enhancements: int, vectorizations: int):
+    # Extraction logs per page; keep the report readable
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        corpus = prepare_corpus(Path(artefacts_dir), work_dir)
+        n = len(corpus)
+
+        whole_s, _ = timed(run_whole(corpus, work_dir, files, cores, time_scale))
+        reset_outputs(work_dir)
+        staged_s, stats = timed(run_staged(corpus, work_dir, cores, enhancements, vectorizations, time_scale))
+
+    io_total = sum(e + v for e, v in corpus.values()) * time_scale
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Documents: {n} | Cores: {cores} | Time scale: {time_scale} "
+                f"(replayed LLM/vector I/O: {io_total:.1f}s in total)")
+    logger.info(f"{'='*60}")
+    logger.info(f"whole  ({files} slots):        {whole_s:7.1f}s | {n * 60 / whole_s:6.1f} docs/min")
+    logger.info(f"staged (enh {enhancements}, vec {vectorizations}):    {staged_s:7.1f}s | {n * 60 / staged_s:6.1f} docs/min "
+                f"({whole_s / staged_s:.2f}x)")
+    for name, stage in stats.items():
+        logger.info(f"  {name:13s} limit {stage['limit']} | busy {stage['busy_seconds']:6.1f}s | "
+                    f"queued {stage['queue_wait_seconds']:6.1f}s | peak {stage['max_active']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare whole-pipeline and stage-aware batch scheduling")
+    parser.add_argument("artefacts", nargs="?", default=DEFAULT_ARTEFACTS)
+    parser.add_argument("--time-scale", type=float, default=0.05,
+                        help="Factor applied to recorded enhancement/vectorization durations")
+    parser.add_argument("--cores", type=int, default=4, help="max_cpu_cores_dedicated")
+    parser.add_argument("--files", type=int, default=2, help="max_concurrent_files (whole-pipeline slots)")
+    parser.add_argument("--enhancements", type=int, default=2, help="max_concurrent_enhancements")
+    parser.add_argument("--vectorizations", type=int, default=2, help="max_concurrent_vectorizations")
+    args = parser.parse_args()
+
+    run(args.artefacts, args.time_scale, args.cores, args.files, args.enhancements, args.vectorizations)
+
+
+if __name__ == "__main__":
+    main()
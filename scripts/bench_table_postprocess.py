@@ -0,0 +1,140 @@
+"""
+Micro-benchmark for table post-processing and markdown rendering.
+
+Replays every table stored in artefacts/*/tables.json (header row + body rows,
+i.e. the raw pdfplumber/PyMuPDF cell grid shape) through:
+    legacy  - per-column DataFrame.apply with inline regexes -> header rename
+              -> empty-column mask -> DataFrame.map strip -> df.to_markdown
+    array   - table_format.clean_table (one object-array pass, precompiled
+              regexes) -> table_format.frame_to_markdown (direct pipe emitter)
+
+Both paths must produce the same rows, headers, merged-token counts and
+markdown; the script stops with an error on the first difference.
+
+Usage:
+    python scripts/bench_table_postprocess.py [artefacts_dir] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.table_format import clean_table, frame_to_markdown
+
+DEFAULT_ARTEFACTS = "artefacts"
+
+
+def legacy_postprocess(df):
+    """PDFExtractorV2._postprocess_table before table_format"""
+    merged_count = 0
+
+    def split_cell(cell):
+        nonlocal merged_count
+        if not isinstance(cell, str):
+            return cell
+        match = re.findall(r'(\d+\.?\d*%)(\d+\.?\d*%)', cell)
+        if match:
+            merged_count += 1
+            return ' | '.join(match[0])
+        if re.match(r'^[\d\.\s]+$', cell):
+            parts = cell.split()
+            if len(parts) == 2 and all(re.match(r'^\d+\.?\d*$', p) for p in parts):
+                merged_count += 1
+                return ' | '.join(parts)
+        cell = re.sub(r'\((\d+\.?\d*)\)', r'-\1', cell)
+        match = re.findall(r'(\d{1,2}-\w{3})(\d{1,2}-\w{3})', cell)
+        if match:
+            merged_count += 1
+            return ' | '.join(match[0])
+        return cell
+
+    for col in df.columns:
+        df[col] = df[col].apply(split_cell)
+    df.columns = [str(col).strip().replace('\n', ' ') for col in df.columns]
+    df.columns = ['Col' + str(i) if not col else col for i, col in enumerate(df.columns)]
+    df = df.loc[:, (df != '').any(axis=0)]
+    df = df.map(lambda x: str(x).strip() if pd.notna(x) else '')
+    return df, merged_count
+
+
+def legacy_path(headers, rows):
+    df, merged = legacy_postprocess(pd.DataFrame(rows, columns=headers))
+    return df, merged, df.to_markdown(index=False)
+
+
+def array_path(headers, rows):
+    df, merged = clean_table(pd.DataFrame(rows, columns=headers))
+    markdown = frame_to_markdown(df)
+    if markdown is None:
+        markdown = df.to_markdown(index=False)
+    return df, merged, markdown
+
+
+def load_tables(artefacts_dir: str):
+    tables = []
+    for path in sorted(Path(artefacts_dir).glob("*/tables.json")):
+        for table in json.loads(path.read_text(encoding="utf-8")):
+            tables.append((table["table_id"], table["headers"], table["rows"]))
+    return tables
+
+
+def run(artefacts_dir: str, repeat: int):
+    tables = load_tables(artefacts_dir)
+    if not tables:
+        logger.warning(f"No tables.json files under {artefacts_dir}")
+        return
+    n_cells = sum(len(headers) * (len(rows) + 1) for _, headers, rows in tables)
+
+    deferred = 0
+    for table_id, headers, rows in tables:
+        old_df, old_merged, old_md = legacy_path(headers, rows)
+        new_df, new_merged, new_md = array_path(headers, rows)
+        if (old_merged != new_merged or old_df.columns.tolist() != new_df.columns.tolist()
+                or old_df.values.tolist() != new_df.values.tolist() or old_md != new_md):
+            raise SystemExit(f"Output differs for {table_id}")
+        deferred += frame_to_markdown(new_df) is None
+
+    legacy_times, array_times = [], []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _, headers, rows in tables:
+            legacy_path(headers, rows)
+        legacy_times.append(time.perf_counter() - t)
+
+        t = time.perf_counter()
+        for _, headers, rows in tables:
+            array_path(headers, rows)
+        array_times.append(time.perf_counter() - t)
+
+    legacy_best = min(legacy_times)
+    array_best = min(array_times)
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Artefacts: {artefacts_dir}")
+    logger.info(f"Tables: {len(tables)} | Cells: {n_cells} | Left to tabulate: {deferred} | Repeat: {repeat}")
+    logger.info(f"{'='*60}")
+    logger.info("Output: identical rows, headers, merged-token counts and markdown")
+    logger.info(f"legacy : {legacy_best * 1000:.1f} ms total, {legacy_best / len(tables) * 1000:.3f} ms/table")
+    logger.info(f"array  : {array_best * 1000:.1f} ms total, {array_best / len(tables) * 1000:.3f} ms/table")
+    logger.info(f"speedup: {legacy_best / array_best:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark table post-processing and markdown")
+    parser.add_argument("artefacts", nargs="?", default=DEFAULT_ARTEFACTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.artefacts, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark for unit metadata persistence.
+
+Compares, for the units of one extracted document (units_metadata.json of an
+artefact, rebuilt into extractor Unit objects):
+    legacy  - asdict every unit, json.dumps(indent=2) written twice
+              (units_metadata.json and meta/units_metadata.json); the enhancer
+              json.loads the file back into a list of dicts
+    store   - UnitStore columns written once to units.npz (plus the single
+              legacy JSON export, checked byte for byte, when --with-json); the
+              enhancer opens the store and reads fields through lazy record views
+
+Reported: write time, load-and-sort time (what enhancement does before
+building windows), bytes on disk and memory retained by the loaded units
+(tracemalloc).
+
+Usage:
+    python scripts/bench_unit_store.py [path/to/units_metadata.json] [--repeat 5] [--with-json]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.extractor import Unit
+from src.shared.unit_store import UNIT_STORE_FILENAME, UnitStore, export_json
+
+DEFAULT_UNITS = "artefacts/38559d71-c40a-4f83-9dd1-4bdb16653491/units_metadata.json"
+
+
+def window_order(units):
+    """Sort and read every unit's text, as DirectEnhancerV2._create_enhancement_windows does"""
+    units = list(units)
+    units.sort(key=lambda x: (x.get('page', 0), x.get('bbox', [0, 0])[1] if 'bbox' in x else 0))
+    return sum(len(unit.get('content', '') or '') for unit in units)
+
+
+def legacy_write(units, out_dir: Path):
+    units_meta = [unit.to_dict() for unit in units]
+    (out_dir / "units_metadata.json").write_text(json.dumps(units_meta, indent=2), encoding='utf-8')
+    (out_dir / "meta" / "units_metadata.json").write_text(json.dumps(units_meta, indent=2), encoding='utf-8')
+
+
+def store_write(units, out_dir: Path, with_json: bool):
+    UnitStore.from_units(units).save(out_dir / UNIT_STORE_FILENAME)
+    if with_json:
+        export_json(units, out_dir / "units_metadata.json")
+
+
+def legacy_load(out_dir: Path):
+    with open(out_dir / "units_metadata.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def store_load(out_dir: Path):
+    return UnitStore.load(out_dir / UNIT_STORE_FILENAME)
+
+
+def best_of(repeat: int, fn, *args):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def retained_bytes(fn):
+    """Memory still allocated after fn() returns, with its result kept alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    window_order(result)  # touch every field the enhancer reads
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, result
+
+
+def run(units_path: str, repeat: int, with_json: bool):
+    records = json.loads(Path(units_path).read_text(encoding='utf-8'))
+    units = [Unit(**{**record, 'bbox': tuple(record['bbox'])}) for record in records]
+    if not units:
+        logger.warning(f"No units in {units_path}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir, store_dir = Path(tmp, "legacy"), Path(tmp, "store")
+        for out_dir in (legacy_dir, store_dir):
+            (out_dir / "meta").mkdir(parents=True)
+
+        legacy_write_t = best_of(repeat, legacy_write, units, legacy_dir)
+        store_write_t = best_of(repeat, store_write, units, store_dir, with_json)
+
+        loaded = UnitStore.load(store_dir / UNIT_STORE_FILENAME).to_dicts()
+        if loaded != records:
+            raise SystemExit("Store round trip differs from units_metadata.json")
+        if with_json and ((store_dir / "units_metadata.json").read_bytes()
+                          != (legacy_dir / "units_metadata.json").read_bytes()):
+            raise SystemExit("Legacy JSON export differs from the previous units_metadata.json")
+
+        legacy_read_t = best_of(repeat, lambda: window_order(legacy_load(legacy_dir)))
+        store_read_t = best_of(repeat, lambda: window_order(store_load(store_dir)))
+
+        legacy_mem, _ = retained_bytes(lambda: legacy_load(legacy_dir))
+        store_mem, store = retained_bytes(lambda: store_load(store_dir))
+
+        legacy_disk = sum(p.stat().st_size for p in legacy_dir.rglob("*.json"))
+        store_disk = sum(p.stat().st_size for p in store_dir.rglob("*") if p.is_file())
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Units: {units_path}")
+    logger.info(f"Units: {len(units)} | Repeat: {repeat} | Legacy JSON export in store run: {with_json}")
+    logger.info(f"{'='*60}")
+    logger.info(f"write  legacy: {legacy_write_t * 1000:.1f} ms | store: {store_write_t * 1000:.1f} ms "
+                f"({legacy_write_t / store_write_t:.2f}x)")
+    logger.info(f"read   legacy: {legacy_read_t * 1000:.1f} ms | store: {store_read_t * 1000:.1f} ms "
+                f"({legacy_read_t / store_read_t:.2f}x)")
+    logger.info(f"memory legacy: {legacy_mem / 1024:.0f} KiB | store: {store_mem / 1024:.0f} KiB "
+                f"(column arrays {store.nbytes / 1024:.0f} KiB)")
+    logger.info(f"disk   legacy: {legacy_disk / 1024:.0f} KiB | store: {store_disk / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark unit metadata persistence")
+    parser.add_argument("units", nargs="?", default=DEFAULT_UNITS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--with-json", action="store_true",
+                        help="Include the legacy units_metadata.json export in the store run")
+    args = parser.parse_args()
+
+    run(args.units, args.repeat, args.with_json)
+
+
+if __name__ == "__main__":
+    main()
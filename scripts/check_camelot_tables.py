@@ -0,0 +1,74 @@
+"""
+Regression check: the Camelot engine returns tables.
+
+Runs only the Camelot table engine (through PDFExtractorV2._extract_tables,
+as the page pipeline does) on a page with a ruled table and fails unless it
+returns the expected number of tables, each with provenance 'camelot' and a
+bbox inside the page. The default page is page 19 of "Product Focus Q1 2025"
+(38559d71...): one bordered "Karakteristik Utama" table.
+
+Exits 2 when Camelot is not installed.
+
+Usage:
+    python scripts/check_camelot_tables.py [path/to/file.pdf] [--page 19] [--expect 1]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import fitz
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.extractor import PDFExtractorV2, camelot_available
+
+DEFAULT_PDF = "artefacts/38559d71-c40a-4f83-9dd1-4bdb16653491/source.pdf"
+DEFAULT_PAGE = 19
+
+
+def run(pdf_path: str, page_num: int, expected: int) -> int:
+    if not camelot_available():
+        logger.error("Camelot is not installed; nothing to check")
+        return 2
+
+    extractor = PDFExtractorV2(table_engines=['camelot'])
+    doc = fitz.open(pdf_path)
+    try:
+        page = doc[page_num - 1]
+        width, height = page.rect.width, page.rect.height
+        results = extractor._extract_tables(page, page_num, "check")
+    finally:
+        extractor._close_table_session()
+        doc.close()
+
+    failures = []
+    if len(results) != expected:
+        failures.append(f"expected {expected} Camelot table(s), got {len(results)}")
+    for schema, unit in results:
+        x0, y0, x1, y1 = schema.bbox
+        logger.info(f"{schema.table_id}: bbox=({x0:.0f}, {y0:.0f}, {x1:.0f}, {y1:.0f}), "
+                    f"{len(schema.rows)} rows, provenance={schema.provenance}")
+        if schema.provenance != 'camelot' or unit.source != 'camelot':
+            failures.append(f"{schema.table_id}: provenance {schema.provenance}")
+        if not (0 <= x0 < x1 <= width + 1 and 0 <= y0 < y1 <= height + 1):
+            failures.append(f"{schema.table_id}: bbox outside the page")
+
+    for failure in failures:
+        logger.error(failure)
+    logger.info("OK" if not failures else "FAIL")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the Camelot engine returns tables")
+    parser.add_argument("pdf", nargs="?", default=DEFAULT_PDF)
+    parser.add_argument("--page", type=int, default=DEFAULT_PAGE, help="1-based page with a ruled table")
+    parser.add_argument("--expect", type=int, default=1, help="Number of tables Camelot should return")
+    args = parser.parse_args()
+    sys.exit(run(args.pdf, args.page, args.expect))
+
+
+if __name__ == "__main__":
+    main()
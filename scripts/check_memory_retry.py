@@ -0,0 +1,100 @@
+"""
+Regression check: a document that hits the extraction memory cap is retried.
+
+Copies one document's source.pdf into a temp artefacts directory and runs the
+orchestrator's extraction stage in the warm extraction pool with
+enforce_memory_limit on and a tiny memory_limit_per_file_mb. The first attempt
+must fail with ExtractionMemoryLimitExceeded (i.e. no table/OCR handler in the
+extractor swallowed the MemoryError) and a second, low-memory attempt must
+follow. The retry's own outcome is reported but not checked (the default
+document fits the low-memory profile at 16 MB; smaller caps fail it too).
+
+Usage:
+    python scripts/check_memory_retry.py [artefacts_dir] [--doc DOC_ID] [--limit-mb 16]
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.extraction_pool import ExtractionMemoryLimitExceeded
+from src.orchestration.document_orchestrator import DocumentOrchestrator
+
+DEFAULT_ARTEFACTS = "artefacts"
+# Small two-table document (about 90 KB)
+DEFAULT_DOC = "680bb219-592a-4351-bb23-626180e2f85d"
+
+
+async def run_extraction(orchestrator: DocumentOrchestrator):
+    """Run the extraction stage, recording the outcome of every attempt"""
+    attempts = []
+    run_attempt = orchestrator._run_extraction
+
+    async def recorded(extract, *args):
+        try:
+            result = await run_attempt(extract, *args)
+        except BaseException as e:
+            attempts.append((extract.keywords.get("extraction_profile"), type(e).__name__))
+            raise
+        attempts.append((extract.keywords.get("extraction_profile"), "ok"))
+        return result
+
+    orchestrator._run_extraction = recorded
+    try:
+        await orchestrator.run_extraction_stage()
+    except Exception as e:
+        logger.info(f"Extraction stage failed after {len(attempts)} attempt(s): {type(e).__name__}: {e}")
+    return attempts
+
+
+def run(artefacts_dir: str, doc_id: str, limit_mb: int) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        doc_dir = Path(tmp) / doc_id
+        doc_dir.mkdir()
+        for name in ("source.pdf", "document_meta.json"):
+            if (Path(artefacts_dir) / doc_id / name).exists():
+                shutil.copy(Path(artefacts_dir) / doc_id / name, doc_dir / name)
+
+        orchestrator = DocumentOrchestrator(doc_id=doc_id, artefacts_dir=tmp)
+        perf_config = orchestrator.global_config.performance.multi_file_processing
+        perf_config.extraction_process_pool = True
+        perf_config.enforce_memory_limit = True
+        perf_config.memory_limit_per_file_mb = limit_mb
+
+        attempts = asyncio.run(run_extraction(orchestrator))
+
+    for number, (profile, outcome) in enumerate(attempts, 1):
+        logger.info(f"attempt {number}: profile={profile} -> {outcome}")
+
+    failures = []
+    if not attempts or attempts[0][1] != ExtractionMemoryLimitExceeded.__name__:
+        failures.append(f"first attempt did not hit the {limit_mb}MB limit")
+    if len(attempts) < 2:
+        failures.append("no low-memory retry")
+    elif attempts[1][0] != perf_config.low_memory_extraction_profile:
+        failures.append(f"retry used profile {attempts[1][0]}")
+
+    for failure in failures:
+        logger.error(failure)
+    logger.info("OK" if not failures else "FAIL")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that a document over the memory cap is retried")
+    parser.add_argument("artefacts", nargs="?", default=DEFAULT_ARTEFACTS)
+    parser.add_argument("--doc", default=DEFAULT_DOC, help="Document ID to extract")
+    parser.add_argument("--limit-mb", type=int, default=16, help="Memory cap for the run, in MB")
+    args = parser.parse_args()
+    sys.exit(run(args.artefacts, args.doc, args.limit_mb))
+
+
+if __name__ == "__main__":
+    main()
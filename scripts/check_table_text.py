@@ -0,0 +1,108 @@
+"""
+Regression check: table rows must not be repeated as paragraph text.
+
+Re-extracts each document into a temp directory with the current code and,
+for every table row with at least --min-cells non-empty cells, fails if a
+paragraph unit on the same page contains the row's text (whitespace is
+ignored on both sides, so "TolokUkur" in a cell matches "Tolok Ukur" in a
+text line).
+
+By default only the known table document is checked: the fund fact sheets of
+"Product Focus Q1 2025" (38559d71...), where each "Kinerja" table used to be
+followed by its "Tolok Ukur ..." row as plain text.
+
+Usage:
+    python scripts/check_table_text.py [artefacts_dir] [--doc DOC_ID ...] [--all] [--min-cells 3]
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.extractor import extract_pdf_to_markdown
+from src.shared.unit_store import UNIT_STORE_FILENAME, UnitStore
+
+DEFAULT_ARTEFACTS = "artefacts"
+KNOWN_TABLE_DOCS = ["38559d71-c40a-4f83-9dd1-4bdb16653491"]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def squash(text: str) -> str:
+    return _WHITESPACE.sub("", text or "")
+
+
+def repeated_rows(doc_dir: Path, min_cells: int):
+    """(page, row text, paragraph excerpt) for every table row repeated in a paragraph of its page"""
+    tables_path = doc_dir / "tables.json"
+    if not tables_path.exists():
+        return []
+    tables = json.loads(tables_path.read_text(encoding="utf-8"))
+    paragraphs = {}
+    for record in UnitStore.load(doc_dir / UNIT_STORE_FILENAME):
+        if record["unit_type"] == "paragraph" and record["content"]:
+            paragraphs.setdefault(record["page"], []).append(record["content"])
+
+    found = []
+    for table in tables:
+        page_texts = [(squash(text), text) for text in paragraphs.get(table["page"], [])]
+        for row in table["rows"]:
+            cells = [str(cell) for cell in row if cell not in (None, "", "nan")]
+            if len(cells) < min_cells:
+                continue
+            needle = squash("".join(cells))
+            for squashed, text in page_texts:
+                if needle in squashed:
+                    found.append((table["page"], " | ".join(cells), text[:80]))
+                    break
+    return found
+
+
+def run(artefacts_dir: str, doc_ids, min_cells: int) -> int:
+    # Extraction logs per page; keep the report readable
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", format="{message}")
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for doc_id in doc_ids:
+            doc_dir = Path(artefacts_dir) / doc_id
+            meta_path = doc_dir / "document_meta.json"
+            original = json.loads(meta_path.read_text(encoding="utf-8")).get("original_pdf_filename") \
+                if meta_path.exists() else None
+            extract_pdf_to_markdown(doc_id, str(doc_dir / "source.pdf"), tmp, original_filename=original)
+
+            found = repeated_rows(Path(tmp) / doc_id, min_cells)
+            failures += len(found)
+            status = "OK" if not found else f"FAIL ({len(found)} repeated rows)"
+            logger.info(f"{doc_id[:8]}... {status}")
+            for page, row, text in found:
+                logger.info(f"    p{page}: {row}\n        in paragraph: {text}")
+
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that table rows are not repeated as paragraph text")
+    parser.add_argument("artefacts", nargs="?", default=DEFAULT_ARTEFACTS)
+    parser.add_argument("--doc", action="append", help="Document ID to check (repeatable)")
+    parser.add_argument("--all", action="store_true", help="Check every document with a source.pdf")
+    parser.add_argument("--min-cells", type=int, default=3, help="Ignore table rows with fewer non-empty cells")
+    args = parser.parse_args()
+
+    if args.all:
+        doc_ids = sorted(d.name for d in Path(args.artefacts).iterdir() if (d / "source.pdf").exists())
+    else:
+        doc_ids = args.doc or KNOWN_TABLE_DOCS
+    sys.exit(run(args.artefacts, doc_ids, args.min_cells))
+
+
+if __name__ == "__main__":
+    main()
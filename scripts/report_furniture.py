@@ -0,0 +1,94 @@
+"""
+Dry-run report of cross-page furniture removal on existing artefacts.
+
+For every artefacts/<doc_id>/ with a source.pdf and extracted units, shows
+what the document-level pass would do:
+    images - image occurrences repeated across pages (skipped before OCR)
+    units  - repeated header/footer/disclaimer units dropped, with the
+             characters and tokens they no longer cost downstream
+
+Usage:
+    python scripts/report_furniture.py [artefacts_dir] [--min-pages 3]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import fitz
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.extraction.furniture import DEFAULT_MIN_PAGES, find_repeated_images, remove_repeated_units
+from src.shared.unit_store import UNIT_STORE_FILENAME, UnitStore
+
+DEFAULT_ARTEFACTS = "artefacts"
+
+
+class _UnitView:
+    """Attribute access over a unit record, as the pass reads extraction Units"""
+
+    __slots__ = ('page', 'bbox', 'unit_type', 'content')
+
+    def __init__(self, record):
+        self.page = record['page']
+        self.bbox = record['bbox']
+        self.unit_type = record['unit_type']
+        self.content = record['content']
+
+
+def load_units(doc_dir: Path):
+    store_path = doc_dir / UNIT_STORE_FILENAME
+    if store_path.exists():
+        return [_UnitView(record) for record in UnitStore.load(store_path)]
+    json_path = doc_dir / "units_metadata.json"
+    if json_path.exists():
+        return [_UnitView(record) for record in json.loads(json_path.read_text(encoding='utf-8'))]
+    return None
+
+
+def run(artefacts_dir: str, min_pages: int):
+    totals = {'units': 0, 'removed': 0, 'chars': 0, 'tokens': 0, 'images': 0}
+    for doc_dir in sorted(Path(artefacts_dir).iterdir()):
+        pdf_path = doc_dir / "source.pdf"
+        units = load_units(doc_dir) if pdf_path.exists() else None
+        if units is None:
+            continue
+
+        with fitz.open(pdf_path) as doc:
+            repeated_images = find_repeated_images(doc, min_pages)
+            page_heights = {i + 1: doc[i].rect.height for i in range(len(doc))}
+        _, report = remove_repeated_units(units, page_heights, min_pages)
+        images = sum(map(len, repeated_images.values()))
+
+        logger.info(f"{doc_dir.name[:8]}: {len(units)} units | images skipped: {images} | "
+                    f"units removed: {report.units_removed} | chars: {report.chars_removed} | "
+                    f"tokens: {report.tokens_removed}")
+        for group in report.groups:
+            logger.info(f"    pages {group['pages']}: '{group['text']}' (-{group['removed']})")
+
+        totals['units'] += len(units)
+        totals['removed'] += report.units_removed
+        totals['chars'] += report.chars_removed
+        totals['tokens'] += report.tokens_removed
+        totals['images'] += images
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Min pages: {min_pages}")
+    logger.info(f"Units: {totals['units']} | removed: {totals['removed']} | images skipped: {totals['images']}")
+    logger.info(f"Removed: {totals['chars']:,} chars, {totals['tokens']:,} tokens")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report repeated page furniture in extracted artefacts")
+    parser.add_argument("artefacts", nargs="?", default=DEFAULT_ARTEFACTS)
+    parser.add_argument("--min-pages", type=int, default=DEFAULT_MIN_PAGES)
+    args = parser.parse_args()
+
+    run(args.artefacts, args.min_pages)
+
+
+if __name__ == "__main__":
+    main()
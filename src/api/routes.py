@@ -7,7 +7,8 @@ import hashlib
 import uuid
 from typing import Union, Optional, List
 from datetime import datetime
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Query
+from fastapi.responses import Response
 from pydantic import BaseModel
 from loguru import logger
 from langchain_pinecone import PineconeVectorStore
@@ -17,11 +18,11 @@ from ..core.config import (
     CHAT_MODEL,
     PINECONE_INDEX_NAME,
     PIPELINE_ARTEFACTS_DIR,
+    PAGE_PREVIEW_CACHE_DIR,
+    PAGE_PREVIEW_CACHE_MAX_MB,
 )
 from ..core.rate_limiter import AsyncLeakyBucket
-from ..extraction.extractor import extract_pdf_to_markdown
-from ..synthesis.synthesizer import synthesize_final_markdown
-from ..vectorization.vectorizer import vectorize_and_store
+from ..extraction.page_preview import PagePreviewCache, MIN_PREVIEW_DPI, MAX_PREVIEW_DPI
 from ..shared.document_meta import (
     get_markdown_path,
     get_markdown_relative_path,
@@ -46,6 +47,9 @@ progress_state = {}
 # Global rate limiter instance
 rate_limiter = AsyncLeakyBucket(rps=2.0)  # 2 requests per second
 
+# Page previews are rendered on demand from source.pdf and kept in an LRU disk cache
+page_preview_cache = PagePreviewCache(PAGE_PREVIEW_CACHE_DIR, PAGE_PREVIEW_CACHE_MAX_MB)
+
 router = APIRouter()
 
 
@@ -290,6 +294,8 @@ async def upload_document_auto(request: Request, file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Failed to save PDF: {e}")
     
     # Start automated pipeline in background
+    from ..orchestration.document_orchestrator import claim_document
+    claim_document(doc_id)
     asyncio.create_task(_run_automated_pipeline(doc_id, request))
     
     return {
@@ -356,6 +362,9 @@ async def upload_documents_batch(request: Request, files: List[UploadFile] = Fil
     logger.info(f"[BATCH] Starting parallel processing of {len(doc_ids)} documents")
     
     # Start multi-file processing in background
+    from ..orchestration.document_orchestrator import claim_document
+    for doc_id in doc_ids:
+        claim_document(doc_id)
     asyncio.create_task(_run_multi_file_pipeline(doc_ids, request))
     
     return {
@@ -394,6 +403,10 @@ async def _run_multi_file_pipeline(doc_ids: List[str], request: Request):
         
     except Exception as e:
         logger.error(f"[MULTI-FILE] Batch processing failed: {e}", exc_info=True)
+    finally:
+        from ..orchestration.document_orchestrator import release_document
+        for doc_id in doc_ids:
+            release_document(doc_id)
 
 
 async def _run_automated_pipeline(doc_id: str, request: Request):
@@ -446,6 +459,63 @@ async def _run_automated_pipeline(doc_id: str, request: Request):
                 json.dump(error_state, f, indent=2, ensure_ascii=False)
         except Exception as save_error:
             logger.error(f"Failed to save error state: {save_error}")
+    finally:
+        from ..orchestration.document_orchestrator import release_document
+        release_document(doc_id)
+
+
+@router.post("/documents/{document_id}/resume")
+async def resume_document(document_id: str):
+    """
+    Resume the automated pipeline of a document from its last completed stage
+    
+    Stages whose artefacts still match their recorded checksums are skipped.
+    Only interrupted pipelines can be resumed: 409 if the document is ready,
+    failed, not started, or its pipeline is running.
+    
+    Returns:
+        document_id and status URL for monitoring progress
+    """
+    from ..orchestration.document_orchestrator import ProcessingState, claim_document, is_document_running
+    
+    doc_dir = Path(PIPELINE_ARTEFACTS_DIR) / document_id
+    if not (doc_dir / "source.pdf").exists():
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    if is_document_running(document_id):
+        raise HTTPException(status_code=409, detail="Pipeline is already running")
+    state = ProcessingState.load(document_id, Path(PIPELINE_ARTEFACTS_DIR))
+    if not state.is_interrupted():
+        raise HTTPException(
+            status_code=409,
+            detail=f"Pipeline is not interrupted (current stage: {state.current_stage})"
+        )
+    
+    claim_document(document_id)
+    asyncio.create_task(_resume_automated_pipeline(document_id))
+    
+    return {
+        "status": "resuming",
+        "message": "Pipeline resumed from the last completed stage",
+        "document_id": document_id,
+        "status_url": f"/documents/{document_id}/status"
+    }
+
+
+async def _resume_automated_pipeline(doc_id: str):
+    """Background task for a resumed pipeline (errors are recorded in processing_state.json)"""
+    try:
+        from ..orchestration.document_orchestrator import resume_document
+        
+        # Keeps the namespace the document was started with
+        result = await resume_document(doc_id, str(PIPELINE_ARTEFACTS_DIR))
+        logger.info(f"[RESUME] Pipeline completed for {doc_id} ({result.get('current_stage')})")
+        
+    except Exception as e:
+        logger.error(f"[RESUME] Pipeline failed for {doc_id}: {e}", exc_info=True)
+    finally:
+        from ..orchestration.document_orchestrator import release_document
+        release_document(doc_id)
 
 
 @router.get("/documents/{document_id}/status")
@@ -544,5 +614,41 @@ async def get_document_result(document_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/documents/{document_id}/pages/{page_number}/preview")
+async def get_page_preview(
+    document_id: str,
+    page_number: int,
+    dpi: int = Query(150, ge=MIN_PREVIEW_DPI, le=MAX_PREVIEW_DPI),
+):
+    """
+    Render a page preview (PNG) on demand
+    
+    Pages are rasterized from source.pdf only when requested and cached on disk,
+    so extraction no longer renders every page up front.
+    """
+    try:
+        doc_dir = Path(PIPELINE_ARTEFACTS_DIR) / document_id
+        pdf_path = doc_dir / "source.pdf"
+        if not pdf_path.exists():
+            raise HTTPException(status_code=404, detail="Document not found")
+        
+        png_bytes = await asyncio.to_thread(
+            page_preview_cache.get_preview, document_id, pdf_path, page_number, dpi
+        )
+        return Response(
+            content=png_bytes,
+            media_type="image/png",
+            headers={"Cache-Control": "private, max-age=3600"}
+        )
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to render preview for {document_id} page {page_number}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ===============================================
 # OLD CONVERSION FUNCTIONS REMOVED - No longer needed with single-step direct enhancement
\ No newline at end of file
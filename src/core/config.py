@@ -9,29 +9,38 @@ Architecture:
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict
 from dotenv import load_dotenv
 
 # Load environment variables (API keys only)
 load_dotenv()
 
+GLOBAL_CONFIG_PATH = Path(__file__).parent / "enhancement_profiles" / "global_config.json"
 
-def _load_global_config():
-    """Load global configuration from JSON file."""
-    config_path = Path(__file__).parent / "enhancement_profiles" / "global_config.json"
-    
-    if not config_path.exists():
+
+@lru_cache(maxsize=1)
+def load_global_config() -> Dict[str, Any]:
+    """
+    Load global configuration from JSON file.
+
+    The file is parsed once per process; every caller (this module, the
+    enhancement config, ProfileLoader) shares the same snapshot, so treat
+    it as read-only. ``load_global_config.cache_clear()`` forces a re-read.
+    """
+    if not GLOBAL_CONFIG_PATH.exists():
         raise FileNotFoundError(
-            f"❌ global_config.json not found at: {config_path}\n"
+            f"❌ global_config.json not found at: {GLOBAL_CONFIG_PATH}\n"
             f"This file is REQUIRED for application startup."
         )
     
-    with open(config_path, 'r', encoding='utf-8') as f:
+    with open(GLOBAL_CONFIG_PATH, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 # Load global config (single source of truth for business logic)
-_global_config = _load_global_config()
+_global_config = load_global_config()
 
 # ============================================
 # SECRETS (from .env file)
@@ -58,6 +67,8 @@ PINECONE_INDEX_NAME = _global_config["vectorstore"]["pinecone_index"]
 # PATHS (can override via .env)
 # ============================================
 PIPELINE_ARTEFACTS_DIR = os.getenv("PIPELINE_ARTEFACTS_DIR", "artefacts")
+PAGE_PREVIEW_CACHE_DIR = os.getenv("PAGE_PREVIEW_CACHE_DIR", os.path.join("cache", "previews"))
+PAGE_PREVIEW_CACHE_MAX_MB = float(os.getenv("PAGE_PREVIEW_CACHE_MAX_MB", "200"))
 
 
 def get_embedding_dimension(model_name: str) -> int:
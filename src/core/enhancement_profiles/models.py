@@ -21,6 +21,10 @@ class ClientProfile(BaseModel):
     client_id: str = Field(..., description="Unique identifier for this client")
     description: str = Field(..., description="Description of this client profile")
     version: str = Field(default="1", description="Profile version")
+    extraction_profile: Optional[str] = Field(
+        default=None,
+        description="Extraction speed profile for this client (e.g. 'fast'); falls back to the global default_profile"
+    )
     
     enhancement_types: Dict[str, Any] = Field(
         ...,
@@ -133,6 +137,98 @@ class OCRConfig(BaseModel):
     dpi: int = Field(description="DPI for OCR processing", gt=0)
     primary_psm: int = Field(default=3, description="Primary PSM mode for Tesseract")
     fallback_psm: List[int] = Field(default=[6, 11], description="Fallback PSM modes")
+    cache_enabled: bool = Field(default=True, description="Persist OCR results on disk keyed by image digest, language, PSM and DPI")
+    cache_max_mb: int = Field(default=256, description="Size budget of the OCR cache before LRU eviction", gt=0)
+    pool_workers: int = Field(default=2, description="Long-lived OCR worker processes that keep language models loaded (0 = OCR in the extracting process). Needs tesserocr; without it the pool is off, since each pytesseract call starts its own tesseract process", ge=0)
+
+
+TABLE_ENGINES = {'pdfplumber', 'pymupdf', 'camelot'}
+
+
+class ExtractionProfile(BaseModel):
+    """
+    Named extraction speed profile (fast / balanced / accurate)
+    
+    OCR fields left unset fall back to the global `ocr` section.
+    """
+    description: str = Field(default="", description="What this profile is meant for")
+    ocr_dpi: Optional[int] = Field(default=None, description="Raster DPI for OCR (default: ocr.dpi)", gt=0)
+    adaptive_ocr_dpi: bool = Field(default=True, description="Pick OCR DPI per page/image block from the measured x-height (ocr_dpi is the fallback)")
+    ocr_min_dpi: int = Field(default=150, description="Lower bound for adaptive OCR DPI", gt=0)
+    ocr_max_dpi: int = Field(default=400, description="Upper bound for adaptive OCR DPI", gt=0)
+    primary_psm: Optional[int] = Field(default=None, description="First PSM for page-level OCR (default: ocr.primary_psm)")
+    fallback_psm: Optional[List[int]] = Field(default=None, description="PSMs tried in order when the primary returns nothing (default: ocr.fallback_psm)")
+    image_psm_ladder: List[int] = Field(default=[7, 6, 11, 13], description="PSMs tried on image-block crops (likeliest first, highest confidence wins)")
+    ocr_text_regions: bool = Field(default=True, description="Scanned pages: OCR only detected text regions instead of the whole page bitmap")
+    composite_image_ocr: bool = Field(default=False, description="OCR a page's small image crops together in one composite canvas pass")
+    image_ocr_min_confidence: float = Field(default=70.0, description="Mean word confidence at which the first crop PSM is accepted without trying the rest", ge=0, le=100)
+    render_debug_pages: bool = Field(default=False, description="Debug: write pages/page-N.png for every page (previews are otherwise rendered on demand)")
+    table_engines: Optional[List[str]] = Field(default=None, description="Table engines in order, first with results wins (default: [table_engine, 'camelot'])")
+    max_ocr_crops_per_page: int = Field(default=12, description="Maximum image blocks OCR'd per page", ge=0)
+    
+    @validator('ocr_max_dpi')
+    def validate_dpi_bounds(cls, v, values):
+        if 'ocr_min_dpi' in values and v < values['ocr_min_dpi']:
+            raise ValueError(f"ocr_max_dpi ({v}) must be >= ocr_min_dpi ({values['ocr_min_dpi']})")
+        return v
+    
+    @validator('table_engines')
+    def validate_table_engines(cls, v):
+        if v is not None:
+            unknown = [engine for engine in v if engine not in TABLE_ENGINES]
+            if unknown:
+                raise ValueError(f"Unknown table engine(s) {unknown}, expected any of {sorted(TABLE_ENGINES)}")
+        return v
+
+
+class ExtractionConfig(BaseModel):
+    """PDF extraction configuration section"""
+    table_engine: str = Field(default="pdfplumber", description="Table finder: 'pdfplumber' (default) or 'pymupdf' (native fast path)")
+    default_profile: str = Field(default="balanced", description="Profile used when neither namespace nor client profile picks one")
+    profiles: Dict[str, ExtractionProfile] = Field(
+        default_factory=lambda: {"balanced": ExtractionProfile(description="OCR settings from the ocr section")},
+        description="Named extraction profiles"
+    )
+
+    @validator('table_engine')
+    def validate_table_engine(cls, v):
+        if v not in {'pdfplumber', 'pymupdf'}:
+            raise ValueError(f"table_engine must be 'pdfplumber' or 'pymupdf', got '{v}'")
+        return v
+    
+    def resolve(self, profile_name: Optional[str], ocr: OCRConfig) -> Dict[str, Any]:
+        """
+        Build extract_pdf_to_markdown keyword arguments for a profile
+        
+        Args:
+            profile_name: Requested profile (None or unknown → default_profile)
+            ocr: Global OCR section supplying defaults for unset profile fields
+            
+        Returns:
+            Dict of extractor keyword arguments, including the resolved profile name
+        """
+        name = profile_name or self.default_profile
+        if name not in self.profiles:
+            name = self.default_profile
+        profile = self.profiles.get(name) or ExtractionProfile()
+        
+        return {
+            'extraction_profile': name,
+            'ocr_lang': ocr.language,
+            'ocr_dpi': profile.ocr_dpi or ocr.dpi,
+            'adaptive_ocr_dpi': profile.adaptive_ocr_dpi,
+            'ocr_min_dpi': profile.ocr_min_dpi,
+            'ocr_max_dpi': profile.ocr_max_dpi,
+            'ocr_primary_psm': profile.primary_psm if profile.primary_psm is not None else ocr.primary_psm,
+            'ocr_fallback_psm': list(profile.fallback_psm if profile.fallback_psm is not None else ocr.fallback_psm),
+            'image_psm_ladder': list(profile.image_psm_ladder),
+            'image_ocr_min_confidence': profile.image_ocr_min_confidence,
+            'composite_image_ocr': profile.composite_image_ocr,
+            'ocr_text_regions': profile.ocr_text_regions,
+            'render_debug_pages': profile.render_debug_pages,
+            'table_engines': list(profile.table_engines or [self.table_engine, 'camelot']),
+            'max_ocr_crops_per_page': profile.max_ocr_crops_per_page,
+        }
 
 
 class EnhancementGlobalConfig(BaseModel):
@@ -158,7 +254,15 @@ class MultiFileProcessingConfig(BaseModel):
     max_cpu_cores_dedicated: int = Field(default=4, description="Max CPU cores dedicated to processing", ge=1)
     enable_cpu_monitoring: bool = Field(default=True, description="Monitor CPU usage and fallback if needed")
     cpu_threshold_fallback_percent: int = Field(default=85, description="CPU % threshold to fallback to sequential", ge=1, le=100)
-    memory_limit_per_file_mb: int = Field(default=1024, description="Memory limit per file in MB", gt=0)
+    memory_limit_per_file_mb: int = Field(default=1024, description="Memory a document's extraction may add to its worker process, in MB (address-space cap)", gt=0)
+    enforce_memory_limit: bool = Field(default=False, description="Opt-in: cap extraction workers at memory_limit_per_file_mb and retry documents that hit it with low_memory_extraction_profile. Trade-off: the cap and peak RSS cover one process, so capped documents run without page-parallel extraction or the OCR pool (slower, but bounded memory)")
+    low_memory_extraction_profile: str = Field(default="low_memory", description="Extraction profile for the retry after a document hits the memory limit (pages are processed one at a time)")
+    enable_page_parallel_extraction: bool = Field(default=True, description="Extract pages of a document in parallel worker processes (bounded by max_cpu_cores_dedicated)")
+    stage_scheduling: bool = Field(default=True, description="Admit documents per stage (extraction in a CPU process pool, enhancement and vectorization as async I/O) instead of one slot per whole pipeline")
+    max_concurrent_enhancements: int = Field(default=2, description="Max documents in the enhancement stage (LLM calls) at once", ge=1)
+    max_concurrent_vectorizations: int = Field(default=2, description="Max documents in the vectorization stage (embedding + upsert) at once", ge=1)
+    extraction_process_pool: bool = Field(default=True, description="Run document extraction in warm worker processes (max_cpu_cores_dedicated) instead of a thread of the API process")
+    extraction_worker_max_documents: int = Field(default=10, description="Documents an extraction worker process handles before it is replaced", ge=1)
 
 
 class ProgressTrackingConfig(BaseModel):
@@ -175,6 +279,7 @@ class PipelineOptimizationConfig(BaseModel):
     enable_enhancement_vectorization_overlap: bool = Field(default=True, description="Enable overlap between enhancement and vectorization")
     vectorization_batch_queue_size: int = Field(default=3, description="Queue size for vectorization batches", ge=1)
     enable_parallel_vectorization: bool = Field(default=True, description="Enable parallel vectorization within batches")
+    auto_resume_on_startup: bool = Field(default=True, description="On startup, resume documents whose pipeline was interrupted (crash, redeploy) from their last verified stage")
 
 
 class PerformanceConfig(BaseModel):
@@ -199,6 +304,7 @@ class GlobalConfig(BaseModel):
     embedding: EmbeddingConfig = Field(description="Embedding configuration")
     vectorstore: VectorStoreConfig = Field(description="Vector store configuration")
     ocr: OCRConfig = Field(description="OCR configuration")
+    extraction: ExtractionConfig = Field(default_factory=ExtractionConfig, description="PDF extraction configuration")
     enhancement: EnhancementGlobalConfig = Field(description="Enhancement configuration")
     synthesis: SynthesisConfig = Field(description="Synthesis configuration")
     performance: PerformanceConfig = Field(description="Performance optimization configuration")
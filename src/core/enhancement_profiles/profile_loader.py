@@ -12,6 +12,7 @@ from datetime import datetime
 from loguru import logger
 
 from .models import ClientProfile, GlobalConfig, ActiveConfig
+from ..config import load_global_config as load_global_config_snapshot
 
 
 class ProfileLoader:
@@ -24,6 +25,9 @@ class ProfileLoader:
     - Get active namespace
     - Set active namespace (for admin use)
     """
+
+    # Validated global config shared by every loader in the process
+    _shared_global_config: Optional[GlobalConfig] = None
     
     def __init__(self):
         """Initialize profile loader with default paths"""
@@ -55,6 +59,9 @@ class ProfileLoader:
         # Return cached if available and not forcing reload
         if self._global_config and not force_reload:
             return self._global_config
+        if ProfileLoader._shared_global_config and not force_reload:
+            self._global_config = ProfileLoader._shared_global_config
+            return self._global_config
         
         if not self.global_config_path.exists():
             raise FileNotFoundError(
@@ -63,14 +70,15 @@ class ProfileLoader:
             )
         
         try:
-            with open(self.global_config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if force_reload:
+                load_global_config_snapshot.cache_clear()
+            data = load_global_config_snapshot()
             
             # Validate and parse with Pydantic
             global_config = GlobalConfig(**data)
             
             # Cache it
-            self._global_config = global_config
+            self._global_config = ProfileLoader._shared_global_config = global_config
             
             logger.info(f"Global config loaded: {global_config.config_name} v{global_config.config_version}")
             logger.debug(f"  LLM Model: {global_config.llm.model}")
@@ -289,6 +297,44 @@ class ProfileLoader:
             logger.error(f"Failed to import namespaces_config: {e}")
             raise
     
+    def get_extraction_profile_for_namespace(self, namespace_id: str) -> str:
+        """
+        Get the extraction speed profile name for a namespace
+        
+        Resolution order:
+        1. 'extraction_profile' field of the namespace in namespaces_config.py
+        2. 'extraction_profile' field of the namespace's client profile
+        3. extraction.default_profile from global_config.json
+        
+        Args:
+            namespace_id: Namespace ID (e.g., 'danamon-final-3')
+            
+        Returns:
+            Name of a profile defined in global_config.json
+        """
+        extraction_config = self.load_global_config().extraction
+        profile_name = None
+        
+        try:
+            from ..namespaces_config import get_namespace_by_id
+            
+            ns_config = get_namespace_by_id(namespace_id) or {}
+            profile_name = ns_config.get("extraction_profile")
+            
+            if not profile_name and ns_config.get("client_profile"):
+                profile_name = self.load_client_profile(ns_config["client_profile"]).extraction_profile
+        except Exception as e:
+            logger.warning(f"Could not resolve extraction profile for namespace '{namespace_id}': {e}")
+        
+        if profile_name and profile_name not in extraction_config.profiles:
+            logger.warning(
+                f"Extraction profile '{profile_name}' not defined in global_config.json, "
+                f"using '{extraction_config.default_profile}'"
+            )
+            profile_name = None
+        
+        return profile_name or extraction_config.default_profile
+    
     def list_available_profiles(self) -> list[str]:
         """
         List all available client profile IDs
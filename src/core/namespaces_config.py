@@ -17,6 +17,7 @@ NAMESPACE STRUCTURE:
     "client": str | None   # Client identifier (None for shared namespaces)
     "type": str            # "testing" or "final" - determines behavior
     "is_active": bool      # Enable/disable without deleting config
+    "extraction_profile": str  # Optional: "fast" | "balanced" | "accurate" (overrides client profile)
 }
 
 FIELD EXPLANATIONS:
@@ -383,6 +384,8 @@ def get_namespace_statistics() -> Dict[str, any]:
 # INITIALIZATION
 # ============================================================================
 
-logger.info(f"Namespace configuration loaded: {len(NAMESPACES)} namespaces defined")
-logger.debug(f"Active namespaces: {len(get_active_namespaces())}")
-logger.debug(f"Production namespaces: {len(get_production_namespaces())}")
+def log_namespace_summary() -> None:
+    """Log the namespace configuration (called once at application startup, not at import)"""
+    logger.info(f"Namespace configuration loaded: {len(NAMESPACES)} namespaces defined")
+    logger.debug(f"Active namespaces: {len(get_active_namespaces())}")
+    logger.debug(f"Production namespaces: {len(get_production_namespaces())}")
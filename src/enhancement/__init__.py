@@ -5,12 +5,22 @@ Professional document enhancement with AI-powered implicit information extractio
 Single-step enhancement with comprehensive prompt engineering.
 """
 
-from .config import EnhancementConfig
-from .enhancer import DirectEnhancerV2
-from .models import UniversalEnhancement
-
 __all__ = [
     'EnhancementConfig',
     'DirectEnhancerV2',
     'UniversalEnhancement'
 ]
+
+# Exported names are imported on first access (the enhancer pulls in openai and tiktoken)
+_EXPORTS = {
+    'EnhancementConfig': '.config',
+    'DirectEnhancerV2': '.enhancer',
+    'UniversalEnhancement': '.models',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
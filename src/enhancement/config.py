@@ -8,27 +8,10 @@ from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional, List, Dict, Any
 import os
-from pathlib import Path
-import json
-from dotenv import load_dotenv
 
-load_dotenv()
-
-
-def load_global_config() -> Dict[str, Any]:
-    """
-    Load global configuration from JSON file.
-    
-    Returns:
-        Dict containing global configuration
-    """
-    config_path = Path(__file__).parent.parent / "core" / "enhancement_profiles" / "global_config.json"
-    
-    if not config_path.exists():
-        raise FileNotFoundError(f"Global config not found: {config_path}")
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+# Shared snapshot of global_config.json (parsed once per process); importing
+# core.config also loads .env
+from ..core.config import load_global_config
 
 
 class EnhancementConfig(BaseSettings):
@@ -32,6 +32,8 @@ from ..prompts.enhancement import (
     DIRECT_ENHANCEMENT_USER_PROMPT
 )
 from ..core.rate_limiter import AsyncLeakyBucket
+from ..shared.unit_store import UnitStore
+from ..shared.patterns import NumericPatterns
 
 
 # Pydantic models for Structured Outputs (OpenAI guaranteed JSON)
@@ -62,7 +64,7 @@ class EnhancementWindow:
     content: str
     units: List[Dict[str, Any]]
     tables: List[Dict[str, Any]]
-    numerical_patterns: List[Dict[str, Any]]
+    numerical_patterns: NumericPatterns
     token_count: int
     metadata: Dict[str, Any]
     
@@ -139,56 +141,9 @@ class WindowAnalyzer:
         return None
     
     @staticmethod
-    def extract_numerical_patterns(content: str) -> List[Dict[str, Any]]:
-        """Extract numerical patterns for formula discovery"""
-        patterns = []
-        
-        # Currency patterns (IDR, USD, etc)
-        currency_patterns = [
-            (r'(?:Rp|IDR)\s?([\d,.]+)(?:\s*(?:ribu|juta|miliar|triliun))?', 'idr'),
-            (r'(?:USD|\$)\s?([\d,.]+)(?:\s*(?:thousand|million|billion))?', 'usd'),
-        ]
-        
-        for pattern, currency_type in currency_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                patterns.append({
-                    'type': 'currency',
-                    'currency': currency_type,
-                    'value': match.group(0),
-                    'position': match.span()
-                })
-        
-        # Percentages
-        for match in re.finditer(r'(\d+(?:[.,]\d+)?)\s*%', content):
-            patterns.append({
-                'type': 'percentage',
-                'value': match.group(0),
-                'position': match.span()
-            })
-        
-        # Dates and periods
-        for match in re.finditer(r'(\d+)\s*(tahun|bulan|hari|minggu|kuartal|semester)', content, re.IGNORECASE):
-            patterns.append({
-                'type': 'period',
-                'value': match.group(0),
-                'position': match.span()
-            })
-        
-        # General numbers with context
-        for match in re.finditer(r'\b(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d+)?)\b', content):
-            # Get surrounding context (20 chars before and after)
-            start = max(0, match.start() - 20)
-            end = min(len(content), match.end() + 20)
-            context = content[start:end]
-            
-            patterns.append({
-                'type': 'number',
-                'value': match.group(0),
-                'context': context,
-                'position': match.span()
-            })
-        
-        return patterns
+    def extract_numerical_patterns(content: str) -> NumericPatterns:
+        """Numerical patterns for formula discovery (counts per type plus sample values, scanned on first use)"""
+        return NumericPatterns(content)
 
 
 class DirectEnhancerV2:
@@ -380,7 +335,7 @@ class DirectEnhancerV2:
         """Extract units list from various metadata formats"""
         units_list = []
         
-        if isinstance(units_metadata, list):
+        if isinstance(units_metadata, (list, UnitStore)):
             units_list = units_metadata
         elif isinstance(units_metadata, dict):
             # Try different possible structures
@@ -397,6 +352,10 @@ class DirectEnhancerV2:
                     elif isinstance(value, list):
                         units_list.extend(value)
         
+        # Columnar store (units.npz): lazy record views, fields decoded on access
+        if isinstance(units_list, UnitStore):
+            units_list = units_list.records()
+        
         return units_list
     
     def _build_window(
@@ -657,24 +616,19 @@ class DirectEnhancerV2:
             tables_info=tables_info + content_hint
         )
     
-    def _summarize_numerical_patterns(self, patterns: List[Dict[str, Any]]) -> str:
+    def _summarize_numerical_patterns(self, patterns: NumericPatterns) -> str:
         """Summarize numerical patterns for context"""
         summary = []
         
         # Count by type
-        type_counts = {}
-        for pattern in patterns:
-            ptype = pattern['type']
-            type_counts[ptype] = type_counts.get(ptype, 0) + 1
-        
-        for ptype, count in type_counts.items():
+        for ptype, count in patterns.counts.items():
             summary.append(f"- {ptype}: {count} instances")
         
         # Show sample values
         if patterns:
             summary.append("\nSample values:")
-            for pattern in patterns[:5]:
-                summary.append(f"  - {pattern['value']} ({pattern['type']})")
+            for value, ptype in patterns.samples(5):
+                summary.append(f"  - {value} ({ptype})")
         
         return '\n'.join(summary)
     
@@ -5,6 +5,12 @@ Professional PDF extraction with table and text recognition.
 Generates structured markdown with metadata.
 """
 
-from .extractor import extract_pdf_to_markdown
-
 __all__ = ['extract_pdf_to_markdown']
+
+
+def __getattr__(name):
+    # Importing a submodule (furniture, table_format, ...) does not load the extractor stack
+    if name == 'extract_pdf_to_markdown':
+        from .extractor import extract_pdf_to_markdown
+        return extract_pdf_to_markdown
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,102 @@
+"""
+Composite-Batch OCR
+
+Packs a page's small image crops (banners, labels, badges) into one grayscale
+canvas, separated by white gutters, so a single Tesseract pass with word boxes
+replaces one pass per crop. Each recognized word is mapped back to the crop
+whose slot contains the word's centre, and per-crop text is rebuilt from those
+words; the caller keeps its per-crop units, ids and bboxes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from PIL import Image
+
+from .ocr_pool import OCRResult, text_from_data
+
+# Crops taller or wider than this (px at OCR zoom) are OCR'd on their own
+SMALL_CROP_MAX_HEIGHT = 240
+SMALL_CROP_MAX_WIDTH = 2400
+# White space around every crop; wide enough that Tesseract never joins two crops into one line
+GUTTER = 48
+# Upper bound for one canvas; larger sets are split over several canvases
+MAX_CANVAS_HEIGHT = 6000
+
+
+@dataclass
+class CompositeSlot:
+    """Placement of one crop on a canvas"""
+    key: Any
+    left: int
+    top: int
+    width: int
+    height: int
+
+    def contains(self, x: float, y: float) -> bool:
+        return (self.left <= x < self.left + self.width
+                and self.top <= y < self.top + self.height)
+
+
+def is_small_crop(img: Image.Image) -> bool:
+    return img.height <= SMALL_CROP_MAX_HEIGHT and img.width <= SMALL_CROP_MAX_WIDTH
+
+
+def pack_crops(crops: Sequence[Tuple[Any, Image.Image]]) -> List[Tuple[Image.Image, List[CompositeSlot]]]:
+    """
+    Stack (key, image) crops vertically, left-aligned, with gutters on every side.
+
+    Returns (canvas, slots) pairs; a new canvas starts whenever the next crop
+    would push the current one past MAX_CANVAS_HEIGHT.
+    """
+    groups: List[List[Tuple[Any, Image.Image]]] = []
+    height = GUTTER
+    for key, img in crops:
+        if not groups or height + img.height + GUTTER > MAX_CANVAS_HEIGHT:
+            groups.append([])
+            height = GUTTER
+        groups[-1].append((key, img))
+        height += img.height + GUTTER
+
+    canvases = []
+    for group in groups:
+        width = max(img.width for _, img in group) + 2 * GUTTER
+        height = GUTTER + sum(img.height + GUTTER for _, img in group)
+        canvas = Image.new('L', (width, height), 255)
+
+        slots = []
+        top = GUTTER
+        for key, img in group:
+            canvas.paste(img.convert('L'), (GUTTER, top))
+            slots.append(CompositeSlot(key, GUTTER, top, img.width, img.height))
+            top += img.height + GUTTER
+        canvases.append((canvas, slots))
+
+    return canvases
+
+
+def split_words(data: Dict[str, List[Any]], slots: Sequence[CompositeSlot]) -> Dict[Any, OCRResult]:
+    """
+    Map word boxes of a canvas back to its slots.
+
+    Returns slot key -> (text, mean word confidence), rebuilt per slot in the
+    same line/paragraph layout as a single-crop pass. Words whose centre falls
+    in a gutter are dropped.
+    """
+    per_slot: Dict[Any, Dict[str, List[Any]]] = {
+        slot.key: {key: [] for key in data} for slot in slots
+    }
+
+    for i in range(len(data.get('text', []))):
+        cx = data['left'][i] + data['width'][i] / 2
+        cy = data['top'][i] + data['height'][i] / 2
+        for slot in slots:
+            if slot.contains(cx, cy):
+                target = per_slot[slot.key]
+                for key in data:
+                    target[key].append(data[key][i])
+                break
+
+    return {key: text_from_data(words) for key, words in per_slot.items()}
@@ -0,0 +1,200 @@
+"""
+Warm Extraction Worker Pool
+
+Whole-document extraction (``extract_pdf_to_markdown``) is CPU-bound,
+GIL-holding Python. Run in a thread of the API process it competes with the
+event loop, so concurrent extractions make every other request slow.
+
+This pool runs extractions in long-lived worker processes instead:
+
+- workers are spawned once and reused across documents; each one imports
+  the extraction stack (PyMuPDF, pdfplumber, pytesseract + the Tesseract
+  probe) in its initializer, not per document,
+- a worker is replaced after ``max_documents`` extractions, so memory held
+  by fragmented heaps, caches and native libraries cannot grow without bound,
+- a pool whose worker died (crash, OOM kill) is restarted on the next submit,
+- ``run_with_memory_limit`` caps the address space a document may add to its
+  worker (memory_limit_per_file_mb) and reports the document's peak RSS.
+
+The pool is a ``concurrent.futures.Executor``; callers use it with
+``loop.run_in_executor``. Progress is still written by the extractor itself
+(conversion_progress.json in the document's artefacts directory).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import gc
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, documents run uncapped
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Documents a worker extracts before it is replaced
+DEFAULT_MAX_DOCUMENTS = 10
+
+
+class ExtractionMemoryLimitExceeded(MemoryError):
+    """A document needed more memory than its extraction worker is allowed"""
+
+    def __init__(self, limit_mb: int, peak_rss_mb: float):
+        super().__init__(f"Extraction exceeded the memory limit of {limit_mb} MB "
+                         f"(peak RSS {peak_rss_mb:.0f} MB)")
+        self.limit_mb = limit_mb
+        self.peak_rss_mb = peak_rss_mb
+
+    def __reduce__(self):
+        return self.__class__, (self.limit_mb, self.peak_rss_mb)
+
+
+def _init_extraction_worker():
+    """Import the extraction stack once per worker process"""
+    from . import extractor  # PyMuPDF, NumPy, PIL, OpenCV
+
+    extractor.pdfplumber_available()
+    extractor.tesseract_available()  # imports pytesseract and runs the version probe once
+
+
+def _proc_status_mb(field: str) -> Optional[float]:
+    """VmSize / VmRSS / VmHWM of this process in MB (Linux /proc only)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Restart VmHWM (peak RSS) from the current RSS, so it covers one document"""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    peak = _proc_status_mb("VmHWM")
+    if peak is None:
+        # Lifetime peak of the worker (ru_maxrss is KB on Linux)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else 0.0
+    return peak
+
+
+def run_with_memory_limit(fn: Callable[[], Any], limit_mb: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run `fn()` in this worker with at most `limit_mb` of additional address space.
+
+    The soft RLIMIT_AS is set to the worker's current size + `limit_mb` for the
+    call and restored afterwards, so the warm imports do not count against the
+    document. The cap and the reported peak cover this process only: `fn` must
+    not start child processes (page workers, an OCR pool). Only call this in a
+    dedicated worker process: the cap applies to the whole process.
+
+    Returns:
+        (fn's result, {"peak_rss_mb", "memory_limit_mb"})
+
+    Raises:
+        ExtractionMemoryLimitExceeded: An allocation was refused and the MemoryError
+            reached this frame
+    """
+    baseline_size = _proc_status_mb("VmSize")
+    _reset_peak_rss()
+
+    previous_limit = None
+    if resource is not None and baseline_size is not None:
+        soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        cap = int((baseline_size + limit_mb) * 1024 * 1024)
+        if hard == resource.RLIM_INFINITY or cap <= hard:
+            resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+            previous_limit = (soft, hard)
+
+    exceeded = False
+    try:
+        result = fn()
+    except MemoryError:
+        # Reading the peak allocates: only once the cap is lifted below
+        exceeded = True
+    finally:
+        if previous_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, previous_limit)
+        gc.collect()
+
+    if exceeded:
+        raise ExtractionMemoryLimitExceeded(limit_mb, _peak_rss_mb())
+
+    return result, {
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "memory_limit_mb": limit_mb,
+    }
+
+
+class ExtractionWorkerPool(Executor):
+    """Fixed-size pool of warm, periodically recycled extraction processes"""
+
+    def __init__(self, workers: int, max_documents: int = DEFAULT_MAX_DOCUMENTS):
+        self.workers = max(1, int(workers))
+        self.max_documents = max(1, int(max_documents))
+        self._lock = Lock()
+        self._executor = self._start()
+        logger.info(f"Extraction worker pool started: {self.workers} workers, "
+                    f"recycled after {self.max_documents} documents")
+
+    def _start(self) -> ProcessPoolExecutor:
+        # spawn (not fork): extraction is requested from the API's event loop threads
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extraction_worker,
+            max_tasks_per_child=self.max_documents,
+        )
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            try:
+                return self._executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                logger.warning("Extraction worker pool broken (a worker died); restarting it")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._start()
+                return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_pools: Dict[Tuple[int, int], ExtractionWorkerPool] = {}
+_pools_lock = Lock()
+
+
+def get_extraction_pool(workers: int, max_documents: int = DEFAULT_MAX_DOCUMENTS) -> ExtractionWorkerPool:
+    """Process-wide pool for (workers, max_documents), started on first use and reused across documents"""
+    key = (max(1, int(workers)), max(1, int(max_documents)))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ExtractionWorkerPool(*key)
+            _pools[key] = pool
+        return pool
+
+
+@atexit.register
+def shutdown_extraction_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
@@ -7,49 +7,85 @@ table masking, and adaptive OCR for production-grade PDF extraction.
 
 from __future__ import annotations
 from dataclasses import dataclass, asdict, field
-from typing import List, Tuple, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Tuple, Dict, Any, Optional
 import fitz  # PyMuPDF
-import pandas as pd
 import numpy as np
 import json
 import os
-import re
-import hashlib
-import json
-import os
-import re
 import time
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd  # imported where the first table frame is built
+
+from ..shared.unit_store import UNIT_STORE_FILENAME, UnitStore, export_json as export_units_json
+from ..shared.patterns import EMAIL_PATTERN, TEMPORAL_PATTERN, URL_PATTERN, iter_dates, iter_numbers, unique
 from ..shared.document_meta import (
     set_original_pdf_filename,
     get_base_name,
     default_markdown_filename,
     set_markdown_info,
 )
+from .ocr_cache import OCRCache, image_digest
+from .raster import PageRenderCache, pixmap_to_array, pixmap_to_image, enhance_for_ocr
+from .table_session import TableEngineSession, camelot_bbox
+from .table_format import clean_table, frame_to_markdown
+from .page_classifier import PageProfile, classify, count_ruling_edges, PAGE_CLASSES
+from .ocr_pool import OCREngine, empty_result, get_ocr_pool, make_request, resolve_pool_workers
+from .psm_selector import DEFAULT_MIN_CONFIDENCE, rank_psm_ladder, pick_best
+from .composite_ocr import is_small_crop, pack_crops, split_words
+from .text_regions import CV2_AVAILABLE, detect_text_regions
+from .resolution_planner import PROBE_DPI, estimate_x_height, plan_dpi
+from .text_coverage import SpanIndex
+from .geometry import BBoxArray, ZoneIndex, overlap_metrics
+from .furniture import DEFAULT_MIN_PAGES, find_repeated_images, matches_any, remove_repeated_units
 
-# Optional imports with graceful degradation
-try:
-    import camelot
-    CAMELOT_AVAILABLE = True
-except ImportError:
-    CAMELOT_AVAILABLE = False
-    print("Warning: Camelot not installed. Table extraction will use fallback methods.")
+# Configure logging
+logger = logging.getLogger(__name__)
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-    print("Warning: pdfplumber not installed. Advanced table extraction disabled.")
+# Best-effort steps (tables, OCR, fallbacks) catch broad exceptions, but re-raise
+# MemoryError first: under the worker memory cap (extraction_pool.run_with_memory_limit)
+# it has to reach the pool so the document is retried with the low-memory profile
+# instead of silently losing its table and OCR content.
+
+
+# Optional table/OCR backends are imported (and Tesseract probed) on first use,
+# so importing this module does not pull in Camelot's OpenCV stack, pdfplumber
+# or a tesseract subprocess.
+@lru_cache(maxsize=None)
+def camelot_available() -> bool:
+    try:
+        import camelot  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("Camelot not installed. Table extraction will use fallback methods.")
+        return False
+
+
+@lru_cache(maxsize=None)
+def pdfplumber_available() -> bool:
+    try:
+        import pdfplumber  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("pdfplumber not installed. Advanced table extraction disabled.")
+        return False
+
+
+@lru_cache(maxsize=None)
+def tesseract_available() -> bool:
+    try:
+        import pytesseract
+    except ImportError:
+        logger.warning("pytesseract not installed. OCR disabled.")
+        return False
 
-try:
-    import pytesseract
-    from PIL import Image
-    
     # Auto-detect Tesseract on Windows
     if os.name == 'nt':  # Windows
         tesseract_paths = [
@@ -61,20 +97,27 @@ try:
             if os.path.exists(path):
                 pytesseract.pytesseract.tesseract_cmd = path
                 break
-    
+
     # Test if Tesseract works
     try:
         pytesseract.get_tesseract_version()
-        TESSERACT_AVAILABLE = True
-    except:
-        TESSERACT_AVAILABLE = False
-        print("Warning: Tesseract not configured. OCR disabled.")
-except ImportError:
-    TESSERACT_AVAILABLE = False
-    print("Warning: pytesseract/PIL not installed. OCR disabled.")
+        return True
+    except Exception:
+        logger.warning("Tesseract not configured. OCR disabled.")
+        return False
 
-# Configure logging
-logger = logging.getLogger(__name__)
+
+# Image-block crops are cut at this zoom over 72 dpi when the resolution planner has no estimate
+IMAGE_OCR_ZOOM = 2.5
+
+# Tesseract page segmentation modes used in the PSM ladders
+PSM_MODE_NAMES = {
+    3: 'auto',              # Fully automatic page segmentation
+    6: 'uniform_block',     # Best for paragraphs
+    7: 'single_line',       # Best for headers/banners
+    11: 'sparse_text',      # Best for scattered text
+    13: 'raw_line',         # Best for single raw line
+}
 
 
 @dataclass
@@ -120,6 +163,7 @@ class ExtractionResult:
     artefacts_dir: str
     metrics_path: str
     original_pdf_filename: Optional[str] = None
+    units_store_path: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -131,21 +175,69 @@ class PDFExtractorV2:
     def __init__(self, **kwargs):
         self.ocr_lang = kwargs.get('ocr_lang', 'ind+eng')
         self.ocr_dpi = kwargs.get('ocr_dpi', 300)  # Optimal balance speed/quality
-        self.enable_ocr = kwargs.get('enable_ocr', True) and TESSERACT_AVAILABLE
+        # Resolution planner: OCR DPI per region from the measured x-height, within [min, max]
+        self.adaptive_ocr_dpi = kwargs.get('adaptive_ocr_dpi', True)
+        self.ocr_min_dpi = kwargs.get('ocr_min_dpi', 150)
+        self.ocr_max_dpi = kwargs.get('ocr_max_dpi', 400)
+        # PSM ladders: page-level OCR tries primary then fallbacks; image crops try the likeliest PSM
+        # first and only run the rest when its mean word confidence is below the threshold
+        self.ocr_primary_psm = kwargs.get('ocr_primary_psm', 3)
+        self.ocr_fallback_psm = list(kwargs.get('ocr_fallback_psm') or [])
+        self.image_psm_ladder = list(kwargs.get('image_psm_ladder') or [7, 6, 11, 13])
+        self.image_ocr_min_confidence = float(kwargs.get('image_ocr_min_confidence', DEFAULT_MIN_CONFIDENCE))
+        # Scanned pages: OCR only detected text regions (OpenCV) instead of the whole bitmap
+        self.ocr_text_regions = kwargs.get('ocr_text_regions', True) and CV2_AVAILABLE
+        # Pack a page's small image crops into one canvas and OCR them in a single pass
+        self.composite_image_ocr = kwargs.get('composite_image_ocr', False)
+        self.extraction_profile = kwargs.get('extraction_profile') or 'custom'
+        self.enable_ocr = kwargs.get('enable_ocr', True) and tesseract_available()
         self.ocr_fast_mode = kwargs.get('ocr_fast_mode', True)  # Use optimized settings
         self.dpi_fullpage = kwargs.get('dpi_fullpage', 300)
+        # Debug-only: page previews are otherwise rendered on demand by the API
+        self.render_debug_pages = kwargs.get('render_debug_pages', False)
         self.zoom_clip = kwargs.get('zoom_clip', 2.0)
         self.enable_pdfplumber_fallback = kwargs.get('enable_pdfplumber_fallback', True)
+        self.table_engine = kwargs.get('table_engine', 'pdfplumber')  # "pdfplumber" | "pymupdf" (fast path)
+        # Engines tried in order until one finds tables
+        self.table_engines = list(kwargs.get('table_engines') or [self.table_engine, 'camelot'])
         self.min_table_area_ratio = kwargs.get('min_table_area_ratio', 0.01)
         self.header_footer_mode = kwargs.get('header_footer_mode', 'auto')
         self.header_margin_pct = kwargs.get('header_margin_pct', 0.05)
         self.footer_margin_pct = kwargs.get('footer_margin_pct', 0.05)
         self.max_ocr_crops_per_page = kwargs.get('max_ocr_crops_per_page', 12)
+        # Images whose area the text layer already covers are not OCR'd
+        self.skip_text_covered_images = kwargs.get('skip_text_covered_images', True)
+        # Cross-page furniture: repeated images skip OCR, repeated text units are dropped once per document
+        self.remove_repeated_furniture = kwargs.get('remove_repeated_furniture', True)
+        self.furniture_min_pages = max(2, int(kwargs.get('furniture_min_pages', DEFAULT_MIN_PAGES)))
+        # {page_num: [bbox, ...]} of repeated image occurrences in the current document
+        self.repeated_images: Dict[int, List[Tuple]] = {}
+        # units.npz is always written; units_metadata.json is a legacy JSON export
+        self.units_json_export = kwargs.get('units_json_export', True)
+        # Long-lived OCR workers keep language models loaded (0 = OCR in this process; off without tesserocr)
+        self.ocr_pool_workers = resolve_pool_workers(max(0, int(kwargs.get('ocr_pool_workers', 0) or 0)))
+        self.ocr_engine: Optional[OCREngine] = None
         self.figure_min_area_ratio = kwargs.get('figure_min_area_ratio', 0.003)
         self.column_split_strategy = kwargs.get('column_split_strategy', 'histogram')
         self.include_debug_anchors = kwargs.get('include_debug_anchors', False)
+        self.page_workers = max(1, int(kwargs.get('page_workers', 1) or 1))
+        
+        # Keep constructor options so page workers can rebuild an identical extractor
+        self._init_kwargs = dict(kwargs)
+        
+        # Persistent OCR cache keyed by pixel digest + lang/PSM/DPI (shared across documents and workers)
+        self.ocr_cache = None
+        if kwargs.get('enable_ocr_cache', True):
+            self.ocr_cache = OCRCache(
+                cache_dir=kwargs.get('ocr_cache_dir'),
+                max_mb=kwargs.get('ocr_cache_max_mb', 256),
+            )
+        # Each page is rasterized once and shared by debug PNGs and all OCR paths
+        self.render_cache = PageRenderCache()
+        
+        # Table engines are opened once per document (see _table_session)
+        self.table_session: Optional[TableEngineSession] = None
         
-        self.ocr_cache = {}  # Cache OCR results by image hash
         self.metrics = defaultdict(int)
         self.units = []
         self.tables = []
@@ -188,35 +280,7 @@ class PDFExtractorV2:
     
     def calculate_overlap_metrics(self, bbox1: Tuple, bbox2: Tuple) -> Dict[str, float]:
         """Calculate comprehensive overlap metrics between two bboxes"""
-        x0_1, y0_1, x1_1, y1_1 = bbox1
-        x0_2, y0_2, x1_2, y1_2 = bbox2
-        
-        # Intersection
-        x0_i = max(x0_1, x0_2)
-        y0_i = max(y0_1, y0_2)
-        x1_i = min(x1_1, x1_2)
-        y1_i = min(y1_1, y1_2)
-        
-        if x0_i >= x1_i or y0_i >= y1_i:
-            return {'iou': 0.0, 'overlap_ratio': 0.0, 'x_overlap_ratio': 0.0}
-        
-        intersection_area = (x1_i - x0_i) * (y1_i - y0_i)
-        area1 = (x1_1 - x0_1) * (y1_1 - y0_1)
-        area2 = (x1_2 - x0_2) * (y1_2 - y0_2)
-        
-        iou = intersection_area / (area1 + area2 - intersection_area) if (area1 + area2 - intersection_area) > 0 else 0
-        overlap_ratio = intersection_area / area1 if area1 > 0 else 0
-        
-        # Horizontal overlap ratio
-        x_overlap = max(0, x1_i - x0_i)
-        x_width1 = x1_1 - x0_1
-        x_overlap_ratio = x_overlap / x_width1 if x_width1 > 0 else 0
-        
-        return {
-            'iou': iou,
-            'overlap_ratio': overlap_ratio,
-            'x_overlap_ratio': x_overlap_ratio
-        }
+        return overlap_metrics(bbox1, bbox2)
 
     
     def extract(
@@ -236,7 +300,8 @@ class PDFExtractorV2:
         logs_dir = artefacts_dir / "logs"
         meta_dir = artefacts_dir / "meta"
         
-        for dir_path in [pages_dir, crops_dir, logs_dir, meta_dir]:
+        debug_dirs = [pages_dir] if self.render_debug_pages else []
+        for dir_path in debug_dirs + [crops_dir, logs_dir, meta_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize progress file
@@ -255,40 +320,71 @@ class PDFExtractorV2:
         file_handler.setLevel(logging.INFO)
         logger.addHandler(file_handler)
         
-        logger.info(f"Starting extraction for {doc_id}")
+        logger.info(f"Starting extraction for {doc_id} (profile: {self.extraction_profile})")
         
-        # 1) Open PDF and render debug pages
+        # 1) Open PDF (debug pages are rendered per page from the shared raster)
         doc = fitz.open(pdf_path)
         total_pages = len(doc)
         logger.info(f"Document has {total_pages} pages")
         
-        # Render debug pages
-        for page_num in range(total_pages):
-            page = doc[page_num]
-            mat = fitz.Matrix(self.dpi_fullpage / 72.0, self.dpi_fullpage / 72.0)
-            pix = page.get_pixmap(matrix=mat)
-            pix.save(str(pages_dir / f"page-{page_num + 1}.png"))
+        # Images repeated across pages (logos, banners) are OCR'd on their first page only
+        self.repeated_images = {}
+        if self.remove_repeated_furniture:
+            self.repeated_images = find_repeated_images(doc, self.furniture_min_pages)
+            self.metrics['furniture_image_repeats'] = sum(map(len, self.repeated_images.values()))
         
-        # Process each page
+        # Process each page (serially or fanned out across worker processes)
         all_units = []
         all_tables = []
         all_figures = []
         
-        for page_num in range(total_pages):
-            progress_pct = 0.2 + (0.6 * page_num / total_pages)
-            self._update_progress(progress_path, "running", progress_pct, 
-                                f"Memproses halaman {page_num + 1}/{total_pages}...")
-            logger.info(f"Processing page {page_num + 1}/{total_pages}")
-            page = doc[page_num]
-            page_units, page_tables, page_figures = self._process_page(
-                page, page_num + 1, doc_id, artefacts_dir
-            )
+        # Per page-class counts/timings are reported even when a class does not occur
+        for page_class in PAGE_CLASSES:
+            self.metrics.setdefault(f'pages_{page_class}', 0)
+            self.metrics.setdefault(f'page_time_{page_class}', 0.0)
+        
+        workers = min(self.page_workers, total_pages, os.cpu_count() or 1)
+        page_results = None
+        
+        if workers > 1:
+            try:
+                page_results = self._process_pages_parallel(
+                    pdf_path, total_pages, doc_id, artefacts_dir, progress_path, log_path, workers
+                )
+            except MemoryError:
+                raise
+            except Exception as e:
+                logger.warning(f"Page-parallel extraction failed ({e}), falling back to serial processing")
+                page_results = None
+        
+        if page_results is None:
+            workers = 1
+            page_results = self._process_pages_serial(doc, total_pages, doc_id, artefacts_dir, progress_path)
+        
+        self.metrics['page_workers'] = workers
+        self.metrics['extraction_profile'] = self.extraction_profile
+        self.metrics['ocr_dpi'] = self.ocr_dpi
+        
+        for page_units, page_tables, page_figures in page_results:
             all_units.extend(page_units)
             all_tables.extend(page_tables)
             all_figures.extend(page_figures)
         
+        self._close_table_session()
+        page_heights = {page_index + 1: doc[page_index].rect.height for page_index in range(total_pages)}
         doc.close()
         
+        # Drop repeated headers/footers/disclaimers once, before markdown and enhancement windows
+        if self.remove_repeated_furniture:
+            all_units, furniture = remove_repeated_units(all_units, page_heights, self.furniture_min_pages)
+            self.metrics.update(furniture.to_metrics())
+            for group in furniture.groups:
+                logger.info(f"Repeated furniture on pages {group['pages']}: '{group['text']}' "
+                            f"({group['removed']} copies removed)")
+            if furniture.units_removed:
+                logger.info(f"Removed {furniture.units_removed} furniture units "
+                            f"(~{furniture.tokens_removed} tokens)")
+        
         # 7) Extract document properties (UNIVERSAL - works for ANY document type)
         self._update_progress(progress_path, "running", 0.75, "Mengekstrak properti dokumen...")
         doc_properties = self._extract_document_properties(all_units, original_filename or "")
@@ -315,16 +411,15 @@ class PDFExtractorV2:
             relative_path=markdown_filename,
         )
         
-        # Save metadata in both locations for compatibility
-        units_meta = [unit.to_dict() for unit in all_units]
+        # Columnar unit store (read by enhancement), written once
+        units_store_path = UnitStore.from_units(all_units).save(artefacts_dir / UNIT_STORE_FILENAME)
         
-        # Save in root directory (for backward compatibility)
+        # Legacy JSON export (backward compatibility)
         units_meta_path = artefacts_dir / "units_metadata.json"
-        units_meta_path.write_text(json.dumps(units_meta, indent=2), encoding='utf-8')
-        
-        # Also save in meta subfolder
-        meta_units_path = meta_dir / "units_metadata.json"
-        meta_units_path.write_text(json.dumps(units_meta, indent=2), encoding='utf-8')
+        if self.units_json_export:
+            export_units_json(all_units, units_meta_path)
+        else:
+            units_meta_path = units_store_path
         
         if all_tables:
             tables_path = artefacts_dir / "tables.json"
@@ -346,6 +441,15 @@ class PDFExtractorV2:
         self.metrics['ocr_units'] = len([u for u in all_units if 'ocr' in u.source])
         self.metrics['markdown_length'] = len(markdown_with_frontmatter)
         self.metrics['has_frontmatter'] = markdown_with_frontmatter.startswith('---')
+        self._add_ocr_mode_rates()
+        if self.metrics.get('ocr_images_marked'):
+            self.metrics['ocr_image_skip_rate'] = round(
+                self.metrics['ocr_images_skipped_text_layer'] / self.metrics['ocr_images_marked'], 3
+            )
+        if self.metrics.get('ocr_crop_dpi_count'):
+            self.metrics['ocr_crop_dpi_mean'] = round(
+                self.metrics['ocr_crop_dpi_total'] / self.metrics['ocr_crop_dpi_count']
+            )
         
         # Validation warnings
         if self.metrics['text_units'] == 0:
@@ -385,11 +489,146 @@ class PDFExtractorV2:
             artefacts_dir=str(artefacts_dir),
             metrics_path=str(metrics_path),
             original_pdf_filename=original_filename,
+            units_store_path=str(units_store_path),
         )
     
+    def _add_ocr_mode_rates(self):
+        """Per-PSM hit rates for image-block OCR (wins / times tried) and calls per crop"""
+        for psm in dict.fromkeys(self.image_psm_ladder):
+            mode = PSM_MODE_NAMES.get(psm, f'psm_{psm}')
+            tried = self.metrics.get(f'ocr_mode_tried_{mode}', 0)
+            if tried:
+                self.metrics[f'ocr_mode_hit_rate_{mode}'] = round(
+                    self.metrics.get(f'ocr_mode_won_{mode}', 0) / tried, 3
+                )
+        
+        crops = self.metrics.get('ocr_image_crops', 0)
+        if crops:
+            modes_tried = sum(v for k, v in self.metrics.items() if k.startswith('ocr_mode_tried_'))
+            self.metrics['ocr_modes_per_crop'] = round(modes_tried / crops, 2)
+    
+    def _process_pages_serial(self, doc: fitz.Document, total_pages: int, doc_id: str,
+                              artefacts_dir: Path, progress_path: Path) -> List[Tuple[List[Unit], List[TableSchema], List[Dict]]]:
+        """Process pages one at a time in the current process"""
+        page_results = []
+        
+        for page_num in range(total_pages):
+            progress_pct = 0.2 + (0.6 * page_num / total_pages)
+            self._update_progress(progress_path, "running", progress_pct, 
+                                f"Memproses halaman {page_num + 1}/{total_pages}...")
+            logger.info(f"Processing page {page_num + 1}/{total_pages}")
+            page = doc[page_num]
+            page_results.append(self._process_page(page, page_num + 1, doc_id, artefacts_dir))
+        
+        return page_results
+    
+    def _process_pages_parallel(self, pdf_path: str, total_pages: int, doc_id: str, artefacts_dir: Path,
+                                progress_path: Path, log_path: Path, workers: int) -> List[Tuple[List[Unit], List[TableSchema], List[Dict]]]:
+        """
+        Fan _process_page out across worker processes.
+        
+        Pages are independent, so each worker opens its own copy of the PDF and
+        runs the exact same per-page code. Results are slotted back by page index,
+        which keeps markdown and units_metadata identical to the serial path.
+        """
+        logger.info(f"Processing {total_pages} pages with {workers} worker processes")
+        
+        # Pages already run across cores - OCR stays inside each page worker
+        worker_kwargs = {**self._init_kwargs, 'page_workers': 1, 'ocr_pool_workers': 0}
+        page_results: List[Optional[Tuple[List[Unit], List[TableSchema], List[Dict]]]] = [None] * total_pages
+        
+        # spawn (not fork): extraction usually runs inside a worker thread of the API process
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_page_worker,
+            initargs=(worker_kwargs, str(pdf_path), str(log_path), self.repeated_images),
+        ) as pool:
+            futures = {
+                pool.submit(_process_page_in_worker, page_num, doc_id, str(artefacts_dir)): page_num
+                for page_num in range(total_pages)
+            }
+            
+            completed = 0
+            for future in as_completed(futures):
+                page_num = futures[future]
+                page_units, page_tables, page_figures, page_metrics = future.result()
+                page_results[page_num] = (page_units, page_tables, page_figures)
+                
+                for key, value in page_metrics.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        self.metrics[key] += value
+                
+                completed += 1
+                progress_pct = 0.2 + (0.6 * completed / total_pages)
+                self._update_progress(progress_path, "running", progress_pct,
+                                    f"Memproses halaman {completed}/{total_pages}...")
+                logger.info(f"Page {page_num + 1}/{total_pages} done ({completed} completed)")
+        
+        return page_results
+    
     def _process_page(self, page: fitz.Page, page_num: int, doc_id: str, 
                       artefacts_dir: Path) -> Tuple[List[Unit], List[TableSchema], List[Dict]]:
-        """Process a single page"""
+        """Process a single page, rasterizing it at most once and releasing the raster afterwards"""
+        page_start = time.time()
+        
+        # 1) Cheap pre-pass: decide which engines can apply to this page
+        profile = self._classify_page(page, page_num)
+        self.metrics['page_classify_time'] += time.time() - page_start
+        
+        try:
+            # Render debug page from the shared raster
+            if self.render_debug_pages:
+                pix = self.render_cache.page_pixmap(page, self.dpi_fullpage)
+                pix.save(str(artefacts_dir / "pages" / f"page-{page_num}.png"))
+            
+            return self._process_page_content(page, page_num, doc_id, artefacts_dir, profile)
+        finally:
+            for key, value in self.render_cache.pop_stats().items():
+                self.metrics[key] += value
+            self.render_cache.release()
+            
+            self.metrics[f'pages_{profile.page_class}'] += 1
+            self.metrics[f'page_time_{profile.page_class}'] += time.time() - page_start
+    
+    def _classify_page(self, page: fitz.Page, page_num: int) -> PageProfile:
+        """Label page as text-native / table-bearing / scanned / mixed from cheap signals"""
+        blocks = page.get_text("blocks", flags=fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES)
+        text_blocks = [{'bbox': b[:4]} for b in blocks if b[6] == 0 and b[4].strip()]
+        figure_blocks = [{'bbox': b[:4]} for b in blocks if b[6] == 1]
+        text_chars = sum(len(b[4].strip()) for b in blocks if b[6] == 0)
+        
+        page_area = page.rect.width * page.rect.height
+        image_area = sum((f['bbox'][2] - f['bbox'][0]) * (f['bbox'][3] - f['bbox'][1]) for f in figure_blocks)
+        image_coverage = image_area / page_area if page_area > 0 else 0
+        
+        horizontal, vertical = count_ruling_edges(page)
+        line_density = (horizontal + vertical) / (page_area / 10000) if page_area > 0 else 0
+        
+        is_scan = self._is_full_page_scan(page, figure_blocks, text_blocks)
+        
+        profile = PageProfile(
+            page_class='',
+            text_chars=text_chars,
+            image_count=len(figure_blocks),
+            image_coverage=round(min(image_coverage, 1.0), 4),
+            horizontal_edges=horizontal,
+            vertical_edges=vertical,
+            line_density=round(line_density, 3),
+            is_full_page_scan=is_scan,
+        )
+        profile.page_class = classify(text_chars, len(figure_blocks), profile.has_rulings, is_scan)
+        
+        logger.info(f"Page {page_num}: classified as {profile.page_class} ({profile.to_dict()})")
+        return profile
+    
+    def _process_page_content(self, page: fitz.Page, page_num: int, doc_id: str, 
+                              artefacts_dir: Path, profile: Optional[PageProfile] = None) -> Tuple[List[Unit], List[TableSchema], List[Dict]]:
+        """Process a single page, skipping table engines and OCR where the page class rules them out"""
+        if profile is None:
+            profile = self._classify_page(page, page_num)
+        
         page_units = []
         page_tables = []
         page_figures = []
@@ -403,8 +642,11 @@ class PDFExtractorV2:
         # Detect columns
         columns = self._detect_columns(layout)
         
-        # 3) Extract tables and build exclusion zones
-        table_results = self._extract_tables(page, page_num, doc_id)
+        # 3) Extract tables and build exclusion zones (lines-based finders need ruling lines)
+        if not profile.needs_lines_engines:
+            self.metrics['table_engine_pages_skipped'] += 1
+            logger.info(f"Page {page_num}: no ruling lines ({profile.page_class}) - skipping lines-based table engines")
+        table_results = self._extract_tables(page, page_num, doc_id, ruled=profile.needs_lines_engines)
         exclusion_zones = []
         
         for table_result in table_results:
@@ -439,25 +681,42 @@ class PDFExtractorV2:
         for i, block in enumerate(text_blocks[:5]):  # Log first 5 blocks
             logger.info(f"Page {page_num}: Text block {i}: bbox={block['bbox']}, text_preview='{block.get('text', '')[:50]}...'")
         
+        # Normalize all block bboxes and test them against every table zone in one batch
+        # (PyMuPDF blocks should already be in correct coordinate system, but normalize for consistency)
+        block_boxes = BBoxArray([block['bbox'] for block in text_blocks]).clamp(page.rect.width, page.rect.height)
+        for block, block_bbox in zip(text_blocks, block_boxes.to_tuples()):
+            block['bbox'] = block_bbox  # Update the block with normalized bbox
+        
+        # IMPROVED: Pass text for content-aware exclusion
+        excluded_mask = self._exclusion_mask(
+            block_boxes, exclusion_zones, [block.get('text', '') for block in text_blocks]
+        )
+        block_areas = block_boxes.areas.tolist()
+        # Blocks lying entirely inside a table zone are table rows, whatever their size
+        inside_table = (
+            block_boxes.contained_in(BBoxArray(exclusion_zones)).any(axis=1)
+            if exclusion_zones and text_blocks else np.zeros(len(text_blocks), dtype=bool)
+        )
+        # So are blocks whose text the tables already carry (PyMuPDF blocks often run
+        # past the table's bottom edge); compared without whitespace and cell separators
+        table_text = ''.join(''.join(u.content for u in page_units if u.unit_type == 'table').replace('|', ' ').split())
+        
         filtered_blocks = []
         
         for i, block in enumerate(text_blocks):
-            # Ensure text block bbox is normalized to same coordinate system
-            raw_bbox = block['bbox']
-            # PyMuPDF blocks should already be in correct coordinate system, but normalize for consistency  
-            block_bbox = self.normalize_bbox(raw_bbox, 'pymupdf', page.rect.width, page.rect.height, 0)
-            block['bbox'] = block_bbox  # Update the block with normalized bbox
+            block_bbox = block['bbox']
             
             # Calculate block area and text length for better filtering decisions
-            block_area = (block_bbox[2] - block_bbox[0]) * (block_bbox[3] - block_bbox[1])
+            block_area = block_areas[i]
             text_content = block.get('text', '')
             text_length = len(text_content)
             
-            # IMPROVED: Pass text for content-aware exclusion
-            is_excluded = self._is_in_exclusion_zone(block_bbox, exclusion_zones, text_content)
+            is_excluded = bool(excluded_mask[i])
+            repeats_table = inside_table[i] or bool(text_content.strip() and ''.join(text_content.split()) in table_text)
             
-            # Special handling: Don't exclude large text blocks (likely important paragraphs)
-            if is_excluded and (block_area > 5000 or text_length > 100):
+            # Special handling: Don't exclude large text blocks (likely important paragraphs
+            # that only overlap a table zone)
+            if is_excluded and not repeats_table and (block_area > 5000 or text_length > 100):
                 logger.warning(f"Page {page_num}: OVERRIDING exclusion for large text block {i} - area:{block_area:.1f}, text_len:{text_length}")
                 is_excluded = False
             
@@ -473,23 +732,14 @@ class PDFExtractorV2:
         if not filtered_blocks and text_blocks and exclusion_zones:
             logger.warning(f"Page {page_num}: ALL text blocks filtered out! Using emergency fallback...")
             
-            # Emergency fallback: only filter blocks that are ENTIRELY inside tables
+            # Emergency fallback: only filter blocks that are ENTIRELY inside tables (very strict)
             emergency_filtered = []
             for i, block in enumerate(text_blocks):
-                block_bbox = block['bbox']
-                should_exclude = False
-                
-                for zone in exclusion_zones:
-                    # Only exclude if block is COMPLETELY inside table (very strict)
-                    if (block_bbox[0] >= zone[0] and block_bbox[1] >= zone[1] and 
-                        block_bbox[2] <= zone[2] and block_bbox[3] <= zone[3]):
-                        should_exclude = True
-                        logger.info(f"Page {page_num}: Emergency filter - block {i} completely inside table {zone}")
-                        break
-                
-                if not should_exclude:
+                if inside_table[i]:
+                    logger.info(f"Page {page_num}: Emergency filter - block {i} completely inside a table")
+                else:
                     emergency_filtered.append(block)
-                    logger.info(f"Page {page_num}: Emergency keep - block {i} at {block_bbox}")
+                    logger.info(f"Page {page_num}: Emergency keep - block {i} at {block['bbox']}")
             
             filtered_blocks = emergency_filtered
             logger.warning(f"Page {page_num}: Emergency fallback kept {len(filtered_blocks)} text blocks")
@@ -503,7 +753,7 @@ class PDFExtractorV2:
         table_units = [u for u in page_units if u.unit_type == 'table']
         
         # If we have very few text units but there should be more content, try OCR fallback
-        if len(text_units) < 2 and len(table_units) > 0:
+        if len(text_units) < 2 and len(table_units) > 0 and profile.needs_ocr:
             logger.warning(f"Page {page_num}: Very few text units ({len(text_units)}) detected, trying OCR backup...")
             
             # Get simple text and check if there's substantial content missing
@@ -535,7 +785,11 @@ class PDFExtractorV2:
         figure_blocks = [b for b in layout['blocks'] if b['type'] == 'figure']
         is_full_page_scan = self._is_full_page_scan(page, figure_blocks, text_blocks)
         
-        if is_full_page_scan and TESSERACT_AVAILABLE:
+        if not profile.needs_ocr:
+            # Text-native page: no images to OCR and the text layer is complete
+            self.metrics['ocr_pages_skipped'] += 1
+            
+        elif is_full_page_scan and tesseract_available():
             logger.info(f"Page {page_num}: Detected FULL-PAGE SCAN - using optimized OCR workflow")
             
             # Optimized: OCR entire page at once instead of breaking into crops
@@ -565,12 +819,27 @@ class PDFExtractorV2:
             
         else:
             # Normal workflow: Extract figures AND perform OCR on images with text
+            ocr_blocks = [
+                (fig_idx, fig_block)
+                for fig_idx, fig_block in enumerate(figure_blocks[:self.max_ocr_crops_per_page])
+                if fig_block.get('needs_ocr', False)
+            ]
+            # Composite mode: small crops of this page share one OCR pass
+            composite_results = {}
+            if self.composite_image_ocr and len(ocr_blocks) > 1 and tesseract_available():
+                composite_results = self._ocr_image_blocks_composite(
+                    ocr_blocks, page, page_num, doc_id, artefacts_dir
+                )
+            
             for fig_idx, fig_block in enumerate(figure_blocks[:self.max_ocr_crops_per_page]):
                 # IMPROVED: Process figure for OCR if marked
-                if fig_block.get('needs_ocr', False) and TESSERACT_AVAILABLE:
-                    ocr_result = self._ocr_image_block(
-                        fig_block, page, page_num, doc_id, artefacts_dir
-                    )
+                if fig_block.get('needs_ocr', False) and tesseract_available():
+                    if fig_idx in composite_results:
+                        ocr_result = composite_results[fig_idx]
+                    else:
+                        ocr_result = self._ocr_image_block(
+                            fig_block, page, page_num, doc_id, artefacts_dir
+                        )
                     
                     if ocr_result and ocr_result.strip():
                         # Create paragraph unit from OCR'd image
@@ -598,7 +867,7 @@ class PDFExtractorV2:
                     page_figures.append(figure_data['metadata'])
         
         # 6) OCR full page if no text found
-        if not text_blocks and not table_results and TESSERACT_AVAILABLE:
+        if not text_blocks and not table_results and profile.needs_ocr and tesseract_available():
             logger.info(f"Page {page_num}: No text/tables found, performing full-page OCR...")
             ocr_start = time.time()
             
@@ -636,6 +905,17 @@ class PDFExtractorV2:
         # Also get simple text for validation
         simple_text = page.get_text("text")
         
+        # Spatial index of text spans - images already covered by the text layer skip OCR
+        span_index = None
+        if self.skip_text_covered_images:
+            span_index = SpanIndex([
+                (span['bbox'], span.get('text', ''))
+                for block in dict_data.get('blocks', []) if block.get('type', 0) == 0
+                for line in block.get('lines', [])
+                for span in line.get('spans', [])
+                if span.get('text', '').strip()
+            ])
+        
         for block_idx, block in enumerate(dict_data.get('blocks', [])):
             block_type = block.get('type', 0)
             bbox = block.get('bbox', (0, 0, 0, 0))
@@ -681,10 +961,22 @@ class PDFExtractorV2:
                 # Mark for OCR if: top region OR mid-sized image in content area
                 should_ocr = (is_top_region or (is_mid_region and area_ratio < 0.3))
                 
-                if should_ocr:
-                    # Add flag for OCR processing in _process_page
-                    layout['blocks'][-1]['needs_ocr'] = True
-                    logger.info(f"Image at {bbox} marked for OCR (top_region={is_top_region}, area={area_ratio:.3f})")
+                if should_ocr and matches_any(bbox, self.repeated_images.get(page.number + 1, ())):
+                    # Same image already OCR'd on an earlier page (logo/banner furniture)
+                    layout['blocks'][-1]['repeated_furniture'] = True
+                    self.metrics['furniture_images_skipped'] += 1
+                    logger.info(f"Image at {bbox} repeats across pages, skipping OCR")
+                elif should_ocr:
+                    self.metrics['ocr_images_marked'] += 1
+                    if span_index and span_index.covers(bbox):
+                        # Text overlaid on the image is already in the text layer
+                        layout['blocks'][-1]['text_covered'] = True
+                        self.metrics['ocr_images_skipped_text_layer'] += 1
+                        logger.info(f"Image at {bbox} covered by text layer, skipping OCR")
+                    else:
+                        # Add flag for OCR processing in _process_page
+                        layout['blocks'][-1]['needs_ocr'] = True
+                        logger.info(f"Image at {bbox} marked for OCR (top_region={is_top_region}, area={area_ratio:.3f})")
         
         # Fallback: if no text blocks found but simple_text has content
         # Split into paragraphs to avoid single full-page block
@@ -764,6 +1056,8 @@ class PDFExtractorV2:
                             'source': 'extractBLOCKS'
                         })
                         
+        except MemoryError:
+            raise
         except Exception as e:
             logger.debug(f"Alternative text extraction failed: {e}")
         
@@ -802,6 +1096,8 @@ class PDFExtractorV2:
                             'source': 'words_grouped'
                         })
                         
+            except MemoryError:
+                raise
             except Exception as e:
                 logger.debug(f"Words extraction failed: {e}")
         
@@ -811,27 +1107,20 @@ class PDFExtractorV2:
     def _ocr_non_table_areas(self, page: fitz.Page, page_num: int, 
                             exclusion_zones: List[Tuple], artefacts_dir: Path) -> Optional[str]:
         """OPTIMIZED OCR non-table areas when text detection fails"""
-        if not TESSERACT_AVAILABLE:
+        if not tesseract_available():
             return None
             
         try:
-            # OPTIMIZED: Use same efficient method as main OCR
-            mat = fitz.Matrix(300 / 72.0, 300 / 72.0)  # Optimal DPI
-            pix = page.get_pixmap(matrix=mat)
+            # OPTIMIZED: Reuse the page raster shared with the other OCR paths (grayscale),
+            # at the DPI the measured glyph size needs
+            dpi = self._plan_ocr_dpi(page, page_num)
+            pix = self.render_cache.page_pixmap(page, dpi, gray=True)
             
-            # OPTIMIZED: Direct memory OCR (no temp files)
-            img_data = pix.tobytes("png")
-            from PIL import Image
-            import io
+            # OPTIMIZED: Image straight from the sample buffer (no PNG round-trip)
+            img = pixmap_to_image(pix)
             
-            img = Image.open(io.BytesIO(img_data))
-            
-            # OCR with balanced config (same as main OCR)
-            full_text = pytesseract.image_to_string(
-                img,
-                lang=self.ocr_lang,
-                config='--oem 3 --psm 6 -c tessedit_create_hocr=0'
-            )
+            # OCR with the profile's PSM ladder (same as main OCR)
+            full_text = self._run_tesseract_ladder(img, extra_config='-c tessedit_create_hocr=0', dpi=dpi)
             
             # Enhanced post-processing
             if full_text:
@@ -853,6 +1142,8 @@ class PDFExtractorV2:
             
             return full_text.strip() if full_text else None
             
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"OCR backup failed on page {page_num}: {e}")
             return None
@@ -1067,91 +1358,79 @@ class PDFExtractorV2:
         
         return {'type': 'single', 'boundaries': []}
     
+    def _table_session(self, page: fitz.Page) -> TableEngineSession:
+        """Table engine session for the page's document, opened on first use"""
+        if self.table_session is None or not self.table_session.matches(page.parent):
+            self._close_table_session()
+            self.table_session = TableEngineSession(page.parent)
+        return self.table_session
+    
+    def _close_table_session(self):
+        if self.table_session is not None:
+            self.table_session.close()
+            self.table_session = None
+    
     def _extract_tables(self, page: fitz.Page, page_num: int, 
-                       doc_id: str) -> List[Tuple[TableSchema, Unit]]:
-        """Extract tables - prioritize PDFPlumber (more reliable) over Camelot"""
-        results = []
+                       doc_id: str, ruled: bool = True) -> List[Tuple[TableSchema, Unit]]:
+        """
+        Extract tables - engines tried in configured order (default: PDFPlumber, then Camelot).
         
-        # Try PDFPlumber first (generally more reliable for most tables)
-        if PDFPLUMBER_AVAILABLE and self.enable_pdfplumber_fallback:
-            results = self._extract_tables_pdfplumber(page, page_num, doc_id)
-            if results:
-                logger.info(f"PDFPlumber found {len(results)} tables on page {page_num}")
-                return results
+        On pages without ruling lines (`ruled` False) the lines-based engines
+        (PDFPlumber, PyMuPDF) are skipped and Camelot runs in stream mode only.
+        """
+        session = self._table_session(page)
+        
+        engines = {
+            'pdfplumber': ('PDFPlumber', pdfplumber_available() and self.enable_pdfplumber_fallback and ruled,
+                           self._extract_tables_pdfplumber),
+            'pymupdf': ('PyMuPDF', ruled, self._extract_tables_pymupdf),
+            'camelot': ('Camelot', camelot_available(),
+                        partial(self._extract_tables_camelot, ruled=ruled)),
+        }
         
-        # Fallback to Camelot if PDFPlumber found nothing
-        if CAMELOT_AVAILABLE and not results:
-            results = self._extract_tables_camelot(page, page_num, doc_id)
+        for engine in self.table_engines:
+            label, available, extract_fn = engines[engine]
+            if not available:
+                continue
+            
+            results = extract_fn(page, page_num, doc_id)
+            if engine == 'pdfplumber':
+                session.release_page(page_num)
+            
             if results:
-                logger.info(f"Camelot found {len(results)} tables on page {page_num}")
+                logger.info(f"{label} found {len(results)} tables on page {page_num}")
+                return results
         
-        return results
+        return []
     
     def _extract_tables_camelot(self, page: fitz.Page, page_num: int,
-                                doc_id: str) -> List[Tuple[TableSchema, Unit]]:
-        """Extract tables using Camelot"""
+                                doc_id: str, ruled: bool = True) -> List[Tuple[TableSchema, Unit]]:
+        """Extract tables using Camelot (stream mode only on pages without ruling lines)"""
         results = []
         
         try:
-            import tempfile
-            # Save page as temp PDF for Camelot
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                temp_pdf = tmp.name
-            
-            temp_doc = fitz.open()
-            temp_doc.insert_pdf(page.parent, from_page=page_num-1, to_page=page_num-1)
-            temp_doc.save(temp_pdf)
-            temp_doc.close()
-            
-            # Try lattice mode (better for bordered tables)
-            tables = []
-            try:
-                tables = camelot.read_pdf(temp_pdf, flavor='lattice', pages='1')
-            except:
-                # Fallback to stream mode
-                try:
-                    tables = camelot.read_pdf(temp_pdf, flavor='stream', pages='1')
-                except:
-                    pass
+            import pandas as pd
+            
+            # Camelot reads only this page of the source file (at most once per page)
+            tables = self._table_session(page).camelot_tables(page_num, lattice=ruled)
             
             for idx, table in enumerate(tables):
-                df = self._postprocess_table(table.df)
+                # First row is the header, as for the other engines
+                table_data = table.df.values.tolist()
+                if len(table_data) < 2:
+                    continue
+                df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                df = self._postprocess_table(df)
                 
-                # Convert Camelot bbox to PyMuPDF coordinates
-                bbox = (table.bbox[0], page.rect.height - table.bbox[3], 
-                       table.bbox[2], page.rect.height - table.bbox[1])
+                # Convert Camelot bbox (PDF space, origin bottom-left) to PyMuPDF coordinates
+                x0, y0, x1, y1 = camelot_bbox(table)
+                bbox = (x0, page.rect.height - y1, x1, page.rect.height - y0)
                 
                 table_id = f"t_{doc_id}_p{page_num}_cm_{idx}"
+                results.append(self._build_table_result(df, bbox, table_id, page_num, doc_id, 'camelot'))
                 
-                schema = TableSchema(
-                    table_id=table_id,
-                    page=page_num,
-                    bbox=bbox,
-                    headers=df.columns.tolist(),
-                    rows=df.values.tolist(),
-                    provenance='camelot'
-                )
-                
-                unit = Unit(
-                    unit_id=f"u_{table_id}",
-                    doc_id=doc_id,
-                    page=page_num,
-                    unit_type="table",
-                    column="full",
-                    bbox=bbox,
-                    y0=bbox[1],
-                    source="camelot",
-                    anchor=f"md://u_{table_id}",
-                    content=self._table_to_markdown(df),
-                    extra={'table_id': table_id}
-                )
-                
-                results.append((schema, unit))
-            
-            # Clean up
-            if os.path.exists(temp_pdf):
-                os.remove(temp_pdf)
-                
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"Camelot failed on page {page_num}: {e}")
         
@@ -1181,208 +1460,129 @@ class PDFExtractorV2:
         """Extract tables using pdfplumber as fallback"""
         results = []
         
-        if not PDFPLUMBER_AVAILABLE:
+        if not pdfplumber_available():
             return results
         
         try:
-            import pdfplumber
-            import tempfile
-            
-            # Save page as temp PDF
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                temp_pdf = tmp.name
-            
-            temp_doc = fitz.open()
-            temp_doc.insert_pdf(page.parent, from_page=page_num-1, to_page=page_num-1)
-            temp_doc.save(temp_pdf)
-            temp_doc.close()
-            
-            # Extract with pdfplumber
-            with pdfplumber.open(temp_pdf) as pdf:
-                plumber_page = pdf.pages[0]
-                tables = plumber_page.extract_tables()
-                
-                for idx, table_data in enumerate(tables):
-                    if not table_data or len(table_data) < 2:
-                        continue
-                    
-                    # Convert to DataFrame
-                    df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                    df = self._postprocess_table(df)
-                    
-                    # Try to get actual bbox from pdfplumber table object
-                    bbox = None
-                    page_rotation = page.rotation if hasattr(page, 'rotation') else 0
-                    try:
-                        # Try to find the actual table boundaries
-                        table_settings = {
-                            'vertical_strategy': 'text', 
-                            'horizontal_strategy': 'text',
-                            'snap_tolerance': 3,
-                            'join_tolerance': 3,
-                            'edge_min_length': 5,
-                            'min_words_vertical': 3,
-                            'min_words_horizontal': 1
-                        }
-                        found_tables = plumber_page.find_tables(table_settings=table_settings)
-                        
-                        if found_tables and idx < len(found_tables):
-                            table_obj = found_tables[idx]
-                            # Get the actual bbox from the table object
-                            if hasattr(table_obj, 'bbox'):
-                                table_bbox = table_obj.bbox
-                                # Normalize pdfplumber coordinates to PyMuPDF system
-                                bbox = self.normalize_bbox(
-                                    table_bbox, 'pdfplumber', 
-                                    page.rect.width, page.rect.height, page_rotation
-                                )
-                                logger.debug(f"Table {idx} normalized bbox: {bbox}")
-                        
-                        # If bbox is still full width, try to refine it based on content
-                        if bbox and (bbox[2] - bbox[0]) >= page.rect.width * 0.8:
-                            # Table spans most of page width - try to narrow it down
-                            # Analyze the DataFrame to find actual content boundaries
-                            if len(df.columns) > 0:
-                                # Estimate based on typical table width (about 40% of page for financial tables)
-                                content_width = min(len(df.columns) * 80, page.rect.width * 0.45)
-                                # Check if table is likely on right side (common for financial data)
-                                if any(col.lower() in str(df.columns).lower() for col in ['%', 'index', 'rate', 'price']):
-                                    # Right-aligned table
-                                    x_start = page.rect.width - content_width - 50
-                                else:
-                                    # Left-aligned table
-                                    x_start = 50
-                                    
-                                bbox = (x_start, bbox[1], x_start + content_width, bbox[3])
-                                logger.debug(f"Refined table {idx} bbox: {bbox}")
-                                
-                    except Exception as e:
-                        logger.debug(f"Error getting table bbox: {e}")
-                    
-                    # Final fallback with reasonable defaults
-                    if not bbox:
-                        # Use conservative estimates
-                        estimated_width = min(len(df.columns) * 70, page.rect.width * 0.4, 300)
-                        # Alternate between left and right
-                        x_offset = 50 if idx % 2 == 0 else page.rect.width * 0.55
-                        y_base = 100 + (idx * 120)  # Better vertical spacing
-                        bbox = (x_offset, y_base, x_offset + estimated_width, y_base + len(df) * 20 + 40)
-                    
-                    table_id = f"t_{doc_id}_p{page_num}_pb_{idx}"
-                    
-                    schema = TableSchema(
-                        table_id=table_id,
-                        page=page_num,
-                        bbox=bbox,
-                        headers=df.columns.tolist(),
-                        rows=df.values.tolist(),
-                        fixes={'merged_tokens': 0},
-                        provenance='pdfplumber'
-                    )
-                    
-                    unit = Unit(
-                        unit_id=f"u_{table_id}",
-                        doc_id=doc_id,
-                        page=page_num,
-                        unit_type="table",
-                        column="full",
-                        bbox=bbox,
-                        y0=bbox[1],
-                        source="pdfplumber",
-                        anchor=f"md://u_{table_id}",
-                        content=self._table_to_markdown(df),
-                        extra={'table_id': table_id}
-                    )
-                    
-                    results.append((schema, unit))
+            import pandas as pd
+            
+            # Extract with pdfplumber (document parsed once per session)
+            plumber_page = self._table_session(page).plumber_page(page_num)
+            page_rotation = page.rotation if hasattr(page, 'rotation') else 0
             
-            # Clean up
-            if os.path.exists(temp_pdf):
-                os.remove(temp_pdf)
+            # Single layout pass: each Table object supplies both its cells and its exact bbox
+            found_tables = plumber_page.find_tables()
+            
+            for idx, table_obj in enumerate(found_tables):
+                table_data = table_obj.extract()
+                if not table_data or len(table_data) < 2:
+                    continue
+                
+                # Convert to DataFrame
+                df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                df = self._postprocess_table(df)
+                
+                # pdfplumber table bboxes are (x0, top, x1, bottom) - already top-left origin
+                bbox = self.normalize_bbox(
+                    table_obj.bbox, 'pymupdf',
+                    page.rect.width, page.rect.height, page_rotation
+                )
+                logger.debug(f"Table {idx} bbox: {bbox}")
+                
+                table_id = f"t_{doc_id}_p{page_num}_pb_{idx}"
+                results.append(self._build_table_result(df, bbox, table_id, page_num, doc_id, 'pdfplumber'))
                 
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"pdfplumber failed on page {page_num}: {e}")
         
         return results
     
-    def _postprocess_table(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Post-process table to fix merged cells and normalize"""
-        # Fix merged numerics
-        df = self._split_merged_numerics(df)
-        
-        # Normalize headers
-        df = self._normalize_headers(df)
-        
-        # Remove empty columns
-        df = df.loc[:, (df != '').any(axis=0)]
+    def _extract_tables_pymupdf(self, page: fitz.Page, page_num: int,
+                                doc_id: str) -> List[Tuple[TableSchema, Unit]]:
+        """Extract tables with PyMuPDF's native table finder (fast path, no second parser)"""
+        results = []
         
-        # Trim whitespace
-        df = df.map(lambda x: str(x).strip() if pd.notna(x) else '')
+        try:
+            import pandas as pd
+            
+            found_tables = page.find_tables().tables
+            
+            for idx, table_obj in enumerate(found_tables):
+                table_data = table_obj.extract()
+                if not table_data or len(table_data) < 2:
+                    continue
+                
+                # Cells may be None for spanned/empty cells
+                table_data = [['' if cell is None else cell for cell in row] for row in table_data]
+                df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                df = self._postprocess_table(df)
+                
+                bbox = self.normalize_bbox(
+                    tuple(table_obj.bbox), 'pymupdf',
+                    page.rect.width, page.rect.height, 0
+                )
+                
+                table_id = f"t_{doc_id}_p{page_num}_mu_{idx}"
+                results.append(self._build_table_result(df, bbox, table_id, page_num, doc_id, 'pymupdf'))
+                
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"PyMuPDF table finder failed on page {page_num}: {e}")
         
-        return df
-    
-    def _split_merged_numerics(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Split merged numeric values in cells"""
-        merged_count = 0
-        
-        def split_cell(cell):
-            nonlocal merged_count
-            if not isinstance(cell, str):
-                return cell
-            
-            # Pattern: two percentages merged like "3.00%0.50%"
-            pattern1 = r'(\d+\.?\d*%)(\d+\.?\d*%)'
-            match = re.findall(pattern1, cell)
-            if match:
-                merged_count += 1
-                return ' | '.join(match[0])
-            
-            # Pattern: two numbers merged like "44593.65 44368.5"
-            if re.match(r'^[\d\.\s]+$', cell):
-                parts = cell.split()
-                if len(parts) == 2 and all(re.match(r'^\d+\.?\d*$', p) for p in parts):
-                    merged_count += 1
-                    return ' | '.join(parts)
-            
-            # Pattern: number with parentheses (negative) like "(0.50)"
-            cell = re.sub(r'\((\d+\.?\d*)\)', r'-\1', cell)
-            
-            # Pattern: merged date-number like "11-Feb12-Feb"
-            pattern2 = r'(\d{1,2}-\w{3})(\d{1,2}-\w{3})'
-            match = re.findall(pattern2, cell)
-            if match:
-                merged_count += 1
-                return ' | '.join(match[0])
-            
-            return cell
-        
-        # Apply splitting to all cells
-        for col in df.columns:
-            df[col] = df[col].apply(split_cell)
-        
-        self.metrics['merged_tokens'] = merged_count
-        return df
+        return results
     
-    def _normalize_headers(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize table headers"""
-        # Clean headers
-        df.columns = [str(col).strip().replace('\n', ' ') for col in df.columns]
+    def _build_table_result(self, df: pd.DataFrame, bbox: Tuple, table_id: str, page_num: int,
+                            doc_id: str, source: str) -> Tuple[TableSchema, Unit]:
+        """Build the table schema and its markdown unit"""
+        schema = TableSchema(
+            table_id=table_id,
+            page=page_num,
+            bbox=bbox,
+            headers=df.columns.tolist(),
+            rows=df.values.tolist(),
+            fixes={'merged_tokens': 0},
+            provenance=source
+        )
         
-        # Remove empty header names
-        df.columns = ['Col' + str(i) if not col else col for i, col in enumerate(df.columns)]
+        unit = Unit(
+            unit_id=f"u_{table_id}",
+            doc_id=doc_id,
+            page=page_num,
+            unit_type="table",
+            column="full",
+            bbox=bbox,
+            y0=bbox[1],
+            source=source,
+            anchor=f"md://u_{table_id}",
+            content=self._table_to_markdown(df),
+            extra={'table_id': table_id}
+        )
         
+        return schema, unit
+    
+    def _postprocess_table(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Post-process table to fix merged cells and normalize"""
+        # Merged numerics, headers, empty columns and whitespace in one array pass
+        df, merged_count = clean_table(df)
+        self.metrics['merged_tokens'] += merged_count
         return df
     
     def _table_to_markdown(self, df: pd.DataFrame) -> str:
         """Convert DataFrame to markdown table"""
+        # Direct pipe-table emitter (same output as df.to_markdown(index=False))
+        markdown = frame_to_markdown(df)
+        if markdown is not None:
+            return markdown
+        
         try:
-            # Use pandas to_markdown if available (requires tabulate)
-            try:
-                import tabulate
-                return df.to_markdown(index=False)
-            except ImportError:
-                pass
-        except:
+            # pandas to_markdown (raises ImportError without tabulate)
+            return df.to_markdown(index=False)
+        except MemoryError:
+            raise
+        except Exception:
             pass
         
         # Manual markdown generation as fallback
@@ -1405,33 +1605,36 @@ class PDFExtractorV2:
     
     def _is_in_exclusion_zone(self, bbox: Tuple, exclusion_zones: List[Tuple], text: str = "") -> bool:
         """IMPROVED: Content-aware exclusion zone checking (UNIVERSAL)"""
-        for zone in exclusion_zones:
-            # Calculate simple overlap
-            x_overlap = max(0, min(bbox[2], zone[2]) - max(bbox[0], zone[0]))
-            y_overlap = max(0, min(bbox[3], zone[3]) - max(bbox[1], zone[1]))
-            
-            # If there's any significant overlap, analyze further
-            if x_overlap > 0 and y_overlap > 0:
-                overlap_area = x_overlap * y_overlap
-                bbox_area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
-                overlap_ratio = overlap_area / bbox_area if bbox_area > 0 else 0
-                
-                # UNIVERSAL: Determine if this text should be excluded based on content and position
-                is_likely_title = self._is_likely_table_title(text, bbox, zone)
-                is_likely_caption = self._is_likely_table_caption(text, bbox, zone)
-                
-                # More lenient threshold for titles/captions
-                if is_likely_title or is_likely_caption:
-                    threshold = 0.5  # 50% overlap required to exclude titles/captions
-                    logger.info(f"Text is likely {'title' if is_likely_title else 'caption'}, using lenient threshold")
-                else:
-                    threshold = 0.15  # 15% for regular text (balanced)
-                
-                if overlap_ratio > threshold:
-                    logger.info(f"Text bbox {bbox} excluded by table zone {zone} - overlap: {overlap_ratio:.2%}")
-                    return True
+        return bool(self._exclusion_mask(BBoxArray([bbox]), exclusion_zones, [text])[0])
+    
+    def _exclusion_mask(self, boxes: BBoxArray, exclusion_zones: List[Tuple], texts: List[str]) -> np.ndarray:
+        """
+        Batched content-aware exclusion: True for each box that a table zone should swallow.
         
-        return False
+        Overlap ratios (share of the box inside a zone) come from the zone grid
+        index in one array operation. A box is excluded by a zone above 50%
+        overlap, or above 15% unless its text looks like that table's title or
+        caption (UNIVERSAL: those keep the lenient 50% threshold).
+        """
+        excluded = np.zeros(len(boxes), dtype=bool)
+        if not exclusion_zones or not len(boxes):
+            return excluded
+        
+        zones = BBoxArray(exclusion_zones)
+        ratios = ZoneIndex(zones).overlap_ratio(boxes)
+        excluded = (ratios > 0.5).any(axis=1)
+        
+        # Regular text is already excluded at 15%; only titles/captions get the lenient threshold
+        for i, j in zip(*np.nonzero((ratios > 0.15) & (ratios <= 0.5))):
+            if excluded[i]:
+                continue
+            bbox, zone = tuple(boxes.data[i].tolist()), tuple(exclusion_zones[j])
+            if self._is_likely_table_title(texts[i], bbox, zone) or self._is_likely_table_caption(texts[i], bbox, zone):
+                logger.info(f"Text is likely a title/caption of table zone {zone}, using lenient threshold")
+                continue
+            excluded[i] = True
+        
+        return excluded
     
     def _is_likely_table_title(self, text: str, text_bbox: Tuple, table_zone: Tuple) -> bool:
         """UNIVERSAL: Check if text is likely a table title"""
@@ -1477,35 +1680,11 @@ class PDFExtractorV2:
     
     def _horizontal_overlap(self, bbox1: Tuple, bbox2: Tuple) -> float:
         """Calculate horizontal overlap ratio"""
-        x0 = max(bbox1[0], bbox2[0])
-        x1 = min(bbox1[2], bbox2[2])
-        
-        if x0 >= x1:
-            return 0.0
-        
-        width1 = bbox1[2] - bbox1[0]
-        if width1 == 0:
-            return 0.0
-        
-        return (x1 - x0) / width1
+        return float(BBoxArray([bbox1]).horizontal_overlap(BBoxArray([bbox2]))[0, 0])
     
     def _bbox_overlap(self, bbox1: Tuple, bbox2: Tuple) -> float:
         """Calculate overlap ratio between two bboxes"""
-        x0 = max(bbox1[0], bbox2[0])
-        y0 = max(bbox1[1], bbox2[1])
-        x1 = min(bbox1[2], bbox2[2])
-        y1 = min(bbox1[3], bbox2[3])
-        
-        if x0 >= x1 or y0 >= y1:
-            return 0.0
-        
-        intersection = (x1 - x0) * (y1 - y0)
-        area1 = (bbox1[2] - bbox1[0]) * (bbox1[3] - bbox1[1])
-        
-        if area1 == 0:
-            return 0.0
-        
-        return intersection / area1
+        return float(BBoxArray([bbox1]).overlap_ratio(BBoxArray([bbox2]))[0, 0])
     
     def _build_paragraphs(self, text_blocks: List[Dict], columns: Dict,
                          page_num: int, doc_id: str) -> List[Unit]:
@@ -1687,83 +1866,148 @@ class PDFExtractorV2:
         
         return is_scan
     
+    def _prepare_ocr_crop(self, fig_block: Dict, page: fitz.Page, page_num: int,
+                          artefacts_dir: Path) -> Tuple[Any, int]:
+        """Enhanced grayscale PIL crop of an image block as handed to Tesseract, plus its DPI"""
+        bbox = fig_block['bbox']
+        
+        # Crop at the DPI the text in this block needs (from the page raster when one is already rendered)
+        dpi = self._plan_ocr_dpi(page, page_num, bbox, default_dpi=int(72 * IMAGE_OCR_ZOOM))
+        pix = self.render_cache.crop(page, bbox, self.ocr_dpi, dpi / 72.0, gray=True)
+        
+        # Save crop for debugging
+        crop_filename = f"page{page_num}_img_ocr_{int(bbox[0])}_{int(bbox[1])}.png"
+        crop_path = artefacts_dir / "crops" / crop_filename
+        pix.save(str(crop_path))
+        
+        # PREPROCESSING for better OCR (UNIVERSAL approach), straight on the sample buffer
+        # 1. Grayscale (rendered in gray colorspace)
+        # 2. Enhance contrast (helps with faded text)
+        # 3. Sharpen (helps with blurry text)
+        from PIL import Image
+        
+        gray = pixmap_to_array(pix)
+        img = Image.fromarray(enhance_for_ocr(gray, contrast=1.5))
+        del gray  # release the view before the pixmap goes away
+        return img, dpi
+    
+    def _ocr_image_blocks_composite(self, ocr_blocks: List[Tuple[int, Dict]], page: fitz.Page, page_num: int,
+                                    doc_id: str, artefacts_dir: Path) -> Dict[int, Optional[str]]:
+        """
+        OCR a page's image blocks with small crops packed into composite canvases.
+        
+        Small crops share one Tesseract pass per canvas; words are mapped back to
+        their crop by position. Crops that are too large, come back empty, or
+        fall below image_ocr_min_confidence go through _ocr_image_block as usual.
+        
+        Returns:
+            fig_idx -> OCR text (None when nothing was recognized)
+        """
+        images = {}
+        for fig_idx, fig_block in ocr_blocks:
+            try:
+                images[fig_idx] = self._prepare_ocr_crop(fig_block, page, page_num, artefacts_dir)
+            except MemoryError:
+                raise
+            except Exception as e:
+                logger.warning(f"Image crop failed for block at {fig_block['bbox']}: {e}")
+        
+        small = [(fig_idx, img) for fig_idx, (img, _) in images.items() if is_small_crop(img)]
+        results: Dict[int, Optional[str]] = {}
+        
+        if len(small) > 1:
+            try:
+                canvases = pack_crops(small)
+                canvas_dpi = max(images[fig_idx][1] for fig_idx, _ in small)
+                words = self._run_tesseract_many(
+                    [(canvas, '--oem 3 --psm 3', canvas_dpi, None) for canvas, _ in canvases],
+                    output='data'
+                )
+                self.metrics['ocr_composite_canvases'] += len(canvases)
+                self.metrics['ocr_composite_crops'] += len(small)
+                
+                for (_, slots), canvas_words in zip(canvases, words):
+                    for fig_idx, (text, confidence) in split_words(canvas_words, slots).items():
+                        if text.strip() and confidence >= self.image_ocr_min_confidence:
+                            results[fig_idx] = self._post_process_ocr_text(text) or None
+                        else:
+                            self.metrics['ocr_composite_fallbacks'] += 1
+                
+                logger.info(f"Page {page_num}: composite OCR covered {len(results)}/{len(small)} small crops "
+                            f"in {len(canvases)} pass(es)")
+            except MemoryError:
+                raise
+            except Exception as e:
+                logger.warning(f"Composite OCR failed on page {page_num}, OCR'ing crops one by one: {e}")
+                results = {}
+        
+        for fig_idx, fig_block in ocr_blocks:
+            if fig_idx not in results and fig_idx in images:
+                results[fig_idx] = self._ocr_image_block(
+                    fig_block, page, page_num, doc_id, artefacts_dir, crop=images[fig_idx]
+                )
+        return results
+    
     def _ocr_image_block(self, fig_block: Dict, page: fitz.Page, page_num: int,
-                        doc_id: str, artefacts_dir: Path) -> Optional[str]:
+                        doc_id: str, artefacts_dir: Path, crop: Optional[Tuple[Any, int]] = None) -> Optional[str]:
         """UNIVERSAL: OCR text from image blocks (headers, banners, embedded images)"""
-        if not TESSERACT_AVAILABLE:
+        if not tesseract_available():
             return None
         
         try:
             bbox = fig_block['bbox']
             logger.info(f"OCR processing image at {bbox}")
             
-            # Crop image with high zoom for better OCR accuracy
-            zoom = 2.5  # Higher zoom for small text
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, clip=fitz.Rect(bbox))
+            img, dpi = crop or self._prepare_ocr_crop(fig_block, page, page_num, artefacts_dir)
             
-            # Save crop for debugging
-            crop_filename = f"page{page_num}_img_ocr_{int(bbox[0])}_{int(bbox[1])}.png"
-            crop_path = artefacts_dir / "crops" / crop_filename
-            pix.save(str(crop_path))
+            # Same pixels go through every PSM below - digest once for the OCR cache
+            digest = image_digest(img.tobytes(), img.width, img.height, img.mode) if self.ocr_cache else None
             
-            # Convert to PIL Image for preprocessing
-            img_data = pix.tobytes("png")
-            from PIL import Image, ImageEnhance, ImageFilter
-            import io
+            # Likeliest PSM for this crop's shape/position first (UNIVERSAL - works for any language/layout)
+            page_rect = page.rect
+            ladder = rank_psm_ladder(self.image_psm_ladder, bbox, (page_rect.width, page_rect.height))
+            if not ladder:
+                return None
             
-            img = Image.open(io.BytesIO(img_data))
-            
-            # PREPROCESSING for better OCR (UNIVERSAL approach)
-            # 1. Convert to grayscale
-            if img.mode != 'L':
-                img = img.convert('L')
+            def run_modes(psms):
+                return self._run_tesseract_many(
+                    [(img, f'--oem 3 --psm {psm}', dpi, digest) for psm in psms],
+                    output='confidence'
+                )
             
-            # 2. Enhance contrast (helps with faded text)
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.5)
+            self.metrics['ocr_image_crops'] += 1
+            tried = [ladder[0]]
+            results = run_modes(tried)
+            first_text, first_conf = results[0]
             
-            # 3. Sharpen (helps with blurry text)
-            img = img.filter(ImageFilter.SHARPEN)
+            if first_text.strip() and first_conf >= self.image_ocr_min_confidence:
+                self.metrics['ocr_image_early_exits'] += 1
+            elif len(ladder) > 1:
+                # Not confident enough: remaining candidates go out as one batch (runs across the OCR workers)
+                tried += ladder[1:]
+                results += run_modes(ladder[1:])
             
-            # Try multiple OCR configurations (UNIVERSAL - works for any language/layout)
-            best_result = None
-            max_confidence = 0
+            best_index = pick_best(results)
             
-            configs = [
-                ('--oem 3 --psm 7', 'single_line'),      # Best for headers/banners
-                ('--oem 3 --psm 6', 'uniform_block'),    # Best for paragraphs
-                ('--oem 3 --psm 11', 'sparse_text'),     # Best for scattered text
-                ('--oem 3 --psm 13', 'raw_line'),        # Best for single raw line
-            ]
+            for psm in tried:
+                self.metrics[f'ocr_mode_tried_{PSM_MODE_NAMES.get(psm, f"psm_{psm}")}'] += 1
+            if best_index is None:
+                return None
             
-            for config, mode in configs:
-                try:
-                    result = pytesseract.image_to_string(
-                        img, 
-                        lang=self.ocr_lang,
-                        config=config
-                    )
-                    
-                    if result:
-                        result = self._post_process_ocr_text(result)
-                        # Estimate confidence (more meaningful text = better)
-                        confidence = len(result.strip())
-                        
-                        if confidence > max_confidence:
-                            max_confidence = confidence
-                            best_result = result
-                            logger.info(f"OCR mode '{mode}' got {confidence} chars: '{result[:80]}'")
-                
-                except Exception as e:
-                    logger.debug(f"OCR mode '{mode}' failed: {e}")
+            best_mode = PSM_MODE_NAMES.get(tried[best_index], f'psm_{tried[best_index]}')
+            best_text, best_conf = results[best_index]
+            self.metrics[f'ocr_mode_won_{best_mode}'] += 1
             
-            if best_result:
-                logger.info(f"Best OCR result ({max_confidence} chars): '{best_result[:150]}'")
-                return best_result
+            best_result = self._post_process_ocr_text(best_text)
+            if not best_result.strip():
+                return None
             
-            return None
+            logger.info(f"Best OCR result (mode '{best_mode}', conf {best_conf:.0f}, "
+                        f"{len(tried)}/{len(ladder)} modes): '{best_result[:150]}'")
+            return best_result
         
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"Image OCR failed: {e}")
             return None
@@ -1774,32 +2018,70 @@ class PDFExtractorV2:
         # Text-only pipeline - skip figure processing
         return None
     
+    def _plan_ocr_dpi(self, page: fitz.Page, page_num: int, bbox: Optional[Tuple] = None,
+                      default_dpi: Optional[int] = None) -> int:
+        """
+        OCR DPI for a page (or a bbox on it) from the x-height measured on a
+        low-DPI probe raster; default_dpi (ocr_dpi) when adaptive DPI is off or
+        nothing measurable is found. The choice is logged and recorded per page.
+        """
+        default_dpi = default_dpi or self.ocr_dpi
+        if not self.adaptive_ocr_dpi or not CV2_AVAILABLE:
+            return default_dpi
+        
+        probe = self.render_cache.page_pixmap(page, PROBE_DPI, gray=True)
+        gray = pixmap_to_array(probe)
+        if bbox is not None:
+            to_pixels = page.rotation_matrix * fitz.Matrix(PROBE_DPI / 72.0, PROBE_DPI / 72.0)
+            region = (fitz.Rect(bbox) * to_pixels).irect & probe.irect
+            gray = gray[region.y0:region.y1, region.x0:region.x1] if not region.is_empty else gray[:0]
+        x_height = estimate_x_height(gray, PROBE_DPI)
+        del gray  # release the view before the pixmap goes away
+        
+        dpi = plan_dpi(x_height, default_dpi, self.ocr_min_dpi, self.ocr_max_dpi)
+        target = 'page' if bbox is None else f"block at ({bbox[0]:.0f}, {bbox[1]:.0f})"
+        if x_height:
+            logger.info(f"Page {page_num}: OCR DPI {dpi} for {target} (x-height ~{x_height:.1f}pt)")
+        else:
+            logger.info(f"Page {page_num}: OCR DPI {dpi} for {target} (no measurable glyphs, default)")
+        
+        if bbox is None:
+            self.metrics[f'ocr_dpi_p{page_num}'] = dpi
+        else:
+            self.metrics['ocr_crop_dpi_total'] += dpi
+            self.metrics['ocr_crop_dpi_count'] += 1
+        return dpi
+    
     def _ocr_full_page(self, page: fitz.Page, page_num: int, artefacts_dir: Path) -> Optional[str]:
         """OPTIMIZED OCR full page - faster and more accurate"""
-        if not TESSERACT_AVAILABLE:
+        if not tesseract_available():
             return None
         
         try:
-            # PERFORMANCE OPTIMIZATION 1: Use optimal DPI (300 vs 400)
-            # 300 DPI is sweet spot for speed vs quality
-            mat = fitz.Matrix(300 / 72.0, 300 / 72.0)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # PERFORMANCE OPTIMIZATION 2: Direct memory OCR (no temp files!)
-            # Convert pixmap to PIL Image in memory
-            img_data = pix.tobytes("png")
-            from PIL import Image
-            import io
-            
-            img = Image.open(io.BytesIO(img_data))
-            
-            # PERFORMANCE + ACCURACY OPTIMIZATION: Balanced OCR config
-            # PSM 6: Uniform block of text (better for structured docs)
-            final_text = pytesseract.image_to_string(
-                img,
-                lang=self.ocr_lang,
-                config='--oem 3 --psm 6 -c preserve_interword_spaces=1 -c tessedit_create_hocr=0'
-            )
+            # PERFORMANCE OPTIMIZATION 1: Smallest DPI that resolves this page's glyphs
+            # (planned from a low-DPI probe; ocr_dpi when nothing measurable)
+            dpi = self._plan_ocr_dpi(page, page_num)
+            pix = self.render_cache.page_pixmap(page, dpi, gray=True)
+            
+            final_text = None
+            if self.ocr_text_regions:
+                # PERFORMANCE OPTIMIZATION 2: only inked text regions reach Tesseract
+                try:
+                    final_text = self._ocr_text_regions(pix, page_num, dpi)
+                except MemoryError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Text-region detection failed on page {page_num}, OCR'ing whole page: {e}")
+            
+            if final_text is None:
+                # PERFORMANCE OPTIMIZATION 3: Direct memory OCR (no temp files, no PNG round-trip)
+                img = pixmap_to_image(pix)
+                
+                # PERFORMANCE + ACCURACY OPTIMIZATION: Profile PSM ladder
+                # Primary PSM first; fallbacks only run when it returns nothing
+                final_text = self._run_tesseract_ladder(
+                    img, extra_config='-c preserve_interword_spaces=1 -c tessedit_create_hocr=0', dpi=dpi
+                )
             
             # ACCURACY OPTIMIZATION: Enhanced post-processing
             if final_text:
@@ -1807,10 +2089,144 @@ class PDFExtractorV2:
             
             return final_text.strip() if final_text else None
             
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"OCR failed on page {page_num}: {e}")
             return None
     
+    def _ocr_text_regions(self, pix: fitz.Pixmap, page_num: int, dpi: int) -> str:
+        """
+        OCR a scanned page region by region.
+        
+        The gray page raster is binarized, deskewed and split into text blocks
+        (see text_regions); blocks go to Tesseract as one batch (spread over the
+        OCR workers) with PSM 6 and are joined in reading order. Blank margins
+        and photo regions are never OCR'd.
+        
+        Per-page pixel coverage and an estimate of the time saved versus a
+        whole-page pass (OCR cost taken as proportional to pixel area) are
+        recorded in metrics.
+        """
+        from PIL import Image
+        
+        detect_start = time.time()
+        gray = pixmap_to_array(pix)
+        regions = detect_text_regions(gray, dpi)
+        images = [Image.fromarray(np.ascontiguousarray(crop)) for crop in regions.crops()]
+        coverage = regions.pixel_coverage
+        skew_angle = regions.skew_angle
+        photo_regions = regions.photo_regions
+        del gray, regions  # release views of the pixmap
+        detect_time = time.time() - detect_start
+        
+        ocr_start = time.time()
+        texts = self._run_tesseract_many([
+            (img, '--oem 3 --psm 6 -c preserve_interword_spaces=1', dpi, None)
+            for img in images
+        ])
+        ocr_time = time.time() - ocr_start
+        
+        # Whole-page OCR would have processed 1/coverage times the pixels
+        time_saved = (ocr_time / coverage - ocr_time - detect_time) if coverage > 0 else 0.0
+        
+        self.metrics['scan_region_pages'] += 1
+        self.metrics['scan_regions'] += len(images)
+        self.metrics['scan_photo_regions_skipped'] += photo_regions
+        self.metrics['scan_region_detect_time'] += detect_time
+        self.metrics['scan_region_time_saved_est'] += time_saved
+        self.metrics[f'scan_region_coverage_p{page_num}'] = round(coverage, 4)
+        self.metrics[f'scan_region_time_saved_p{page_num}'] = round(time_saved, 3)
+        
+        logger.info(f"Page {page_num}: {len(images)} text regions, {coverage:.1%} of pixels OCR'd, "
+                    f"skew {skew_angle:.2f}°, {photo_regions} photo regions skipped, "
+                    f"~{time_saved:.2f}s saved")
+        
+        return '\n\n'.join(text.strip() for text in texts if text and text.strip())
+    
+    def _run_tesseract_ladder(self, img, extra_config: str = '', dpi: Optional[int] = None) -> str:
+        """Page-level OCR: primary PSM, then fallback PSMs until one returns text"""
+        ladder = [self.ocr_primary_psm] + [psm for psm in self.ocr_fallback_psm if psm != self.ocr_primary_psm]
+        digest = image_digest(img.tobytes(), img.width, img.height, img.mode) if self.ocr_cache else None
+        
+        text = ''
+        for psm in ladder:
+            text = self._run_tesseract(
+                img,
+                config=f'--oem 3 --psm {psm} {extra_config}'.strip(),
+                dpi=dpi or self.ocr_dpi,
+                digest=digest
+            )
+            if text and text.strip():
+                break
+            logger.info(f"PSM {psm} returned no text, trying next PSM")
+        return text
+    
+    def _run_tesseract(self, img, config: str, dpi: int, digest: Optional[str] = None) -> str:
+        """Run Tesseract on a PIL image, served from the persistent OCR cache when possible"""
+        return self._run_tesseract_many([(img, config, dpi, digest)])[0]
+    
+    def _run_tesseract_many(self, requests: List[Tuple[Any, str, int, Optional[str]]],
+                            output: str = 'text') -> List[Any]:
+        """
+        OCR a batch of (image, config, dpi, digest) requests.
+        
+        Cache hits are answered directly; misses go to the persistent OCR worker
+        pool in one batch (or to this process's long-lived engine when the pool
+        is disabled). Results are returned in request order: strings, or
+        (text, mean word confidence) pairs / word-box dicts for output
+        'confidence' / 'data'. Requests that failed in a worker come back empty
+        and are not cached.
+        """
+        results: List[Any] = [None] * len(requests)
+        keys: List[Optional[str]] = [None] * len(requests)
+        misses = []
+        
+        for i, (img, config, dpi, digest) in enumerate(requests):
+            if self.ocr_cache is not None:
+                if digest is None:
+                    digest = image_digest(img.tobytes(), img.width, img.height, img.mode)
+                # Structured results are cached under their own key (stored as JSON)
+                key_config = config if output == 'text' else f'{config} +{output}'
+                keys[i] = OCRCache.make_key(digest, self.ocr_lang, key_config, dpi)
+                cached = self.ocr_cache.get(keys[i])
+                if cached is not None:
+                    self.metrics['ocr_cache_hits'] += 1
+                    if output == 'text':
+                        results[i] = cached
+                    else:
+                        value = json.loads(cached)
+                        results[i] = tuple(value) if output == 'confidence' else value
+                    continue
+                self.metrics['ocr_cache_misses'] += 1
+            misses.append(i)
+        
+        if misses:
+            self.metrics['ocr_calls'] += len(misses)
+            if self.ocr_pool_workers > 0:
+                pool = get_ocr_pool(self.ocr_lang, self.ocr_pool_workers)
+                texts = pool.run_batch(
+                    [make_request(requests[i][0], requests[i][1]) for i in misses],
+                    output=output
+                )
+                self.metrics['ocr_pool_batches'] += 1
+            else:
+                if self.ocr_engine is None:
+                    self.ocr_engine = OCREngine(self.ocr_lang)
+                texts = [self.ocr_engine.run(requests[i][0], requests[i][1], output) for i in misses]
+            
+            for i, text in zip(misses, texts):
+                if text is None:
+                    # Failed in an OCR worker: answer empty, but never cache it
+                    self.metrics['ocr_failures'] += 1
+                    results[i] = empty_result(output)
+                    continue
+                results[i] = text
+                if keys[i] is not None:
+                    self.ocr_cache.set(keys[i], text if output == 'text' else json.dumps(text))
+        
+        return results
+    
     def _post_process_ocr_text(self, text: str) -> str:
         """IMPROVED OCR text post-processing - preserving structure"""
         import re
@@ -1977,66 +2393,21 @@ class PDFExtractorV2:
         properties['has_tables'] = any(u.unit_type == 'table' for u in all_units)
         properties['has_images'] = any(u.source in ['ocr_image', 'ocr'] for u in all_units)
         
-        # UNIVERSAL DATE EXTRACTION (multiple formats)
-        date_patterns = [
-            # Indonesian dates: "13 Februari 2025", "17 Maret 2024"
-            r'\b(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+(\d{4})\b',
-            # With day names: "Kamis, 13 Februari 2025"
-            r'\b(Senin|Selasa|Rabu|Kamis|Jumat|Sabtu|Minggu),?\s+(\d{1,2})\s+(Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember)\s+(\d{4})\b',
-            # English dates: "January 13, 2025", "March 17, 2024"
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})\b',
-            # ISO format: "2025-02-13"
-            r'\b(\d{4})[-/](\d{1,2})[-/](\d{1,2})\b',
-            # Short format: "13/02/2025", "17-03-2024"
-            r'\b(\d{1,2})[-/](\d{1,2})[-/](\d{4})\b',
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    date_str = ' '.join(str(m) for m in match if m)
-                else:
-                    date_str = str(match)
-                properties['dates'].append(date_str)
-        
-        # Deduplicate dates
-        properties['dates'] = list(set(properties['dates']))[:20]  # Top 20 dates
-        
-        # UNIVERSAL TEMPORAL REFERENCES
-        temporal_patterns = [
-            r'\b(Q[1-4]\s+\d{4})\b',  # "Q1 2025"
-            r'\b(FY\s*\d{4})\b',  # "FY2025"
-            r'\b(tahun\s+\d{4})\b',  # "tahun 2025"
-            r'\b(year\s+\d{4})\b',  # "year 2025"
-        ]
-        
-        for pattern in temporal_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            properties['temporal_references'].extend(matches)
+        # UNIVERSAL DATE EXTRACTION (multiple formats, one pass; see shared.patterns)
+        # Values are deduplicated in order of first occurrence; scans stop once the limit is reached
+        properties['dates'] = unique(iter_dates(full_text), 20)  # Top 20 dates
         
-        properties['temporal_references'] = list(set(properties['temporal_references']))[:10]
+        # UNIVERSAL TEMPORAL REFERENCES ("Q1 2025", "FY2025", "tahun 2025", "year 2025")
+        properties['temporal_references'] = unique(TEMPORAL_PATTERN.findall(full_text), 10)
         
         # UNIVERSAL NUMBER EXTRACTION (percentages, currency, large numbers)
-        number_patterns = [
-            r'\b(\d+[,.]\d+)%',  # Percentages: "5.75%"
-            r'\b(\d{1,3}(?:[,.]\d{3})*(?:[,.]\d+)?)\b',  # Numbers with separators
-        ]
-        
-        for pattern in number_patterns:
-            matches = re.findall(pattern, full_text)
-            properties['numbers'].extend(matches)
-        
-        # Deduplicate and limit
-        properties['numbers'] = list(set(properties['numbers']))[:30]
+        properties['numbers'] = unique(iter_numbers(full_text), 30)
         
         # UNIVERSAL URL EXTRACTION
-        url_pattern = r'https?://[^\s<>"]+|www\.[^\s<>"]+'
-        properties['urls'] = list(set(re.findall(url_pattern, full_text, re.IGNORECASE)))[:10]
+        properties['urls'] = unique(URL_PATTERN.findall(full_text), 10)
         
         # UNIVERSAL EMAIL EXTRACTION
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        properties['emails'] = list(set(re.findall(email_pattern, full_text)))[:10]
+        properties['emails'] = unique(EMAIL_PATTERN.findall(full_text), 10)
         
         # UNIVERSAL DOCUMENT TYPE CLASSIFICATION (keyword-based)
         doc_type_keywords = {
@@ -2060,8 +2431,9 @@ class PDFExtractorV2:
         indonesian_words = ['dan', 'yang', 'untuk', 'dengan', 'pada', 'adalah', 'dari', 'ini', 'dalam']
         english_words = ['and', 'the', 'for', 'with', 'this', 'that', 'from', 'are', 'was', 'were']
         
-        id_count = sum(1 for word in indonesian_words if f' {word} ' in f' {text_lower} ')
-        en_count = sum(1 for word in english_words if f' {word} ' in f' {text_lower} ')
+        padded_text = f' {text_lower} '
+        id_count = sum(1 for word in indonesian_words if f' {word} ' in padded_text)
+        en_count = sum(1 for word in english_words if f' {word} ' in padded_text)
         
         if id_count > en_count:
             properties['language'] = 'indonesian'
@@ -2107,7 +2479,9 @@ class PDFExtractorV2:
         if yaml_available:
             try:
                 yaml_str = yaml.dump(frontmatter, allow_unicode=True, default_flow_style=False, sort_keys=False)
-            except:
+            except MemoryError:
+                raise
+            except Exception:
                 yaml_str = self._manual_yaml_generation(frontmatter)
         else:
             yaml_str = self._manual_yaml_generation(frontmatter)
@@ -2172,10 +2546,40 @@ class PDFExtractorV2:
                     'percent': percent,
                     'message': message
                 }, f, ensure_ascii=False)
+        except MemoryError:
+            raise
         except Exception as e:
             logger.warning(f"Failed to update progress: {e}")
 
 
+# Page worker state (one extractor + open document per worker process)
+_page_worker_state: Dict[str, Any] = {}
+
+
+def _init_page_worker(extractor_kwargs: Dict[str, Any], pdf_path: str, log_path: str,
+                      repeated_images: Optional[Dict[int, List[Tuple]]] = None):
+    """Initializer for page-parallel worker processes"""
+    file_handler = logging.FileHandler(log_path, mode='a')
+    file_handler.setLevel(logging.INFO)
+    logger.addHandler(file_handler)
+    
+    _page_worker_state['extractor'] = PDFExtractorV2(**extractor_kwargs)
+    _page_worker_state['extractor'].repeated_images = repeated_images or {}
+    _page_worker_state['doc'] = fitz.open(pdf_path)
+
+
+def _process_page_in_worker(page_index: int, doc_id: str, artefacts_dir: str):
+    """Process one page inside a worker and return its results plus metric deltas"""
+    extractor: PDFExtractorV2 = _page_worker_state['extractor']
+    doc = _page_worker_state['doc']
+    
+    extractor.metrics = defaultdict(int)
+    page_units, page_tables, page_figures = extractor._process_page(
+        doc[page_index], page_index + 1, doc_id, Path(artefacts_dir)
+    )
+    return page_units, page_tables, page_figures, dict(extractor.metrics)
+
+
 # Public API for Phase-0 extraction
 def extract_pdf_to_markdown(
     doc_id: str,
@@ -2185,17 +2589,38 @@ def extract_pdf_to_markdown(
     ocr_lang: str = "ind+eng",
     ocr_primary_psm: int = 3,
     ocr_fallback_psm: list = None,
+    ocr_dpi: int = 300,
+    adaptive_ocr_dpi: bool = True,
+    ocr_min_dpi: int = 150,
+    ocr_max_dpi: int = 400,
+    image_psm_ladder: Optional[list] = None,
+    image_ocr_min_confidence: float = 70.0,
+    composite_image_ocr: bool = False,
+    ocr_text_regions: bool = True,
     dpi_fullpage: int = 300,
+    render_debug_pages: bool = False,
     zoom_clip: float = 2.0,
     enable_pdfplumber_fallback: bool = True,
+    table_engine: str = "pdfplumber",
+    table_engines: Optional[list] = None,
     min_table_area_ratio: float = 0.01,
     header_footer_mode: str = "auto",
     header_margin_pct: float = 0.05,
     footer_margin_pct: float = 0.05,
     max_ocr_crops_per_page: int = 12,
+    skip_text_covered_images: bool = True,
+    remove_repeated_furniture: bool = True,
+    furniture_min_pages: int = 3,
+    units_json_export: bool = True,
     figure_min_area_ratio: float = 0.003,
     column_split_strategy: str = "histogram",
     include_debug_anchors: bool = False,
+    page_workers: int = 1,
+    enable_ocr_cache: bool = True,
+    ocr_cache_max_mb: float = 256,
+    ocr_cache_dir: Optional[str] = None,
+    ocr_pool_workers: int = 0,
+    extraction_profile: Optional[str] = None,
 ) -> ExtractionResult:
     """
     Public API for PDF to Markdown extraction with advanced layout analysis.
@@ -2207,16 +2632,45 @@ def extract_pdf_to_markdown(
         ocr_lang: OCR language(s), default "ind+eng" for Indonesian+English
         ocr_primary_psm: Primary PSM mode for Tesseract (3=auto)
         ocr_fallback_psm: List of fallback PSM modes, default [6, 11]
+        ocr_dpi: Raster DPI for OCR when no glyph size can be measured (or adaptive DPI is off)
+        adaptive_ocr_dpi: Choose the OCR DPI per page/image block from the x-height measured
+            on a low-DPI probe
+        ocr_min_dpi: Lower bound for adaptive OCR DPI
+        ocr_max_dpi: Upper bound for adaptive OCR DPI
+        image_psm_ladder: PSM modes tried on image-block crops, default [7, 6, 11, 13]
+        image_ocr_min_confidence: Mean word confidence (0-100) at which the first PSM
+            tried on a crop is accepted without running the rest of the ladder
+        composite_image_ocr: Pack each page's small image crops into one canvas and OCR
+            them in a single pass (text is mapped back to the individual crops)
+        ocr_text_regions: Full-page OCR detects, deskews and OCRs only text regions
+            (OpenCV); blank margins and photos are skipped
         dpi_fullpage: DPI for full page rendering
+        render_debug_pages: Debug option - write pages/page-N.png for every page
+            (previews are otherwise served on demand by the API)
         zoom_clip: Zoom factor for figure crops
         enable_pdfplumber_fallback: Enable pdfplumber as table fallback
+        table_engine: "pdfplumber" (default) or "pymupdf" for PyMuPDF's native table finder
+        table_engines: Table engines tried in order (default: [table_engine, "camelot"])
         min_table_area_ratio: Minimum table area ratio to process
         header_footer_mode: "auto" or "margin" for header/footer removal
         header_margin_pct: Top margin percentage for header removal
         footer_margin_pct: Bottom margin percentage for footer removal
         max_ocr_crops_per_page: Maximum figure crops per page for OCR
+        skip_text_covered_images: Don't OCR images whose area the PDF text layer already covers
+        remove_repeated_furniture: Detect headers, footers, banners and disclaimers repeated
+            across pages; repeated images skip OCR and repeated text is kept only once
+        furniture_min_pages: Pages a block or image must repeat on to count as furniture
+        units_json_export: Also write units_metadata.json (legacy export; units.npz is
+            always written and is what enhancement reads)
         figure_min_area_ratio: Minimum figure area ratio to process
         column_split_strategy: "histogram" or "kmeans2" for column detection
+        page_workers: Worker processes for page-parallel extraction (1 = serial)
+        enable_ocr_cache: Reuse OCR text for identical pixels across pages/documents
+        ocr_cache_max_mb: Size budget of the on-disk OCR cache before LRU eviction
+        ocr_cache_dir: Directory of the OCR cache (default: ./cache/ocr or $OCR_CACHE_DIR)
+        ocr_pool_workers: Persistent OCR worker processes (0 = OCR in the extracting process;
+            ignored without tesserocr)
+        extraction_profile: Name of the speed profile these settings came from (recorded in metrics.json)
     
     Returns:
         ExtractionResult with paths to markdown and metadata files
@@ -2229,25 +2683,60 @@ def extract_pdf_to_markdown(
         ocr_lang=ocr_lang,
         ocr_primary_psm=ocr_primary_psm,
         ocr_fallback_psm=ocr_fallback_psm,
+        ocr_dpi=ocr_dpi,
+        adaptive_ocr_dpi=adaptive_ocr_dpi,
+        ocr_min_dpi=ocr_min_dpi,
+        ocr_max_dpi=ocr_max_dpi,
+        image_psm_ladder=image_psm_ladder,
+        image_ocr_min_confidence=image_ocr_min_confidence,
+        composite_image_ocr=composite_image_ocr,
+        ocr_text_regions=ocr_text_regions,
         dpi_fullpage=dpi_fullpage,
+        render_debug_pages=render_debug_pages,
         zoom_clip=zoom_clip,
         enable_pdfplumber_fallback=enable_pdfplumber_fallback,
+        table_engine=table_engine,
+        table_engines=table_engines,
         min_table_area_ratio=min_table_area_ratio,
         header_footer_mode=header_footer_mode,
         header_margin_pct=header_margin_pct,
         footer_margin_pct=footer_margin_pct,
         max_ocr_crops_per_page=max_ocr_crops_per_page,
+        skip_text_covered_images=skip_text_covered_images,
+        remove_repeated_furniture=remove_repeated_furniture,
+        furniture_min_pages=furniture_min_pages,
+        units_json_export=units_json_export,
         figure_min_area_ratio=figure_min_area_ratio,
         column_split_strategy=column_split_strategy,
         include_debug_anchors=include_debug_anchors,
+        page_workers=page_workers,
+        enable_ocr_cache=enable_ocr_cache,
+        ocr_cache_max_mb=ocr_cache_max_mb,
+        ocr_cache_dir=ocr_cache_dir,
+        ocr_pool_workers=ocr_pool_workers,
+        extraction_profile=extraction_profile,
     )
     
     # Run extraction
     if original_filename is None:
         original_filename = Path(pdf_path).name
-    return extractor.extract(
-        doc_id=doc_id,
-        pdf_path=pdf_path,
-        out_dir=out_dir,
-        original_filename=original_filename,
-    )
+    try:
+        return extractor.extract(
+            doc_id=doc_id,
+            pdf_path=pdf_path,
+            out_dir=out_dir,
+            original_filename=original_filename,
+        )
+    finally:
+        # Long-lived processes (API threads, extraction pool workers) extract many
+        # documents; stop writing later documents into this one's extract.log
+        _detach_log_handler(Path(out_dir) / doc_id / "logs" / "extract.log")
+
+
+def _detach_log_handler(log_path: Path):
+    """Close and remove the file handler extract() attached for `log_path`"""
+    target = os.path.abspath(log_path)
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename == target:
+            logger.removeHandler(handler)
+            handler.close()
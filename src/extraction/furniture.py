@@ -0,0 +1,229 @@
+"""
+Cross-Page Furniture Detection
+
+Page furniture - running headers and footers, slide banners, logos and the
+disclaimer pasted under every chart - repeats on page after page. The per-page
+header/footer filter only looks at fixed margin bands of one page, so these
+blocks otherwise reach the markdown once per page and are tokenized, enhanced
+and embedded again each time.
+
+This module works on the whole document:
+
+- ``find_repeated_images`` fingerprints embedded images by their content
+  digest (``page.get_image_info(hashes=True)``) and display size. An image
+  found on ``min_pages`` or more pages is furniture; every occurrence after
+  the first is skipped before OCR.
+- ``find_repeated_units`` fingerprints extracted units by normalized text
+  (case, whitespace and digits folded, so page numbers and dates do not
+  break a match) and position. Text that sits at the same place on
+  ``min_pages`` or more pages and is long enough to be boilerplate, or that
+  sits inside the top/bottom band on at least half of the pages, is
+  furniture; the first occurrence is kept.
+
+Short labels that recur in body text ("Saham", "Key Highlights", "5%") are
+never furniture: they need letters, a minimum length and a stable position.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Default number of pages a block must repeat on to count as furniture
+DEFAULT_MIN_PAGES = 3
+# Header/footer band height as a fraction of the page height
+BAND_RATIO = 0.15
+# Share of the document's pages short band text must repeat on
+BAND_MIN_COVERAGE = 0.5
+# Position tolerance between occurrences of the same block (points)
+POSITION_TOLERANCE = 12.0
+# Minimum normalized length for any furniture text; outside the bands a
+# block must be at least BODY_MIN_CHARS long (disclaimers, source notes)
+MIN_CHARS = 12
+BODY_MIN_CHARS = 80
+MIN_LETTERS = 6
+# Image display sizes are compared on this grid (points)
+IMAGE_SIZE_GRID = 4.0
+
+_WHITESPACE = re.compile(r'\s+')
+_DIGITS = re.compile(r'\d+')
+_INVISIBLE = re.compile('[\u00ad\u200b-\u200f\u2060\ufeff]')
+_LETTER = re.compile(r'[^\W\d_]')
+
+
+def normalize_text(text: str) -> str:
+    """Fingerprint text: lower case, collapsed whitespace, digit runs folded to '#'"""
+    text = _INVISIBLE.sub('', text or '').lower()
+    return _DIGITS.sub('#', _WHITESPACE.sub(' ', text)).strip()
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """cl100k_base (the enhancer's encoding), loaded on first use; None if unavailable"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # tiktoken missing, or its BPE file not cached and no network
+        logger.debug(f"tiktoken unavailable ({e}), estimating furniture tokens from length")
+        return None
+
+
+def count_tokens(texts: Iterable[str]) -> int:
+    """cl100k_base token count (about 4 characters per token without tiktoken)"""
+    texts = list(texts)
+    encoding = _encoding()
+    if encoding is not None:
+        return sum(len(tokens) for tokens in encoding.encode_ordinary_batch(texts))
+    return sum((len(text) + 3) // 4 for text in texts)
+
+
+@dataclass
+class FurnitureReport:
+    """Units removed by the document-level pass"""
+    units_removed: int = 0
+    chars_removed: int = 0
+    tokens_removed: int = 0
+    groups: List[Dict] = field(default_factory=list)
+
+    def to_metrics(self) -> Dict[str, int]:
+        return {
+            'furniture_groups': len(self.groups),
+            'furniture_units_removed': self.units_removed,
+            'furniture_chars_removed': self.chars_removed,
+            'furniture_tokens_removed': self.tokens_removed,
+        }
+
+
+def _stable_clusters(boxes: np.ndarray, tolerance: float) -> List[List[int]]:
+    """
+    Group rows of an (N, 4) box array whose edges all lie within `tolerance`
+    of the first box of the group (greedy, in input order)
+    """
+    clusters: List[List[int]] = []
+    anchors: List[np.ndarray] = []
+    for i, box in enumerate(boxes):
+        for anchor, members in zip(anchors, clusters):
+            if np.all(np.abs(box - anchor) <= tolerance):
+                members.append(i)
+                break
+        else:
+            anchors.append(box)
+            clusters.append([i])
+    return clusters
+
+
+def find_repeated_images(doc, min_pages: int = DEFAULT_MIN_PAGES) -> Dict[int, List[Tuple[float, float, float, float]]]:
+    """
+    Image occurrences to skip, as {page_num (1-based): [bbox, ...]}.
+
+    Images with the same content digest and display size on at least
+    `min_pages` pages are furniture; the first page showing one keeps it.
+    """
+    pages_by_key: Dict[Tuple, Dict[int, List[Tuple]]] = defaultdict(lambda: defaultdict(list))
+    for page_index in range(len(doc)):
+        for info in doc[page_index].get_image_info(hashes=True):
+            digest = info.get('digest')
+            bbox = tuple(info.get('bbox') or ())
+            if not digest or len(bbox) != 4:
+                continue
+            size = (round((bbox[2] - bbox[0]) / IMAGE_SIZE_GRID), round((bbox[3] - bbox[1]) / IMAGE_SIZE_GRID))
+            if size[0] <= 0 or size[1] <= 0:
+                continue
+            pages_by_key[(digest, size)][page_index + 1].append(bbox)
+
+    repeated: Dict[int, List[Tuple]] = defaultdict(list)
+    for occurrences in pages_by_key.values():
+        if len(occurrences) < min_pages:
+            continue
+        first_page = min(occurrences)
+        for page_num, boxes in occurrences.items():
+            if page_num != first_page:
+                repeated[page_num].extend(boxes)
+    return dict(repeated)
+
+
+def matches_any(bbox: Sequence[float], boxes: Sequence[Sequence[float]], tolerance: float = 1.0) -> bool:
+    """True if `bbox` equals one of `boxes` within `tolerance` points on every edge"""
+    if not boxes:
+        return False
+    return bool(np.any(np.all(np.abs(np.asarray(boxes, dtype=np.float64) - np.asarray(bbox, dtype=np.float64))
+                              <= tolerance, axis=1)))
+
+
+def find_repeated_units(units: Sequence, page_heights: Dict[int, float],
+                        min_pages: int = DEFAULT_MIN_PAGES) -> Tuple[Set[int], List[Dict]]:
+    """
+    Indices of furniture units to drop, plus a summary of each repeated group.
+
+    `units` are extraction Units (anything with page, bbox, unit_type and
+    content attributes); table units are never furniture.
+    """
+    by_text: Dict[str, List[int]] = defaultdict(list)
+    for i, unit in enumerate(units):
+        if unit.unit_type == 'table':
+            continue
+        key = normalize_text(unit.content)
+        if len(key) >= MIN_CHARS and len(_LETTER.findall(key)) >= MIN_LETTERS:
+            by_text[key].append(i)
+
+    drop: Set[int] = set()
+    groups: List[Dict] = []
+    # Short band text (running titles) must cover a share of the document, not just a few pages
+    band_min_pages = max(min_pages, math.ceil(BAND_MIN_COVERAGE * len(page_heights)))
+    for key, indices in by_text.items():
+        if len({units[i].page for i in indices}) < min_pages:
+            continue
+        required = min_pages if len(key) >= BODY_MIN_CHARS else band_min_pages
+        boxes = np.array([units[i].bbox for i in indices], dtype=np.float64)
+        furniture: List[int] = []
+        for cluster in _stable_clusters(boxes, POSITION_TOLERANCE):
+            members = [indices[c] for c in cluster]
+            if len({units[i].page for i in members}) < required:
+                continue
+            if len(key) < BODY_MIN_CHARS and not all(
+                _in_band(units[i].bbox, page_heights.get(units[i].page)) for i in members
+            ):
+                continue
+            furniture.extend(members)
+        if not furniture:
+            continue
+        # Keep the first occurrence in reading order, drop the rest
+        furniture.sort(key=lambda i: (units[i].page, units[i].bbox[1]))
+        drop.update(furniture[1:])
+        groups.append({
+            'text': key[:80],
+            'pages': sorted({units[i].page for i in furniture}),
+            'removed': len(furniture) - 1,
+        })
+    return drop, groups
+
+
+def _in_band(bbox: Sequence[float], page_height: Optional[float]) -> bool:
+    if not page_height:
+        return False
+    band = page_height * BAND_RATIO
+    return bbox[3] <= band or bbox[1] >= page_height - band
+
+
+def remove_repeated_units(units: List, page_heights: Dict[int, float],
+                          min_pages: int = DEFAULT_MIN_PAGES) -> Tuple[List, FurnitureReport]:
+    """Drop repeated furniture units; returns (kept units in original order, report)"""
+    drop, groups = find_repeated_units(units, page_heights, min_pages)
+    report = FurnitureReport(groups=groups)
+    if not drop:
+        return units, report
+    removed = [units[i].content or '' for i in sorted(drop)]
+    report.units_removed = len(removed)
+    report.chars_removed = sum(map(len, removed))
+    report.tokens_removed = count_tokens(removed)
+    return [unit for i, unit in enumerate(units) if i not in drop], report
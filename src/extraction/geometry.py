@@ -0,0 +1,196 @@
+"""
+Bounding-Box Geometry Kernel
+
+NumPy-backed bbox arrays with batched overlap operations, plus a grid index
+for table exclusion zones. The page pipeline tests every text block against
+every zone at once instead of looping block by block; on dense financial
+tables with hundreds of spans per page this replaces thousands of scalar
+tuple comparisons with a few array operations.
+
+Boxes are (x0, y0, x1, y1) in PyMuPDF page coordinates (top-left origin).
+Pairwise operations between an N-array and an M-array return (N, M) arrays;
+ratios are relative to the boxes of the left-hand array, and are 0 where
+that box has no area or the pair does not intersect.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+BBox = Tuple[float, float, float, float]
+
+# Grid cell size of the zone index (points)
+ZONE_CELL_SIZE = 64.0
+
+
+class BBoxArray:
+    """Array of N boxes stored as an (N, 4) float64 array"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, boxes: Iterable[Sequence[float]]):
+        data = np.asarray(list(boxes) if not isinstance(boxes, np.ndarray) else boxes, dtype=np.float64)
+        self.data = data.reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, index) -> "BBoxArray":
+        return BBoxArray(self.data[index])
+
+    @property
+    def x0(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y0(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def y1(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.x1 - self.x0
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self.y1 - self.y0
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self.widths * self.heights
+
+    def clamp(self, page_width: float, page_height: float) -> "BBoxArray":
+        """Clamp to the page and order corners (batched normalize_bbox for PyMuPDF boxes, rotation 0)"""
+        limits = np.array([page_width, page_height, page_width, page_height])
+        clipped = np.clip(self.data, 0.0, limits)
+        return BBoxArray(np.column_stack([
+            np.minimum(clipped[:, 0], clipped[:, 2]),
+            np.minimum(clipped[:, 1], clipped[:, 3]),
+            np.maximum(clipped[:, 0], clipped[:, 2]),
+            np.maximum(clipped[:, 1], clipped[:, 3]),
+        ]))
+
+    def to_tuples(self) -> List[BBox]:
+        """Python tuples; edges clamped to 0 come back as int 0 like the scalar normalize_bbox"""
+        rows = self.data.tolist()
+        for i in np.flatnonzero((self.data <= 0).any(axis=1)):
+            rows[i] = [0 if v <= 0 else v for v in rows[i]]
+        return list(map(tuple, rows))
+
+    # -- pairwise (N x M) operations -------------------------------------------------
+
+    def _intersection(self, other: "BBoxArray") -> Tuple[np.ndarray, np.ndarray]:
+        a, b = self.data[:, None, :], other.data[None, :, :]
+        x_overlap = np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0])
+        y_overlap = np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1])
+        return x_overlap, y_overlap
+
+    def intersection_areas(self, other: "BBoxArray") -> np.ndarray:
+        """(N, M) intersection areas (0 where boxes don't intersect)"""
+        x_overlap, y_overlap = self._intersection(other)
+        return np.where((x_overlap > 0) & (y_overlap > 0), x_overlap * y_overlap, 0.0)
+
+    def overlap_ratio(self, other: "BBoxArray") -> np.ndarray:
+        """(N, M) intersection area / area of each box in self"""
+        areas = self.areas[:, None]
+        inter = self.intersection_areas(other)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(areas > 0, inter / areas, 0.0)
+
+    def iou(self, other: "BBoxArray") -> np.ndarray:
+        """(N, M) intersection over union"""
+        inter = self.intersection_areas(other)
+        union = self.areas[:, None] + other.areas[None, :] - inter
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where((inter > 0) & (union > 0), inter / union, 0.0)
+
+    def horizontal_overlap(self, other: "BBoxArray") -> np.ndarray:
+        """(N, M) x-overlap / width of each box in self"""
+        x_overlap = (np.minimum(self.x1[:, None], other.x1[None, :])
+                     - np.maximum(self.x0[:, None], other.x0[None, :]))
+        widths = self.widths[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where((x_overlap > 0) & (widths != 0), x_overlap / widths, 0.0)
+
+    def contained_in(self, other: "BBoxArray") -> np.ndarray:
+        """(N, M) True where box i of self lies entirely inside box j of other"""
+        a, b = self.data[:, None, :], other.data[None, :, :]
+        return ((a[..., 0] >= b[..., 0]) & (a[..., 1] >= b[..., 1])
+                & (a[..., 2] <= b[..., 2]) & (a[..., 3] <= b[..., 3]))
+
+
+def overlap_metrics(bbox1: Sequence[float], bbox2: Sequence[float]) -> Dict[str, float]:
+    """IoU, overlap ratio (relative to bbox1) and horizontal overlap ratio of one pair"""
+    a, b = BBoxArray([bbox1]), BBoxArray([bbox2])
+    if a.intersection_areas(b)[0, 0] <= 0:
+        return {'iou': 0.0, 'overlap_ratio': 0.0, 'x_overlap_ratio': 0.0}
+    return {
+        'iou': float(a.iou(b)[0, 0]),
+        'overlap_ratio': float(a.overlap_ratio(b)[0, 0]),
+        'x_overlap_ratio': float(a.horizontal_overlap(b)[0, 0]),
+    }
+
+
+class ZoneIndex:
+    """
+    Uniform-grid index over zone boxes (e.g. padded table areas).
+
+    Pages usually carry a handful of zones, where one dense (N, M) array
+    operation is cheapest; the grid only prunes candidate pairs once there
+    are more than DENSE_MAX_ZONES zones.
+    """
+
+    DENSE_MAX_ZONES = 64
+
+    def __init__(self, zones: BBoxArray, cell_size: float = ZONE_CELL_SIZE):
+        self.zones = zones
+        self.cell_size = cell_size
+        self._grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        if len(zones) > self.DENSE_MAX_ZONES:
+            for j, (x0, y0, x1, y1) in enumerate(zones.data.tolist()):
+                for cell in self._cells(x0, y0, x1, y1):
+                    self._grid[cell].append(j)
+
+    def _cells(self, x0: float, y0: float, x1: float, y1: float):
+        size = self.cell_size
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                yield cx, cy
+
+    def candidate_mask(self, boxes: BBoxArray) -> np.ndarray:
+        """(N, M) True where a box may intersect a zone (superset of intersecting pairs)"""
+        if not self._grid:
+            return np.ones((len(boxes), len(self.zones)), dtype=bool)
+
+        mask = np.zeros((len(boxes), len(self.zones)), dtype=bool)
+        size = self.cell_size
+        # Grid cell span of every box, then one vectorized selection per occupied cell
+        cx0, cy0 = np.floor_divide(boxes.x0, size), np.floor_divide(boxes.y0, size)
+        cx1, cy1 = np.floor_divide(boxes.x1, size), np.floor_divide(boxes.y1, size)
+        for (cx, cy), zone_ids in self._grid.items():
+            rows = np.flatnonzero((cx0 <= cx) & (cx1 >= cx) & (cy0 <= cy) & (cy1 >= cy))
+            if rows.size:
+                mask[np.ix_(rows, zone_ids)] = True
+        return mask
+
+    def overlap_ratio(self, boxes: BBoxArray) -> np.ndarray:
+        """(N, M) overlap ratio of each box with each zone (0 for pruned pairs)"""
+        if not self._grid:
+            return boxes.overlap_ratio(self.zones)
+
+        ratios = np.zeros((len(boxes), len(self.zones)))
+        mask = self.candidate_mask(boxes)
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size:
+            ratios[rows] = np.where(mask[rows], boxes[rows].overlap_ratio(self.zones), 0.0)
+        return ratios
@@ -0,0 +1,135 @@
+"""
+Persistent OCR Cache
+
+Content-addressed, on-disk cache for Tesseract output. Entries are keyed by a
+digest of the exact pixels handed to Tesseract plus the OCR language, PSM, DPI
+and the remaining config string, so repeated banners/logos across pages,
+documents and restarts are recognized once.
+
+Backed by SQLite (same approach as the RAG cache) so it is safe to share
+between page-parallel worker processes. Total stored text is bounded and the
+least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("OCR_CACHE_DIR", os.path.join(os.getcwd(), "cache", "ocr"))
+DEFAULT_MAX_MB = 256
+
+_PSM_PATTERN = re.compile(r'--psm\s+(\d+)')
+
+
+def image_digest(data: bytes, width: int, height: int, mode: str) -> str:
+    """Digest raw pixel data (plus geometry/mode so equal buffers of different shape never collide)"""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{width}x{height}:{mode}:".encode("ascii"))
+    h.update(data)
+    return h.hexdigest()
+
+
+class OCRCache:
+    """Size-bounded LRU cache of OCR text persisted in SQLite"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.db_path = self.cache_dir / "ocr_cache.sqlite"
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+        self._con: Optional[sqlite3.Connection] = None
+        self._lock = Lock()
+        self._writes_since_evict = 0
+
+    @staticmethod
+    def make_key(digest: str, lang: str, config: str, dpi: int) -> str:
+        """Build cache key from pixel digest, language, PSM, DPI and full config"""
+        match = _PSM_PATTERN.search(config)
+        psm = match.group(1) if match else "default"
+        config_hash = hashlib.md5(config.encode("utf-8")).hexdigest()[:8]
+        return f"{digest}:{lang}:psm{psm}:dpi{dpi}:{config_hash}"
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connect lazily so the cache can be created before forking/spawning workers
+        if self._con is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache "
+                "(k TEXT PRIMARY KEY, v TEXT, size INTEGER, last_used REAL)"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_ocr_cache_last_used ON ocr_cache(last_used)")
+            con.commit()
+            self._con = con
+        return self._con
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text (may be empty string) or None on miss"""
+        try:
+            with self._lock:
+                con = self._connect()
+                row = con.execute("SELECT v FROM ocr_cache WHERE k=?", (key,)).fetchone()
+                if row is None:
+                    return None
+                con.execute("UPDATE ocr_cache SET last_used=? WHERE k=?", (time.time(), key))
+                con.commit()
+                return row[0]
+        except sqlite3.Error as e:
+            logger.debug(f"OCR cache read failed: {e}")
+            return None
+
+    def set(self, key: str, text: str):
+        """Store OCR text and evict old entries when over budget"""
+        text = text or ""
+        try:
+            with self._lock:
+                con = self._connect()
+                con.execute(
+                    "REPLACE INTO ocr_cache(k, v, size, last_used) VALUES(?,?,?,?)",
+                    (key, text, len(text.encode("utf-8")) + len(key), time.time()),
+                )
+                con.commit()
+
+                self._writes_since_evict += 1
+                if self._writes_since_evict >= 32:
+                    self._evict(con)
+                    self._writes_since_evict = 0
+        except sqlite3.Error as e:
+            logger.debug(f"OCR cache write failed: {e}")
+
+    def _evict(self, con: sqlite3.Connection):
+        """Drop least recently used entries until total size is under 90% of budget"""
+        total = con.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        to_free = total - target
+        freed = 0
+        stale_keys = []
+        for k, size in con.execute("SELECT k, size FROM ocr_cache ORDER BY last_used ASC"):
+            stale_keys.append((k,))
+            freed += size
+            if freed >= to_free:
+                break
+
+        con.executemany("DELETE FROM ocr_cache WHERE k=?", stale_keys)
+        con.commit()
+        logger.info(f"OCR cache evicted {len(stale_keys)} entries ({freed / 1024:.1f} KB)")
+
+    def close(self):
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
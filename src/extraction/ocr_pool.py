@@ -0,0 +1,348 @@
+"""
+Persistent OCR Worker Pool
+
+Long-lived OCR worker processes that keep Tesseract's language models loaded
+between calls. Callers hand over a batch of (image, config) requests; the batch
+is split into chunks that are queued to the workers and run across cores, and
+results come back in request order (None for a request that failed). Batches
+ask for one output kind:
+    - "text":       plain text (image_to_string)
+    - "confidence": (text, mean word confidence) pairs
+    - "data":       word boxes in pytesseract image_to_data DICT layout
+
+Each worker (and the in-process engine used when the pool is disabled) holds
+one OCREngine:
+    - tesserocr available: a PyTessBaseAPI per (lang, oem) initialised once, so
+      the traineddata is loaded once per worker instead of once per call
+    - otherwise: pytesseract (one tesseract process per call)
+
+tesserocr is optional and not in requirements.txt (it builds against the local
+Tesseract/Leptonica headers). Without it every call starts a tesseract process
+anyway and worker processes would only add pickling and IPC, so
+resolve_pool_workers turns the pool off (ocr.pool_workers is then ignored).
+tesserocr is imported by the first OCREngine, not with this module. A pool
+whose worker died is restarted on the next batch.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_pool_disabled_logged = False
+
+_PSM_PATTERN = re.compile(r'--psm\s+(\d+)')
+_OEM_PATTERN = re.compile(r'--oem\s+(\d+)')
+_VAR_PATTERN = re.compile(r'-c\s+(\w+)=(\S+)')
+
+# (mode, (width, height), raw bytes, tesseract config)
+OCRRequest = Tuple[str, Tuple[int, int], bytes, str]
+# Recognized text plus mean word confidence (0-100, -1 when nothing was recognized)
+OCRResult = Tuple[str, float]
+
+OUTPUT_KINDS = ("text", "confidence", "data")
+_DATA_KEYS = ('block_num', 'par_num', 'line_num', 'left', 'top', 'width', 'height', 'conf', 'text')
+
+
+@lru_cache(maxsize=None)
+def tesserocr_available() -> bool:
+    try:
+        import tesserocr  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_pool_workers(workers: int) -> int:
+    """OCR pool size to use: `workers`, or 0 when tesserocr is missing (logged once per process)"""
+    global _pool_disabled_logged
+    if workers > 0 and not tesserocr_available():
+        if not _pool_disabled_logged:
+            logger.info(f"tesserocr not installed: OCR pool ({workers} workers) disabled, "
+                        f"OCR runs through pytesseract in the extracting process")
+            _pool_disabled_logged = True
+        return 0
+    return workers
+
+
+def make_request(img, config: str) -> OCRRequest:
+    """Pack a PIL image + config into a picklable OCR request"""
+    return (img.mode, img.size, img.tobytes(), config)
+
+
+class OCREngine:
+    """Per-process OCR engine; keeps tesserocr APIs (and their models) alive between calls"""
+
+    def __init__(self, lang: str):
+        self.lang = lang
+        self._apis: Dict[int, Any] = {}  # oem -> tesserocr.PyTessBaseAPI
+        self._tesserocr = None
+        if tesserocr_available():
+            import tesserocr
+            self._tesserocr = tesserocr
+
+    def _api(self, oem: int):
+        api = self._apis.get(oem)
+        if api is None:
+            tesserocr = self._tesserocr
+            api = tesserocr.PyTessBaseAPI(lang=self.lang, oem=tesserocr.OEM(oem))
+            self._apis[oem] = api
+        return api
+
+    def run(self, img, config: str, output: str = "text"):
+        """Dispatch to the recognizer for an output kind (see OUTPUT_KINDS)"""
+        if output == "confidence":
+            return self.recognize_with_confidence(img, config)
+        if output == "data":
+            return self.recognize_data(img, config)
+        return self.recognize(img, config)
+
+    def recognize(self, img, config: str) -> str:
+        if self._tesserocr is None:
+            import pytesseract
+            return pytesseract.image_to_string(img, lang=self.lang, config=config)
+        return self._run_api(img, config, lambda api: api.GetUTF8Text())
+
+    def recognize_with_confidence(self, img, config: str) -> OCRResult:
+        """Text plus mean word confidence in one Tesseract pass"""
+        if self._tesserocr is None:
+            return text_from_data(self.recognize_data(img, config))
+
+        def read(api):
+            text = api.GetUTF8Text()
+            confidences = api.AllWordConfidences()
+            return text, (sum(confidences) / len(confidences) if confidences else -1.0)
+        return self._run_api(img, config, read)
+
+    def recognize_data(self, img, config: str) -> Dict[str, List[Any]]:
+        """Word boxes, confidences and block/paragraph/line numbers (image_to_data DICT layout)"""
+        if self._tesserocr is None:
+            import pytesseract
+            data = pytesseract.image_to_data(
+                img, lang=self.lang, config=config, output_type=pytesseract.Output.DICT
+            )
+            return {key: list(data.get(key, [])) for key in _DATA_KEYS}
+        return self._run_api(img, config, lambda api: _words_from_api(api, self._tesserocr))
+
+    def _run_api(self, img, config: str, read):
+        psm_match = _PSM_PATTERN.search(config)
+        oem_match = _OEM_PATTERN.search(config)
+        api = self._api(int(oem_match.group(1)) if oem_match else 3)
+
+        # -c variables only apply to this call; restore the previous values afterwards
+        previous = {}
+        for name, value in _VAR_PATTERN.findall(config):
+            previous[name] = api.GetVariableAsString(name)
+            api.SetVariable(name, value)
+        try:
+            api.SetPageSegMode(self._tesserocr.PSM(int(psm_match.group(1)) if psm_match else 3))
+            api.SetImage(img)
+            return read(api)
+        finally:
+            for name, value in previous.items():
+                if value is not None:
+                    api.SetVariable(name, value)
+            api.Clear()
+
+    def close(self):
+        for api in self._apis.values():
+            api.End()
+        self._apis.clear()
+
+
+def _words_from_api(api, tesserocr) -> Dict[str, List[Any]]:
+    """Word-level results of a tesserocr pass in image_to_data DICT layout"""
+    data: Dict[str, List[Any]] = {key: [] for key in _DATA_KEYS}
+    api.Recognize()
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+
+    block = par = line = 0
+    level = tesserocr.RIL.WORD
+    while True:
+        if iterator.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block, par, line = block + 1, 0, 0
+        if iterator.IsAtBeginningOf(tesserocr.RIL.PARA):
+            par, line = par + 1, 0
+        if iterator.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line += 1
+        box = iterator.BoundingBox(level)
+        if box is not None:
+            x0, y0, x1, y1 = box
+            for key, value in (('block_num', block), ('par_num', par), ('line_num', line),
+                               ('left', x0), ('top', y0), ('width', x1 - x0), ('height', y1 - y0),
+                               ('conf', iterator.Confidence(level)),
+                               ('text', iterator.GetUTF8Text(level) or '')):
+                data[key].append(value)
+        if not iterator.Next(level):
+            break
+    return data
+
+
+def text_from_data(data: Dict[str, List[Any]]) -> OCRResult:
+    """
+    Rebuild image_to_string-style text and the mean word confidence from
+    pytesseract image_to_data output (words joined per line, blank line
+    between paragraphs).
+    """
+    paragraphs: List[List[str]] = []
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    line_order: List[Tuple[int, int, int]] = []
+    confidences: List[float] = []
+
+    for i, word in enumerate(data.get('text', [])):
+        conf = float(data['conf'][i])
+        if conf < 0 or not word or not word.strip():
+            continue
+        confidences.append(conf)
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        if key not in lines:
+            lines[key] = []
+            line_order.append(key)
+        lines[key].append(word)
+
+    previous_par = None
+    for key in line_order:
+        if key[:2] != previous_par:
+            paragraphs.append([])
+            previous_par = key[:2]
+        paragraphs[-1].append(' '.join(lines[key]))
+
+    text = '\n\n'.join('\n'.join(par) for par in paragraphs)
+    mean_conf = sum(confidences) / len(confidences) if confidences else -1.0
+    return text, mean_conf
+
+
+_worker_engine: Optional[OCREngine] = None
+
+
+def _init_ocr_worker(lang: str, tesseract_cmd: Optional[str] = None):
+    global _worker_engine
+    if tesseract_cmd and not tesserocr_available():
+        # Keep the binary path detected by the parent (e.g. Windows install dirs)
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    _worker_engine = OCREngine(lang)
+    atexit.register(_worker_engine.close)
+
+
+def empty_result(output: str):
+    """Empty result of an output kind (what callers see for a failed request)"""
+    if output == "confidence":
+        return "", -1.0
+    if output == "data":
+        return {key: [] for key in _DATA_KEYS}
+    return ""
+
+
+def _ocr_batch(requests: List[OCRRequest], output: str = "text") -> List:
+    """Run a chunk of OCR requests inside a worker (None for each request that failed)"""
+    from PIL import Image
+
+    results = []
+    for mode, size, data, config in requests:
+        img = Image.frombytes(mode, size, data)
+        try:
+            results.append(_worker_engine.run(img, config, output))
+        except Exception as e:
+            logger.debug(f"OCR request failed in worker: {e}")
+            results.append(None)
+    return results
+
+
+def _tesseract_cmd() -> Optional[str]:
+    try:
+        import pytesseract
+        return pytesseract.pytesseract.tesseract_cmd
+    except ImportError:
+        return None
+
+
+class OCRWorkerPool:
+    """Fixed-size pool of long-lived OCR worker processes for one language"""
+
+    def __init__(self, lang: str, workers: int):
+        self.lang = lang
+        self.workers = max(1, int(workers))
+        self._lock = Lock()
+        self._executor = self._start()
+        logger.info(f"OCR worker pool started: {self.workers} workers, lang={lang}, "
+                    f"backend={'tesserocr' if tesserocr_available() else 'pytesseract'}")
+
+    def _start(self) -> ProcessPoolExecutor:
+        # spawn (not fork): OCR is requested from worker threads of the API process
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ocr_worker,
+            initargs=(self.lang, _tesseract_cmd()),
+        )
+
+    def _submit(self, chunk: List[OCRRequest], output: str):
+        with self._lock:
+            try:
+                return self._executor.submit(_ocr_batch, chunk, output)
+            except BrokenProcessPool:
+                logger.warning(f"OCR worker pool broken (a worker died); restarting it (lang={self.lang})")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._start()
+                return self._executor.submit(_ocr_batch, chunk, output)
+
+    def run_batch(self, requests: List[OCRRequest], output: str = "text") -> List:
+        """
+        OCR a batch; requests are split across workers and returned in order
+        (see OUTPUT_KINDS), None for each request that failed.
+
+        Raises:
+            BrokenProcessPool: A worker died during the batch (the pool is
+                restarted on the next batch)
+        """
+        if not requests:
+            return []
+
+        n_chunks = min(self.workers, len(requests))
+        chunk_size = -(-len(requests) // n_chunks)
+        chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+
+        futures = [self._submit(chunk, output) for chunk in chunks]
+        results: List = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def shutdown(self):
+        with self._lock:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pools: Dict[Tuple[str, int], OCRWorkerPool] = {}
+_pools_lock = Lock()
+
+
+def get_ocr_pool(lang: str, workers: int) -> OCRWorkerPool:
+    """Process-wide pool for (lang, workers), started on first use and reused across documents"""
+    key = (lang, max(1, int(workers)))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = OCRWorkerPool(lang, key[1])
+            _pools[key] = pool
+        return pool
+
+
+@atexit.register
+def shutdown_ocr_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
@@ -0,0 +1,104 @@
+"""
+Page Classifier
+
+Cheap pre-pass that labels every page before the heavy per-page pipeline runs,
+so table engines and OCR are only invoked where they can produce output:
+
+    text-native    text layer, no images, no vector rulings
+    table-bearing  text layer + ruling lines, no images
+    mixed          text layer + images (with or without rulings)
+    scanned        no text layer, or mostly images (full-page scan)
+
+The lines-based table finders (pdfplumber and PyMuPDF "lines" strategy,
+Camelot lattice) build cells from ruling edges, so a page without horizontal
+AND vertical rulings cannot yield a table from them. Text-based strategies
+(Camelot stream) align words instead and are not gated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Tuple
+
+import fitz  # PyMuPDF
+
+TEXT_NATIVE = "text_native"
+TABLE_BEARING = "table_bearing"
+SCANNED = "scanned"
+MIXED = "mixed"
+
+PAGE_CLASSES = (TEXT_NATIVE, TABLE_BEARING, SCANNED, MIXED)
+
+# Edges shorter than this are ignored by the table finders (pdfplumber edge_min_length=3)
+MIN_EDGE_LENGTH = 3.0
+# Axis-aligned tolerance for a line segment to count as a ruling
+AXIS_TOLERANCE = 1.0
+# Smallest grid that can hold a header row + one data row
+MIN_HORIZONTAL_EDGES = 3
+MIN_VERTICAL_EDGES = 2
+
+
+@dataclass
+class PageProfile:
+    """Classification result plus the cheap signals it was derived from"""
+    page_class: str
+    text_chars: int
+    image_count: int
+    image_coverage: float
+    horizontal_edges: int
+    vertical_edges: int
+    line_density: float  # ruling edges per 100x100pt of page area
+    is_full_page_scan: bool
+
+    @property
+    def has_rulings(self) -> bool:
+        return (self.horizontal_edges >= MIN_HORIZONTAL_EDGES
+                and self.vertical_edges >= MIN_VERTICAL_EDGES)
+
+    @property
+    def needs_lines_engines(self) -> bool:
+        """True if the lines-based table finders can find a table on this page"""
+        return self.has_rulings
+
+    @property
+    def needs_ocr(self) -> bool:
+        return self.page_class != TEXT_NATIVE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def count_ruling_edges(page: fitz.Page) -> Tuple[int, int]:
+    """Count horizontal and vertical edges from vector drawings (lines and rectangle sides)"""
+    horizontal = 0
+    vertical = 0
+
+    for path in page.get_drawings():
+        for item in path.get('items', []):
+            kind = item[0]
+            if kind == 'l':
+                p1, p2 = item[1], item[2]
+                dx, dy = abs(p2.x - p1.x), abs(p2.y - p1.y)
+                if dy <= AXIS_TOLERANCE and dx >= MIN_EDGE_LENGTH:
+                    horizontal += 1
+                elif dx <= AXIS_TOLERANCE and dy >= MIN_EDGE_LENGTH:
+                    vertical += 1
+            elif kind in ('re', 'qu'):
+                rect = item[1].rect if kind == 'qu' else item[1]
+                if rect.width >= MIN_EDGE_LENGTH:
+                    horizontal += 2
+                if rect.height >= MIN_EDGE_LENGTH:
+                    vertical += 2
+
+    return horizontal, vertical
+
+
+def classify(text_chars: int, image_count: int, has_rulings: bool, is_full_page_scan: bool) -> str:
+    """Map page signals to a page class"""
+    if is_full_page_scan or text_chars == 0:
+        return SCANNED
+    if image_count:
+        return MIXED
+    if has_rulings:
+        return TABLE_BEARING
+    return TEXT_NATIVE
@@ -0,0 +1,110 @@
+"""
+On-demand Page Previews
+
+Renders a single page of a document's source.pdf to PNG at the requested DPI
+when it is asked for, instead of rasterizing every page during extraction.
+Rendered previews are kept in a size-bounded disk cache; least recently used
+files are evicted first.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv("PAGE_PREVIEW_CACHE_DIR", os.path.join(os.getcwd(), "cache", "previews"))
+DEFAULT_MAX_MB = 200
+
+MIN_PREVIEW_DPI = 36
+MAX_PREVIEW_DPI = 300
+
+
+class PagePreviewCache:
+    """LRU disk cache of rendered page previews"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = Lock()
+
+    def _path(self, doc_id: str, page_num: int, dpi: int) -> Path:
+        return self.cache_dir / doc_id / f"page-{page_num}@{dpi}dpi.png"
+
+    def get_preview(self, doc_id: str, pdf_path: Path, page_num: int, dpi: int) -> bytes:
+        """
+        PNG bytes of a 1-based page at `dpi`, rendered on first request.
+
+        Raises:
+            FileNotFoundError: If the source PDF does not exist
+            ValueError: If page_num is out of range
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"Source PDF not found: {pdf_path}")
+
+        dpi = max(MIN_PREVIEW_DPI, min(int(dpi), MAX_PREVIEW_DPI))
+        path = self._path(doc_id, page_num, dpi)
+
+        # Cached preview is valid as long as it is newer than the source PDF
+        try:
+            if path.stat().st_mtime >= pdf_path.stat().st_mtime:
+                data = path.read_bytes()
+                os.utime(path)  # mark as recently used
+                return data
+        except FileNotFoundError:
+            pass
+
+        data = render_page_png(pdf_path, page_num, dpi)
+        self._store(path, data)
+        return data
+
+    def _store(self, path: Path, data: bytes):
+        with self._lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+                self._evict()
+            except OSError as e:
+                logger.warning(f"Failed to cache page preview {path}: {e}")
+
+    def _evict(self):
+        """Delete least recently used previews until total size is under 90% of budget"""
+        files = []
+        total = 0
+        for file in self.cache_dir.glob("*/*.png"):
+            stat = file.stat()
+            files.append((stat.st_mtime, stat.st_size, file))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, file in sorted(files):
+            if total <= target:
+                break
+            file.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        logger.info(f"Page preview cache evicted {removed} files")
+
+
+def render_page_png(pdf_path: Path, page_num: int, dpi: int) -> bytes:
+    """Render one 1-based page of a PDF to PNG bytes"""
+    import fitz  # PyMuPDF, loaded with the first preview rather than with the API routes
+
+    with fitz.open(str(pdf_path)) as doc:
+        if page_num < 1 or page_num > len(doc):
+            raise ValueError(f"Page {page_num} out of range (document has {len(doc)} pages)")
+        zoom = dpi / 72.0
+        pix = doc[page_num - 1].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return pix.tobytes("png")
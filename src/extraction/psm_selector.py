@@ -0,0 +1,97 @@
+"""
+PSM Selection for Image-Block OCR
+
+Orders a crop's PSM ladder so the page segmentation mode most likely to fit
+goes first, and picks the winner from Tesseract's own word confidences
+instead of output length.
+
+Heuristics (crop geometry in PDF points, position relative to the page):
+    - thin strips (wide aspect or a single text-line height) and banners in
+      the header/footer band read as one line            -> 7 (single_line)
+    - crops covering a large share of the page hold
+      multi-block layouts                                 -> 3 (auto), 6
+    - tall or near-square small crops (logos, stamps,
+      badges) carry scattered text                        -> 11 (sparse_text)
+    - everything else is a paragraph-like block           -> 6 (uniform_block)
+
+The caller runs the first candidate alone and accepts it when its mean word
+confidence reaches the threshold; only otherwise are the remaining candidates
+run (as one concurrent batch) and compared.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+DEFAULT_MIN_CONFIDENCE = 70.0
+
+# Crop shape thresholds
+SINGLE_LINE_ASPECT = 6.0        # width / height at or above this reads as one line
+SINGLE_LINE_MAX_HEIGHT = 30.0   # pt; at most one line of body/header text
+SPARSE_MAX_ASPECT = 1.5         # tall or near-square crops
+LARGE_AREA_RATIO = 0.25         # share of the page area
+EDGE_BAND_RATIO = 0.12          # top/bottom share of the page height treated as header/footer
+
+# Preferred PSM order per crop category
+_PREFERENCES = {
+    'line': (7, 13, 6, 11, 3),
+    'large': (3, 6, 11, 7, 13),
+    'sparse': (11, 6, 7, 3, 13),
+    'block': (6, 7, 11, 3, 13),
+}
+
+
+def categorize_crop(bbox: Sequence[float], page_size: Tuple[float, float]) -> str:
+    """Crop category from its bbox and the page size (both in points)"""
+    x0, y0, x1, y1 = bbox
+    width, height = x1 - x0, y1 - y0
+    aspect = width / max(height, 1.0)
+
+    page_width, page_height = page_size
+    area_ratio = (width * height) / max(page_width * page_height, 1.0)
+    in_edge_band = (y1 <= page_height * EDGE_BAND_RATIO
+                    or y0 >= page_height * (1 - EDGE_BAND_RATIO))
+
+    if aspect >= SINGLE_LINE_ASPECT:
+        return 'line'
+    if height <= SINGLE_LINE_MAX_HEIGHT and aspect > SPARSE_MAX_ASPECT:
+        return 'line'
+    if in_edge_band and aspect >= SINGLE_LINE_ASPECT / 2:
+        return 'line'
+    if area_ratio >= LARGE_AREA_RATIO:
+        return 'large'
+    if aspect <= SPARSE_MAX_ASPECT:
+        return 'sparse'
+    return 'block'
+
+
+def rank_psm_ladder(ladder: Sequence[int], bbox: Sequence[float],
+                    page_size: Tuple[float, float]) -> List[int]:
+    """
+    Reorder the configured ladder so the most likely PSM comes first.
+
+    Only modes already in the ladder are returned; modes the category does not
+    rank keep their configured relative order at the end.
+    """
+    preference = _PREFERENCES[categorize_crop(bbox, page_size)]
+    rank = {psm: i for i, psm in enumerate(preference)}
+    ordered = list(dict.fromkeys(ladder))
+    return sorted(ordered, key=lambda psm: (rank.get(psm, len(preference)), ordered.index(psm)))
+
+
+def pick_best(results: Sequence[Tuple[str, float]]) -> Optional[int]:
+    """
+    Index of the best (text, mean_confidence) result, or None if all are empty.
+
+    Highest mean word confidence wins; text length breaks ties (and decides
+    alone when no result carries a confidence).
+    """
+    best_index = None
+    best_score = None
+    for i, (text, confidence) in enumerate(results):
+        if not text or not text.strip():
+            continue
+        score = (confidence, len(text.strip()))
+        if best_score is None or score > best_score:
+            best_index, best_score = i, score
+    return best_index
@@ -0,0 +1,181 @@
+"""
+Page Raster Pipeline
+
+Renders each page at most once per DPI/colorspace and serves every consumer
+(debug page PNGs, full-page OCR, non-table OCR) from that buffer; image-block
+crops are cut from it when it exists and rendered as clips otherwise. Only
+the page currently being processed is kept in memory.
+
+OCR images are built straight from the pixmap sample buffer (no PNG
+encode/decode round-trip) and preprocessing runs as NumPy array operations.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional, Tuple
+
+import fitz  # PyMuPDF
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PageRenderCache:
+    """Per-page pixmap cache holding at most one page at a time"""
+
+    def __init__(self):
+        self._page_key: Optional[Tuple[int, int]] = None
+        self._pixmaps: Dict[Tuple[int, bool], fitz.Pixmap] = {}
+        self.renders = 0
+        self.crops = 0
+
+    def _select_page(self, page: fitz.Page):
+        key = (id(page.parent), page.number)
+        if key != self._page_key:
+            # Moving to another page - drop the previous raster to keep memory bounded
+            self.release()
+            self._page_key = key
+
+    def _cached(self, page: fitz.Page, dpi: int, gray: bool) -> Optional[fitz.Pixmap]:
+        self._select_page(page)
+        return self._pixmaps.get((dpi, gray))
+
+    def page_pixmap(self, page: fitz.Page, dpi: int, gray: bool = False) -> fitz.Pixmap:
+        """Full-page pixmap at the given DPI, rendered on first use"""
+        self._select_page(page)
+
+        pix = self._pixmaps.get((dpi, gray))
+        if pix is None:
+            color_pix = self._pixmaps.get((dpi, False)) if gray else None
+            if color_pix is not None:
+                # Colour raster already exists (debug PNG) - converting is cheaper than re-rendering
+                pix = fitz.Pixmap(fitz.csGRAY, color_pix)
+            else:
+                zoom = dpi / 72.0
+                colorspace = fitz.csGRAY if gray else fitz.csRGB
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace)
+                self.renders += 1
+            self._pixmaps[(dpi, gray)] = pix
+        return pix
+
+    def crop(self, page: fitz.Page, bbox: Tuple, dpi: int, zoom: float, gray: bool = False) -> fitz.Pixmap:
+        """
+        Cut bbox out of the cached page raster and scale it to `zoom`.
+
+        Output has the same pixel size as page.get_pixmap(matrix=Matrix(zoom, zoom), clip=bbox).
+        The page raster is only reused when another consumer already rendered
+        it at `dpi`; otherwise (and for clips that need more resolution than the
+        raster holds) just the clip is rendered at `zoom`, which is far cheaper
+        than rasterizing the whole page for a few image blocks.
+        """
+        cached_gray = self._cached(page, dpi, True) if gray else None
+        color_pix = self._cached(page, dpi, False)
+        if zoom * 72.0 > dpi or (cached_gray is None and color_pix is None):
+            self.renders += 1
+            return page.get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom),
+                clip=fitz.Rect(bbox),
+                colorspace=fitz.csGRAY if gray else fitz.csRGB,
+            )
+
+        # Gray crops prefer a gray raster; cropping the colour raster and converting
+        # only the crop is far cheaper than a full-page conversion
+        pix = cached_gray if cached_gray is not None else color_pix
+
+        page_zoom = dpi / 72.0
+        to_pixels = page.rotation_matrix * fitz.Matrix(page_zoom, page_zoom)
+        region = (fitz.Rect(bbox) * to_pixels).irect & pix.irect
+
+        target = (fitz.Rect(bbox) * fitz.Matrix(zoom, zoom)).irect
+        if region.is_empty or target.is_empty:
+            # Degenerate clip - render directly rather than crop
+            return page.get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom),
+                clip=fitz.Rect(bbox),
+                colorspace=fitz.csGRAY if gray else fitz.csRGB,
+            )
+
+        sub = fitz.Pixmap(pix.colorspace, region, pix.alpha)
+        sub.copy(pix, region)
+        self.crops += 1
+
+        if (sub.width, sub.height) != (target.width, target.height):
+            sub = fitz.Pixmap(sub, target.width, target.height, None)
+        if gray and sub.n != 1:
+            sub = fitz.Pixmap(fitz.csGRAY, sub)
+        return sub
+
+    def pop_stats(self) -> Dict[str, int]:
+        """Return render/crop counters since the last call and reset them"""
+        stats = {'page_renders': self.renders, 'raster_crops': self.crops}
+        self.renders = 0
+        self.crops = 0
+        return stats
+
+    def release(self):
+        """Drop all cached rasters"""
+        self._pixmaps.clear()
+        self._page_key = None
+
+
+_PIL_MODES = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}
+
+
+def pixmap_to_array(pix: fitz.Pixmap) -> np.ndarray:
+    """
+    Zero-copy NumPy view of the pixmap samples.
+
+    Shape is (h, w) for single-channel pixmaps, (h, w, n) otherwise.
+    The view is only valid while `pix` is alive.
+    """
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.stride)
+    arr = rows[:, :pix.width * pix.n]
+    if pix.n == 1:
+        return arr
+    return arr.reshape(pix.height, pix.width, pix.n)
+
+
+def pixmap_to_image(pix: fitz.Pixmap):
+    """
+    PIL image sharing the pixmap sample buffer (no PNG encode/decode).
+
+    The image is only valid while `pix` is alive.
+    """
+    from PIL import Image
+
+    mode = _PIL_MODES[pix.n]
+    return Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, 'raw', mode, pix.stride, 1)
+
+
+def enhance_for_ocr(gray: np.ndarray, contrast: float = 1.5) -> np.ndarray:
+    """
+    Contrast stretch + sharpen a grayscale array for OCR.
+
+    Pixel-for-pixel equivalent to PIL's ImageEnhance.Contrast(img).enhance(contrast)
+    followed by img.filter(ImageFilter.SHARPEN), computed with a lookup table and
+    integer array arithmetic.
+    """
+    # Contrast: blend towards the mean grey level; per-pixel mapping -> 256-entry LUT
+    mean = int(gray.mean() + 0.5)
+    levels = mean + contrast * (np.arange(256, dtype=np.float32) - mean)
+    lut = np.clip(levels, 0, 255).astype(np.uint8)
+    img = lut[gray]
+
+    if img.shape[0] < 3 or img.shape[1] < 3:
+        return img
+
+    # SHARPEN kernel (-2 around, 32 centre, /16); border pixels are left untouched like PIL
+    src = img.astype(np.int16)
+    window_sum = (
+        src[:-2, :-2] + src[:-2, 1:-1] + src[:-2, 2:]
+        + src[1:-1, :-2] + src[1:-1, 1:-1] + src[1:-1, 2:]
+        + src[2:, :-2] + src[2:, 1:-1] + src[2:, 2:]
+    )
+    sharpened = 34 * src[1:-1, 1:-1] - 2 * window_sum
+    sharpened = (sharpened + 8) >> 4  # divide by 16, round half up
+    np.clip(sharpened, 0, 255, out=sharpened)
+
+    out = img.copy()
+    out[1:-1, 1:-1] = sharpened
+    return out
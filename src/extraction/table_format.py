@@ -0,0 +1,275 @@
+"""
+Table Cleanup and Markdown Emission
+
+Post-processing for extracted tables, working on the cell matrix as one NumPy
+object array instead of per-column ``DataFrame.apply`` / ``DataFrame.map``
+passes:
+
+- merged-token repair (``"3.00%0.50%"``, ``"44593.65 44368.5"``, ``"(0.50)"``,
+  ``"11-Feb12-Feb"``) with precompiled patterns; every rule needs a digit, so
+  a single mask selects the few cells worth looking at,
+- empty-column removal and whitespace trimming as array masks,
+- a direct pipe-table emitter producing the same text as
+  ``df.to_markdown(index=False)`` (tabulate ``pipe`` format: numeric column
+  detection, ``g`` float formatting, decimal alignment, colon rules).
+
+Tables the emitter does not reproduce byte for byte (ANSI escapes, CR or
+other line separators, tabulate separating-line markers, non-string cells,
+empty frames) return None from ``pipe_table`` and are left to tabulate.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from itertools import chain
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import wcwidth  # tabulate measures cells with it when installed
+except ImportError:
+    wcwidth = None
+
+# Merged-token patterns (same rules as the original per-cell cleanup)
+PERCENT_PAIR = re.compile(r'(\d+\.?\d*%)(\d+\.?\d*%)')
+NUMBER_PAIR_CHARS = re.compile(r'^[\d\.\s]+$')
+NUMBER_TOKEN = re.compile(r'^\d+\.?\d*$')
+PAREN_NEGATIVE = re.compile(r'\((\d+\.?\d*)\)')
+DATE_PAIR = re.compile(r'(\d{1,2}-\w{3})(\d{1,2}-\w{3})')
+DIGIT = re.compile(r'\d')
+
+# tabulate number parsing
+THOUSANDS_NUMBER = re.compile(r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$")
+PLAIN_INT = re.compile(r'[+-]?[0-9]+\Z')
+# Characters that switch tabulate to code paths the emitter does not mirror
+UNSUPPORTED_CHARS = re.compile('[\x01\x1b\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
+MIN_PADDING = 2
+
+# Column types, ordered from least to most generic (tabulate's _more_generic order)
+_NONE, _BOOL, _INT, _FLOAT, _STR = 0, 1, 2, 3, 5
+
+
+# -- cleanup ---------------------------------------------------------------------------
+
+def split_merged_cell(cell: str) -> Tuple[str, bool]:
+    """Repair one cell; returns (cell, True if merged tokens were split)"""
+    match = PERCENT_PAIR.search(cell)
+    if match:
+        return ' | '.join(match.groups()), True
+
+    if NUMBER_PAIR_CHARS.match(cell):
+        parts = cell.split()
+        if len(parts) == 2 and all(NUMBER_TOKEN.match(p) for p in parts):
+            return ' | '.join(parts), True
+
+    cell = PAREN_NEGATIVE.sub(r'-\1', cell)
+
+    match = DATE_PAIR.search(cell)
+    if match:
+        return ' | '.join(match.groups()), True
+
+    return cell, False
+
+
+_has_digit = np.frompyfunc(lambda c: isinstance(c, str) and DIGIT.search(c) is not None, 1, 1)
+_strip_cell = np.frompyfunc(lambda c: str(c).strip(), 1, 1)
+
+
+def split_merged_numerics(values: np.ndarray) -> int:
+    """Repair merged tokens in a 2-D object array in place; returns the number of cells split"""
+    if not values.size:
+        return 0
+    merged = 0
+    for row, col in zip(*np.nonzero(_has_digit(values).astype(bool))):
+        values[row, col], was_merged = split_merged_cell(values[row, col])
+        merged += was_merged
+    return merged
+
+
+def normalize_headers(columns: Sequence) -> List[str]:
+    """Single-line, stripped header names; empty ones become Col<i>"""
+    names = [str(col).strip().replace('\n', ' ') for col in columns]
+    return ['Col' + str(i) if not name else name for i, name in enumerate(names)]
+
+
+def clean_table(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """
+    Merged-token repair, header normalization, empty-column removal and trimming.
+
+    Returns (cleaned frame of str cells, number of merged cells split).
+    """
+    import pandas as pd
+
+    values = df.to_numpy(dtype=object, copy=True)
+
+    # Columns sharing a label were never repaired (df[label] selects all of them)
+    unique = np.flatnonzero(~df.columns.duplicated(keep=False))
+    merged = 0
+    if len(unique) == values.shape[1]:
+        merged = split_merged_numerics(values)
+    elif len(unique):
+        block = values[:, unique]
+        merged = split_merged_numerics(block)
+        values[:, unique] = block
+
+    headers = np.array(normalize_headers(df.columns), dtype=object)
+
+    # Drop columns without a single non-empty cell (missing values count as content here)
+    keep = (values != '').any(axis=0)
+    values, headers = values[:, keep], headers[keep]
+
+    missing = pd.isna(values)
+    if values.size:
+        values = _strip_cell(values)
+        values[missing] = ''
+
+    return pd.DataFrame(values, columns=headers.tolist()), merged
+
+
+# -- markdown --------------------------------------------------------------------------
+
+def _width(s: str) -> int:
+    if s.isascii() and s.isprintable():
+        return len(s)
+    return wcwidth.wcswidth(s) if wcwidth is not None else len(s)
+
+
+def _multiline_width(s: str) -> int:
+    return max(map(_width, s.split('\n')))
+
+
+def _is_int(s: str) -> bool:
+    try:
+        int(s)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_number(s: str) -> bool:
+    try:
+        value = float(s)
+    except ValueError:
+        return False
+    return not (math.isinf(value) or math.isnan(value)) or s.lower() in ('inf', '-inf', 'nan')
+
+
+def _cell_type(s: str) -> int:
+    if not s:
+        return _NONE
+    if PLAIN_INT.match(s):
+        return _INT
+    if s in ('True', 'False'):
+        return _BOOL
+    if _is_int(s) or (THOUSANDS_NUMBER.match(s) and '.' not in s):
+        return _INT
+    if _is_number(s) or THOUSANDS_NUMBER.match(s):
+        return _FLOAT
+    return _STR
+
+
+def _format_float(s: str) -> str:
+    if not s:
+        return s
+    if ',' in s:
+        s = s.replace(',', '')
+    try:
+        return format(float(s), 'g')
+    except ValueError:
+        return s
+
+
+def _afterpoint(s: str) -> int:
+    """Digits after the decimal point (or exponent marker), -1 for integers and text"""
+    if _is_number(s) or THOUSANDS_NUMBER.match(s):
+        if _is_int(s):
+            return -1
+        pos = s.rfind('.')
+        pos = s.lower().rfind('e') if pos < 0 else pos
+        return len(s) - pos - 1 if pos >= 0 else -1
+    return -1
+
+
+def _align_cells(cells: List[str], numeric: bool, minwidth: int, multiline: bool) -> List[str]:
+    if numeric:
+        decimals = [_afterpoint(s) for s in cells]
+        most = max(decimals)
+        cells = [s + (most - d) * ' ' for s, d in zip(cells, decimals)]
+        pad = str.rjust
+    else:
+        cells = [s.strip() for s in cells]
+        pad = str.ljust
+
+    if not multiline:
+        widths = [_width(s) for s in cells]
+        maxwidth = max(max(widths), minwidth)
+        return [pad(s, maxwidth - (w - len(s))) for s, w in zip(cells, widths)]
+
+    line_widths = [[_width(line) for line in s.split('\n')] for s in cells]
+    maxwidth = max(max(chain.from_iterable(line_widths)), minwidth)
+    return [
+        '\n'.join(pad(line, maxwidth - (w - len(line))) for line, w in zip(s.splitlines() or s, widths))
+        for s, widths in zip(cells, line_widths)
+    ]
+
+
+def pipe_table(headers: Sequence, rows: Sequence[Sequence[str]]) -> Optional[str]:
+    """
+    Markdown pipe table identical to tabulate(rows, headers, tablefmt='pipe').
+
+    Returns None when the table needs a tabulate code path that is not mirrored here.
+    """
+    headers = [str(h) for h in headers]
+    rows = [list(row) for row in rows]
+    if not headers or not rows or any(len(row) != len(headers) for row in rows):
+        return None
+    if not all(type(cell) is str for cell in chain.from_iterable(rows)):
+        return None
+
+    text = '\t'.join(chain(headers, chain.from_iterable(rows)))
+    if UNSUPPORTED_CHARS.search(text) or any('\n' in h for h in headers):
+        return None
+    multiline = '\n' in text
+    width = _multiline_width if multiline else _width
+
+    columns, numeric, widths = [], [], []
+    for header, cells in zip(headers, map(list, zip(*rows))):
+        ctype = max(_BOOL, max(map(_cell_type, cells)))
+        if ctype == _FLOAT:
+            cells = [_format_float(s) for s in cells]
+        is_numeric = ctype in (_INT, _FLOAT)
+        minwidth = width(header) + MIN_PADDING
+        cells = _align_cells(cells, is_numeric, minwidth, multiline)
+        columns.append(cells)
+        numeric.append(is_numeric)
+        widths.append(max(minwidth, max(map(width, cells))))
+
+    header_cells = [
+        (str.rjust if is_numeric else str.ljust)(h, w + len(h) - _width(h))
+        for h, is_numeric, w in zip(headers, numeric, widths)
+    ]
+    rule = '|'.join('-' * (w + 1) + ':' if is_numeric else ':' + '-' * (w + 1)
+                    for is_numeric, w in zip(numeric, widths))
+    lines = ['| ' + ' | '.join(header_cells) + ' |', '|' + rule + '|']
+
+    if not multiline:
+        lines.extend('| ' + ' | '.join(row) + ' |' for row in zip(*columns))
+        return '\n'.join(lines)
+
+    for row in zip(*columns):
+        cell_lines = [cell.splitlines() for cell in row]
+        height = max(map(len, cell_lines))
+        cell_lines = [cl + [' ' * w] * (height - len(cl)) for cl, w in zip(cell_lines, widths)]
+        lines.extend('| ' + ' | '.join(cl[i] for cl in cell_lines) + ' |' for i in range(height))
+    return '\n'.join(lines)
+
+
+def frame_to_markdown(df: pd.DataFrame) -> Optional[str]:
+    """pipe_table for a DataFrame without its index (df.to_markdown(index=False))"""
+    return pipe_table(df.columns, df.to_numpy(dtype=object).tolist())
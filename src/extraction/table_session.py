@@ -0,0 +1,110 @@
+"""
+Table Engine Session
+
+Document-level handles for the table engines. The source PDF is parsed once
+per document by pdfplumber; Camelot runs with `pages=` on the source file
+only for the pages that fall back to it (each at most once), so page workers
+never repeat a whole-document pass. No per-page temp PDFs are written.
+"""
+
+from __future__ import annotations
+
+import errno
+import io
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+
+
+def camelot_bbox(table) -> Tuple[float, float, float, float]:
+    """(x0, y0, x1, y1) of a Camelot table in PDF space (Camelot 2.x keeps it as _bbox)"""
+    bbox = getattr(table, 'bbox', None)
+    if bbox is None:
+        bbox = table._bbox
+    return tuple(float(v) for v in bbox)
+
+
+def _read_camelot(pdf_path: str, flavor: str, pages: str) -> List:
+    import camelot
+
+    try:
+        return list(camelot.read_pdf(pdf_path, flavor=flavor, pages=pages))
+    except OSError as e:
+        # Failed mmap/fork under the worker memory cap: a MemoryError for the caller
+        if e.errno == errno.ENOMEM:
+            raise MemoryError(str(e)) from e
+        raise
+
+
+class TableEngineSession:
+    """One pdfplumber handle per document and at most one Camelot pass per page"""
+
+    def __init__(self, doc: fitz.Document):
+        # Path of the source file; in-memory documents are served from their bytes
+        self.pdf_path: Optional[str] = doc.name or None
+        self._doc = doc
+        self._plumber = None
+        self._camelot_tables: Dict[int, List] = {}
+
+    def matches(self, doc: fitz.Document) -> bool:
+        """True if this session was opened for `doc`"""
+        return doc is self._doc
+
+    def plumber_page(self, page_num: int):
+        """pdfplumber page for 1-based page_num (document parsed once, lazily)"""
+        if self._plumber is None:
+            import pdfplumber
+            source = self.pdf_path or io.BytesIO(self._doc.tobytes())
+            self._plumber = pdfplumber.open(source)
+        return self._plumber.pages[page_num - 1]
+
+    def release_page(self, page_num: int):
+        """Drop pdfplumber's per-page layout cache once the page is done"""
+        if self._plumber is not None:
+            self._plumber.pages[page_num - 1].close()
+
+    def camelot_tables(self, page_num: int, lattice: bool = True) -> List:
+        """
+        Camelot tables for 1-based page_num.
+
+        Camelot reads only this page of the source file (lattice, falling back
+        to stream; stream only if `lattice` is False, i.e. the page has no
+        ruling lines); repeated calls for the page are lookups.
+        """
+        if page_num not in self._camelot_tables:
+            self._camelot_tables[page_num] = self._run_camelot(page_num, lattice)
+        return self._camelot_tables[page_num]
+
+    def _run_camelot(self, page_num: int, lattice: bool) -> List:
+        if not self.pdf_path:
+            logger.debug("Camelot needs a file path; skipping in-memory document")
+            return []
+
+        pages = str(page_num)
+        # Try lattice mode (better for bordered tables; needs ruling lines)
+        if lattice:
+            try:
+                return _read_camelot(self.pdf_path, 'lattice', pages)
+            except MemoryError:
+                raise
+            except Exception:
+                pass
+        # Fallback to stream mode (aligns words, works without rulings)
+        try:
+            return _read_camelot(self.pdf_path, 'stream', pages)
+        except MemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"Camelot failed on page {page_num} of {self.pdf_path}: {e}")
+            return []
+
+    def close(self):
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+        self._camelot_tables = {}
+        self._doc = None
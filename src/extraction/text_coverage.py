@@ -0,0 +1,97 @@
+"""
+Text-Layer Coverage
+
+Spatial index over a page's text spans, used to decide whether an image
+block still needs OCR: when the PDF text layer already covers the image
+(text overlaid on a banner or a full-page background), OCR would only
+duplicate text that extraction has already read.
+
+Spans are bucketed in a uniform grid so a query only visits spans near the
+image; coverage is the share of the image area under the union of the spans
+that lie (mostly) inside it, rasterized on a coarse point grid.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+Rect = Tuple[float, float, float, float]
+
+# Grid cell size of the span index (points)
+CELL_SIZE = 32.0
+# A span counts for an image when at least this share of it lies inside the image
+SPAN_INSIDE_RATIO = 0.5
+# Resolution of the coverage raster (points per cell)
+COVERAGE_RESOLUTION = 2.0
+# Image is treated as covered by the text layer at or above this area share...
+MIN_COVERED_RATIO = 0.15
+# ...or when this many characters of real text sit on it
+MIN_COVERED_CHARS = 200
+
+
+class SpanIndex:
+    """Uniform-grid spatial index of text span rectangles"""
+
+    def __init__(self, spans: Sequence[Tuple[Rect, str]], cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self.rects: List[Rect] = [tuple(rect) for rect, _ in spans]
+        self.chars: List[int] = [len(text.strip()) for _, text in spans]
+        self._grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, rect in enumerate(self.rects):
+            for cell in self._cells(rect):
+                self._grid[cell].append(i)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def _cells(self, rect: Rect):
+        x0, y0, x1, y1 = rect
+        size = self.cell_size
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                yield cx, cy
+
+    def query(self, bbox: Rect) -> List[int]:
+        """Indices of spans intersecting bbox"""
+        x0, y0, x1, y1 = bbox
+        found = set()
+        for cell in self._cells(bbox):
+            for i in self._grid.get(cell, ()):
+                if i in found:
+                    continue
+                rx0, ry0, rx1, ry1 = self.rects[i]
+                if rx0 < x1 and rx1 > x0 and ry0 < y1 and ry1 > y0:
+                    found.add(i)
+        return sorted(found)
+
+    def coverage(self, bbox: Rect) -> Tuple[float, int]:
+        """
+        (share of bbox area under spans lying inside it, characters in those spans)
+        """
+        x0, y0, x1, y1 = bbox
+        width, height = x1 - x0, y1 - y0
+        if width <= 0 or height <= 0:
+            return 0.0, 0
+
+        res = COVERAGE_RESOLUTION
+        mask = np.zeros((int(np.ceil(height / res)), int(np.ceil(width / res))), dtype=bool)
+        chars = 0
+        for i in self.query(bbox):
+            rx0, ry0, rx1, ry1 = self.rects[i]
+            ix0, iy0, ix1, iy1 = max(rx0, x0), max(ry0, y0), min(rx1, x1), min(ry1, y1)
+            span_area = (rx1 - rx0) * (ry1 - ry0)
+            if span_area <= 0 or (ix1 - ix0) * (iy1 - iy0) < SPAN_INSIDE_RATIO * span_area:
+                continue
+            chars += self.chars[i]
+            mask[int((iy0 - y0) // res):int(np.ceil((iy1 - y0) / res)),
+                 int((ix0 - x0) // res):int(np.ceil((ix1 - x0) / res))] = True
+
+        return float(mask.mean()), chars
+
+    def covers(self, bbox: Rect) -> bool:
+        """True when the text layer already carries the text of bbox"""
+        ratio, chars = self.coverage(bbox)
+        return ratio >= MIN_COVERED_RATIO or chars >= MIN_COVERED_CHARS
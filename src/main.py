@@ -1,3 +1,4 @@
+import asyncio
 import uvicorn
 import sys
 import os
@@ -58,6 +59,9 @@ async def lifespan(app: FastAPI):
         logger.info(f"  Active Namespace: {active_namespace}")
         logger.info(f"  LLM Model: {global_config.llm.model}")
         logger.info(f"  Pinecone Index: {global_config.vectorstore.pinecone_index}")
+
+        from src.core.namespaces_config import log_namespace_summary
+        log_namespace_summary()
         
         # 2. Inisialisasi Pinecone with global config
         pc = Pinecone(api_key=PINECONE_API_KEY)
@@ -70,6 +74,11 @@ async def lifespan(app: FastAPI):
         app.state.chat_model = ChatOpenAI(model=global_config.llm.model, temperature=global_config.llm.temperature)
         logger.info(f"✓ Model AI berhasil diinisialisasi: {global_config.llm.model}")
 
+        # 4. Lanjutkan dokumen yang pipeline-nya terputus (crash/redeploy) di background
+        if global_config.performance.pipeline_optimization.auto_resume_on_startup:
+            from src.orchestration.document_orchestrator import resume_interrupted_documents
+            app.state.resume_task = asyncio.create_task(resume_interrupted_documents(PIPELINE_ARTEFACTS_DIR))
+
     except Exception as e:
         logger.critical(f"GAGAL TOTAL SAAT STARTUP! Tidak dapat menginisialisasi sumber daya. Error: {e}")
         app.state.pinecone_client = None
@@ -80,6 +89,10 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutdown Aplikasi: Membersihkan sumber daya...")
+    resume_task = getattr(app.state, "resume_task", None)
+    if resume_task is not None and not resume_task.done():
+        # Dokumen yang belum selesai tetap *_in_progress dan dilanjutkan lagi saat startup berikutnya
+        resume_task.cancel()
     app.state.pinecone_client = None
     app.state.pinecone_index = None
     app.state.embedding_function = None
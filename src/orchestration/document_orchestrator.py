@@ -12,8 +12,13 @@ This orchestrator eliminates all manual steps and runs entirely in the backgroun
 """
 
 import asyncio
+import functools
+import hashlib
+import json
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from datetime import datetime
 from loguru import logger
 
@@ -188,6 +193,37 @@ class ProcessingState:
         """Check if processing is complete"""
         return self.current_stage == "ready"
     
+    def is_interrupted(self) -> bool:
+        """
+        Check if processing stopped without finishing or failing: past upload,
+        not ready, and no error recorded since the current stage was entered
+        (process killed or redeployed mid-pipeline)
+        """
+        if self.current_stage not in self.STAGES or self.current_stage in ("uploaded", "ready"):
+            return False
+        entered_at = self.stage_timestamps.get(self.current_stage, "")
+        return not any(error.get("timestamp", "") >= entered_at for error in self.errors)
+    
+    def resume_from(self, stage: str):
+        """
+        Continue after `stage`, the last stage whose artefacts are intact
+        
+        The interruption is recorded in metadata["resumes"]; stage durations
+        restart from now so the downtime does not count towards the ETA.
+        """
+        now = datetime.now().isoformat()
+        self.metadata.setdefault("resumes", []).append({
+            "interrupted_stage": self.current_stage,
+            "interrupted_at": self.stage_timestamps.get(self.current_stage),
+            "resumed_from": stage,
+            "resumed_at": now
+        })
+        self.current_stage = stage
+        self.stage_timestamps[stage] = now
+        self.current_stage_start_time = datetime.now()
+        self.stage_progress = {}
+        self.save()
+    
     def save(self):
         """Save state to JSON file"""
         import json
@@ -233,6 +269,18 @@ class ProcessingState:
         return state
 
 
+def file_sha256(path) -> Optional[str]:
+    """SHA-256 of a stage artefact, None if it does not exist"""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 class DocumentOrchestrator:
     """
     Automated document processing orchestrator
@@ -241,6 +289,15 @@ class DocumentOrchestrator:
     background processing using client-specific configuration profiles.
     """
     
+    # Artefact checkpoints in pipeline order: (completed stage, metadata key of
+    # the artefact path, metadata key of its checksum). A stage is skipped on
+    # resume when its artefact and every earlier one still match their checksum.
+    CHECKPOINTS = [
+        ("ocr_completed", "markdown_path", "markdown_sha256"),
+        ("enhancement_completed", "enhancements_file", "enhancements_sha256"),
+        ("synthesis_completed", "final_markdown_path", "final_markdown_sha256"),
+    ]
+    
     def __init__(
         self,
         doc_id: str,
@@ -291,46 +348,142 @@ class DocumentOrchestrator:
             logger.info(f"[{self.doc_id[:8]}...] ======== PIPELINE START ========")
             
             # Stage 1: OCR & Conversion
-            await self._step_1_ocr_conversion()
+            await self.run_extraction_stage()
             
-            # Stage 2: Enhancement
-            await self._step_2_enhancement()
+            # Stages 2-4: Enhancement, auto-approval, synthesis
+            await self.run_enhancement_stage()
             
-            # Stage 3: Auto-approval (immediate, no user interaction)
-            await self._step_3_auto_approval()
-            
-            # Stage 4: Synthesis
-            await self._step_4_synthesis()
-            
-            # Stage 5: Vectorization
-            await self._step_5_vectorization()
-            
-            # Mark as ready
-            self.state.set_stage("ready", {
-                "completed_at": datetime.now().isoformat()
-            })
-            
-            logger.info(f"[{self.doc_id[:8]}...] ======== COMPLETE ========")
+            # Stage 5: Vectorization, then ready
+            return await self.run_vectorization_stage()
             
+        except Exception as e:
+            logger.error(f"[{self.doc_id}] Pipeline failed: {e}", exc_info=True)
+            self.state.add_error(self.state.current_stage, str(e))
+            raise
+    
+    async def resume_pipeline(self) -> Dict[str, Any]:
+        """
+        Resume an interrupted pipeline from the last completed stage
+        
+        Reloads processing_state.json and skips every stage whose artefact
+        (markdown v1, enhancements.json, markdown v2) still matches the checksum
+        recorded when the stage completed. Vectorization is re-run unless it
+        completed; Pinecone IDs are deterministic, so re-upserting overwrites.
+        
+        Returns:
+            Processing summary
+        """
+        self.state = ProcessingState.load(self.doc_id, self.artefacts_dir)
+        if self.state.is_complete():
             return self._get_processing_summary()
+        
+        verified = self._verified_checkpoints()
+        resume_stage = self.CHECKPOINTS[verified - 1][0] if verified else "uploaded"
+        if verified == len(self.CHECKPOINTS) and self.state.current_stage == "vectorization_completed":
+            resume_stage = "vectorization_completed"
+        
+        logger.info(f"[{self.doc_id[:8]}...] ======== RESUME: {self.state.current_stage} → after {resume_stage} ========")
+        self.state.resume_from(resume_stage)
+        
+        try:
+            if verified < 1:
+                await self.run_extraction_stage()
+            if verified < 2:
+                await self._step_2_enhancement()
+            if verified < 3:
+                await self._step_3_auto_approval()
+                await self._step_4_synthesis()
+            if resume_stage == "vectorization_completed":
+                self.state.set_stage("ready", {"completed_at": datetime.now().isoformat()})
+                return self._get_processing_summary()
+            return await self.run_vectorization_stage()
             
         except Exception as e:
-            logger.error(f"[{self.doc_id}] Pipeline failed: {e}", exc_info=True)
+            logger.error(f"[{self.doc_id}] Resumed pipeline failed: {e}", exc_info=True)
             self.state.add_error(self.state.current_stage, str(e))
             raise
     
-    async def _step_1_ocr_conversion(self):
+    def _verified_checkpoints(self) -> int:
+        """Number of leading CHECKPOINTS whose artefact matches its recorded checksum"""
+        verified = 0
+        for stage, path_key, checksum_key in self.CHECKPOINTS:
+            stage_meta = self.state.metadata.get(stage, {})
+            path = stage_meta.get(path_key)
+            checksum = stage_meta.get(checksum_key)
+            if stage not in self.state.stage_timestamps or not path or not checksum:
+                break
+            if file_sha256(path) != checksum:
+                logger.warning(f"[{self.doc_id[:8]}...] {Path(path).name} changed or missing since {stage}")
+                break
+            verified += 1
+        return verified
+    
+    # The pipeline in three stage groups, so a batch scheduler can give each
+    # group its own concurrency limit (see stage_scheduler.py)
+    
+    async def run_extraction_stage(
+        self,
+        executor: Optional[Executor] = None,
+        page_workers: Optional[int] = None
+    ):
+        """
+        CPU stage: OCR & conversion (step 1)
+        
+        Args:
+            executor: Process pool to run extraction in (default: a thread of this process)
+            page_workers: Page-parallel workers per document (default: from global config)
+        """
+        await self._step_1_ocr_conversion(executor=executor, page_workers=page_workers)
+    
+    async def run_enhancement_stage(self):
+        """LLM stage: enhancement, auto-approval and synthesis (steps 2-4)"""
+        # Stage 2: Enhancement
+        await self._step_2_enhancement()
+        
+        # Stage 3: Auto-approval (immediate, no user interaction)
+        await self._step_3_auto_approval()
+        
+        # Stage 4: Synthesis
+        await self._step_4_synthesis()
+    
+    async def run_vectorization_stage(self, upsert_slots=None) -> Dict[str, Any]:
+        """
+        Embedding/upsert stage: vectorization (step 5), then mark the document ready
+        
+        Args:
+            upsert_slots: Optional threading semaphore bounding concurrent Pinecone upserts
+        
+        Returns:
+            Processing summary
+        """
+        await self._step_5_vectorization(upsert_slots=upsert_slots)
+        
+        # Mark as ready
+        self.state.set_stage("ready", {
+            "completed_at": datetime.now().isoformat()
+        })
+        
+        logger.info(f"[{self.doc_id[:8]}...] ======== COMPLETE ========")
+        
+        return self._get_processing_summary()
+    
+    async def _step_1_ocr_conversion(
+        self,
+        executor: Optional[Executor] = None,
+        page_workers: Optional[int] = None
+    ):
         """
         Step 1: OCR and Markdown Conversion
         
         Uses Tesseract OCR (local) to extract text and convert to markdown.
         No user interaction needed - runs automatically.
         """
-        self.state.set_stage("ocr_in_progress")
+        self.state.set_stage("ocr_in_progress", {"namespace": self.namespace})
         
         try:
             # Import extraction module
             from ..extraction.extractor import extract_pdf_to_markdown
+            from ..extraction.extraction_pool import ExtractionMemoryLimitExceeded
             from ..shared.document_meta import get_original_pdf_filename
             
             # Paths
@@ -343,16 +496,83 @@ class DocumentOrchestrator:
             # Get original filename
             original_filename = get_original_pdf_filename(output_dir) or "document.pdf"
             
-            # Run extraction with OCR settings from global config
-            result = await asyncio.to_thread(
-                extract_pdf_to_markdown,
-                doc_id=self.doc_id,
-                pdf_path=str(pdf_path),
-                out_dir=str(self.artefacts_dir),
-                original_filename=original_filename,
-                ocr_primary_psm=3,  # Use standard layout PSM
-                ocr_fallback_psm=[6, 11]
+            # Page-parallel extraction bounded by the dedicated CPU cores
+            perf_config = self.global_config.performance.multi_file_processing
+            if page_workers is None:
+                page_workers = perf_config.max_cpu_cores_dedicated if perf_config.enable_page_parallel_extraction else 1
+            
+            # Extraction speed profile (namespace → client profile → global default)
+            profile_name = self.profile_loader.get_extraction_profile_for_namespace(self.namespace)
+            extraction_settings = self.global_config.extraction.resolve(profile_name, self.global_config.ocr)
+            logger.info(f"[{self.doc_id[:8]}...] Extraction profile: {extraction_settings['extraction_profile']}")
+            
+            # Warm extraction processes keep CPU-bound extraction off the API's event loop
+            if executor is None and perf_config.extraction_process_pool:
+                from ..extraction.extraction_pool import get_extraction_pool
+                executor = get_extraction_pool(
+                    perf_config.max_cpu_cores_dedicated,
+                    perf_config.extraction_worker_max_documents
+                )
+                # Concurrent documents share the dedicated cores: split them over the warm
+                # workers like the staged batch path does (no cores x cores page processes)
+                page_workers = max(1, page_workers // executor.workers)
+            # The memory cap needs a dedicated worker process (it applies to the whole process)
+            memory_limit_mb = (
+                perf_config.memory_limit_per_file_mb
+                if perf_config.enforce_memory_limit and executor is not None else None
             )
+            # The cap and peak RSS cover only that process: a capped document runs its pages
+            # and OCR inside it (no page worker or OCR pool processes). The cap is opt-in
+            # (enforce_memory_limit), so the default path keeps both
+            ocr_pool_workers = self.global_config.ocr.pool_workers
+            if memory_limit_mb is not None:
+                page_workers, ocr_pool_workers = 1, 0
+            
+            def build_extract(settings: Dict[str, Any], workers: int):
+                # Run extraction with OCR settings from global config + profile
+                return functools.partial(
+                    extract_pdf_to_markdown,
+                    doc_id=self.doc_id,
+                    pdf_path=str(pdf_path),
+                    out_dir=str(self.artefacts_dir),
+                    original_filename=original_filename,
+                    page_workers=workers,
+                    enable_ocr_cache=self.global_config.ocr.cache_enabled,
+                    ocr_cache_max_mb=self.global_config.ocr.cache_max_mb,
+                    ocr_pool_workers=ocr_pool_workers,
+                    table_engine=self.global_config.extraction.table_engine,
+                    **settings
+                )
+            
+            progress_path = output_dir / "conversion_progress.json"
+            
+            try:
+                result, memory = await self._run_extraction(
+                    build_extract(extraction_settings, page_workers), executor, memory_limit_mb, progress_path
+                )
+            except (ExtractionMemoryLimitExceeded, BrokenProcessPool) as e:
+                # BrokenProcessPool: the worker was killed, most likely by the kernel OOM killer
+                if memory_limit_mb is None:
+                    raise
+                
+                # Retry once with the low-memory profile
+                low_memory_settings = self.global_config.extraction.resolve(
+                    perf_config.low_memory_extraction_profile, self.global_config.ocr
+                )
+                logger.warning(
+                    f"[{self.doc_id[:8]}...] Extraction hit the {memory_limit_mb}MB memory limit ({e}), "
+                    f"retrying with profile '{low_memory_settings['extraction_profile']}'"
+                )
+                first_attempt = {
+                    "extraction_profile": extraction_settings["extraction_profile"],
+                    "memory_limit_mb": memory_limit_mb,
+                    "peak_rss_mb": round(e.peak_rss_mb, 1) if isinstance(e, ExtractionMemoryLimitExceeded) else None,
+                    "error": str(e),
+                }
+                result, memory = await self._run_extraction(
+                    build_extract(low_memory_settings, 1), executor, memory_limit_mb, progress_path
+                )
+                memory["low_memory_retry"] = first_attempt
             
             # Get markdown path
             from ..shared.document_meta import get_markdown_path
@@ -372,7 +592,9 @@ class DocumentOrchestrator:
             
             self.state.set_stage("ocr_completed", {
                 "total_pages": total_pages,
-                "markdown_path": str(markdown_path)
+                "markdown_path": str(markdown_path),
+                "markdown_sha256": file_sha256(markdown_path),
+                **memory
             })
             
             logger.info(f"[{self.doc_id[:8]}...] ✓ OCR → {total_pages}p")
@@ -382,6 +604,58 @@ class DocumentOrchestrator:
             self.state.add_error("ocr_in_progress", str(e))
             raise
     
+    async def _run_extraction(
+        self,
+        extract: functools.partial,
+        executor: Optional[Executor],
+        memory_limit_mb: Optional[int],
+        progress_path: Path
+    ):
+        """
+        Run one extraction attempt
+        
+        Returns:
+            (ExtractionResult, memory usage for processing_state.json: peak_rss_mb,
+             memory_limit_mb; empty when no memory limit applies)
+        """
+        if executor is None:
+            extraction = asyncio.ensure_future(asyncio.to_thread(extract))
+            return await self._await_extraction(extraction, progress_path), {}
+        
+        loop = asyncio.get_running_loop()
+        if memory_limit_mb is None:
+            extraction = loop.run_in_executor(executor, extract)
+            return await self._await_extraction(extraction, progress_path), {}
+        
+        from ..extraction.extraction_pool import run_with_memory_limit
+        extraction = loop.run_in_executor(
+            executor, functools.partial(run_with_memory_limit, extract, memory_limit_mb)
+        )
+        return await self._await_extraction(extraction, progress_path)
+    
+    async def _await_extraction(self, extraction: asyncio.Future, progress_path: Path):
+        """
+        Wait for the extraction while mirroring the extractor's progress
+        (conversion_progress.json) into processing_state.json
+        """
+        interval = self.global_config.performance.progress_tracking.update_interval_seconds
+        last_progress = None
+        while True:
+            done, _ = await asyncio.wait({extraction}, timeout=interval)
+            if done:
+                return extraction.result()
+            try:
+                progress = json.loads(progress_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            if progress.get("status") != "running" or progress == last_progress:
+                continue
+            last_progress = progress
+            self.state.update_stage_progress("ocr_in_progress", {
+                "percentage": round(progress.get("percent", 0) * 100, 1),
+                "message": progress.get("message", "")
+            })
+    
     async def _step_2_enhancement(self):
         """
         Step 2: Enhancement
@@ -394,6 +668,7 @@ class DocumentOrchestrator:
         try:
             from ..enhancement.enhancer import DirectEnhancerV2
             from ..enhancement.config import EnhancementConfig
+            from ..shared.unit_store import UNIT_STORE_FILENAME, UnitStore
             import json
             
             # Get markdown path from state
@@ -404,16 +679,19 @@ class DocumentOrchestrator:
             # Load units metadata and tables
             doc_dir = self.artefacts_dir / self.doc_id
             
-            # Try both locations for units_metadata
+            # Columnar unit store; legacy JSON (root, then meta/) for older artefacts
+            units_store_path = doc_dir / UNIT_STORE_FILENAME
             units_meta_path = doc_dir / "units_metadata.json"
             if not units_meta_path.exists():
                 units_meta_path = doc_dir / "meta" / "units_metadata.json"
             
             tables_path = doc_dir / "tables.json"
             
-            # Load units metadata as list (not dict)
+            # Store records are read lazily; JSON is loaded as a list (not dict)
             units_metadata_list = []
-            if units_meta_path.exists():
+            if units_store_path.exists():
+                units_metadata_list = UnitStore.load(units_store_path)
+            elif units_meta_path.exists():
                 with open(units_meta_path, 'r', encoding='utf-8') as f:
                     units_metadata_list = json.load(f)
             else:
@@ -462,6 +740,7 @@ class DocumentOrchestrator:
             self.state.set_stage("enhancement_completed", {
                 "total_enhancements": len(enhancements),
                 "enhancements_file": str(enhancements_file),
+                "enhancements_sha256": file_sha256(enhancements_file),
                 "type_distribution": dict(type_distribution)
             })
             
@@ -483,10 +762,16 @@ class DocumentOrchestrator:
         # Auto-approval is immediate - no processing needed
         # All enhancements generated in step 2 are already considered approved
         
-        self.state.set_stage("auto_approval_completed", {
-            "auto_approve_all": self.global_config.enhancement.auto_approve_all,
-            "approval_timestamp": datetime.now().isoformat()
-        })
+        try:
+            self.state.set_stage("auto_approval_completed", {
+                "auto_approve_all": self.global_config.enhancement.auto_approve_all,
+                "approval_timestamp": datetime.now().isoformat()
+            })
+            
+        except Exception as e:
+            logger.error(f"Auto-approval failed: {e}")
+            self.state.add_error("auto_approval_completed", str(e))
+            raise
     
     async def _step_4_synthesis(self):
         """
@@ -527,6 +812,7 @@ class DocumentOrchestrator:
             
             self.state.set_stage("synthesis_completed", {
                 "final_markdown_path": result_path,
+                "final_markdown_sha256": file_sha256(result_path),
                 "total_enhancements": len(curated_suggestions)
             })
             
@@ -537,7 +823,7 @@ class DocumentOrchestrator:
             self.state.add_error("synthesis_in_progress", str(e))
             raise
     
-    async def _step_5_vectorization(self):
+    async def _step_5_vectorization(self, upsert_slots=None):
         """
         Step 5: Vectorization
         
@@ -573,7 +859,8 @@ class DocumentOrchestrator:
                     v1_rel,
                     "v1",
                     embeddings=embeddings,
-                    namespace=self.namespace
+                    namespace=self.namespace,
+                    upsert_slots=upsert_slots
                 )
             
             # Vectorize v2 (enhanced)
@@ -586,7 +873,8 @@ class DocumentOrchestrator:
                     v2_rel,
                     "v2",
                     embeddings=embeddings,
-                    namespace=self.namespace
+                    namespace=self.namespace,
+                    upsert_slots=upsert_slots
                 )
             
             self.state.set_stage("vectorization_completed", {
@@ -641,3 +929,81 @@ class DocumentOrchestrator:
             "errors": self.state.errors,
             "last_updated": datetime.now().isoformat()
         }
+
+
+# Documents whose pipeline is running in this process (uploads, batches, resumes):
+# processing_state.json alone cannot tell a running pipeline from a killed one
+_running_documents: Set[str] = set()
+
+
+def claim_document(doc_id: str) -> bool:
+    """Register a pipeline run of doc_id in this process; False if one is already running"""
+    if doc_id in _running_documents:
+        return False
+    _running_documents.add(doc_id)
+    return True
+
+
+def release_document(doc_id: str):
+    """Forget a finished (or failed) pipeline run of doc_id"""
+    _running_documents.discard(doc_id)
+
+
+def is_document_running(doc_id: str) -> bool:
+    return doc_id in _running_documents
+
+
+def find_interrupted_documents(artefacts_dir: str = "artefacts") -> List[str]:
+    """Document IDs whose processing_state.json shows an interrupted pipeline not running here"""
+    artefacts_path = Path(artefacts_dir)
+    if not artefacts_path.is_dir():
+        return []
+    
+    doc_ids = []
+    for state_file in sorted(artefacts_path.glob("*/processing_state.json")):
+        doc_id = state_file.parent.name
+        try:
+            if not is_document_running(doc_id) and ProcessingState.load(doc_id, artefacts_path).is_interrupted():
+                doc_ids.append(doc_id)
+        except Exception as e:
+            logger.warning(f"[{doc_id[:8]}...] Unreadable processing state: {e}")
+    return doc_ids
+
+
+async def resume_document(doc_id: str, artefacts_dir: str = "artefacts") -> Dict[str, Any]:
+    """Resume one document in the namespace it was started with (see DocumentOrchestrator.resume_pipeline)"""
+    state = ProcessingState.load(doc_id, Path(artefacts_dir))
+    namespace = state.metadata.get("ocr_in_progress", {}).get("namespace")
+    orchestrator = DocumentOrchestrator(doc_id=doc_id, namespace=namespace, artefacts_dir=artefacts_dir)
+    return await orchestrator.resume_pipeline()
+
+
+async def resume_interrupted_documents(artefacts_dir: str = "artefacts") -> Dict[str, str]:
+    """
+    Resume every interrupted document, one at a time
+    
+    Returns:
+        {doc_id: "ready", "already running" or the error that stopped the resumed pipeline}
+    """
+    doc_ids = find_interrupted_documents(artefacts_dir)
+    if not doc_ids:
+        return {}
+    
+    logger.info(f"Resuming {len(doc_ids)} interrupted document(s)")
+    outcomes = {}
+    for doc_id in doc_ids:
+        if not claim_document(doc_id):
+            # Resumed through the API meanwhile
+            outcomes[doc_id] = "already running"
+            continue
+        try:
+            await resume_document(doc_id, artefacts_dir)
+            outcomes[doc_id] = "ready"
+        except Exception as e:
+            outcomes[doc_id] = str(e)
+        finally:
+            release_document(doc_id)
+    
+    resumed = sum(1 for outcome in outcomes.values() if outcome == "ready")
+    logger.info(f"Resume finished: {resumed}/{len(doc_ids)} document(s) ready")
+    return outcomes
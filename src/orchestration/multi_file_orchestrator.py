@@ -6,13 +6,18 @@ Uses global_config.json for performance settings.
 """
 
 import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
 from .document_orchestrator import DocumentOrchestrator
+from .stage_scheduler import Stage, StageScheduler
 from ..core.enhancement_profiles import ProfileLoader
+from ..extraction.extraction_pool import get_extraction_pool
 
 # Optional: Try to import psutil for CPU monitoring
 try:
@@ -28,9 +33,13 @@ class MultiFileOrchestrator:
     Orchestrates parallel processing of multiple documents.
     
     Features:
-    - Configurable concurrency (max files processed simultaneously)
+    - Stage-aware scheduling: extraction in a CPU process pool, enhancement
+      and vectorization as async I/O, each stage with its own limit
+    - Configurable concurrency (max files processed simultaneously) when
+      stage scheduling is disabled
     - CPU monitoring with automatic fallback
-    - Memory limit enforcement per file
+    - Memory limit per file: extraction runs under an address-space cap and
+      retries with a low-memory profile when it hits the limit
     - Progress tracking across all files
     """
     
@@ -66,6 +75,13 @@ class MultiFileOrchestrator:
         self.enable_cpu_monitoring = perf_config.enable_cpu_monitoring
         self.cpu_threshold = perf_config.cpu_threshold_fallback_percent
         self.memory_limit_mb = perf_config.memory_limit_per_file_mb
+        self.enable_page_parallel = perf_config.enable_page_parallel_extraction
+        self.stage_scheduling = perf_config.stage_scheduling
+        self.max_concurrent_enhancements = perf_config.max_concurrent_enhancements
+        self.max_concurrent_vectorizations = perf_config.max_concurrent_vectorizations
+        self.extraction_process_pool = perf_config.extraction_process_pool
+        self.extraction_worker_max_documents = perf_config.extraction_worker_max_documents
+        self.max_concurrent_upserts = self.global_config.vectorstore.max_concurrent_batches
         
         # Tracking
         self.file_statuses: Dict[str, Dict[str, Any]] = {}
@@ -76,11 +92,17 @@ class MultiFileOrchestrator:
         
         logger.info(f"MultiFileOrchestrator initialized")
         logger.info(f"  Namespace: {namespace}")
-        logger.info(f"  Max concurrent files: {self.max_concurrent_files}")
+        logger.info(f"  Stage scheduling: {self.stage_scheduling}")
+        if self.stage_scheduling:
+            logger.info(f"  Stage limits: enhancement={self.max_concurrent_enhancements}, "
+                        f"vectorization={self.max_concurrent_vectorizations}, upserts={self.max_concurrent_upserts}")
+        else:
+            logger.info(f"  Max concurrent files: {self.max_concurrent_files}")
         logger.info(f"  Max CPU cores: {self.max_cpu_cores}")
         logger.info(f"  CPU monitoring: {self.enable_cpu_monitoring}")
         logger.info(f"  CPU threshold: {self.cpu_threshold}%")
-        logger.info(f"  Memory limit per file: {self.memory_limit_mb}MB")
+        logger.info(f"  Memory limit per file: {self.memory_limit_mb}MB "
+                    f"({'enforced in extraction workers' if perf_config.enforce_memory_limit else 'not enforced'})")
     
     def _check_cpu_usage(self) -> float:
         """
@@ -160,7 +182,8 @@ class MultiFileOrchestrator:
         
         logger.info(f"======== MULTI-FILE PROCESSING START ========")
         logger.info(f"Total files: {self.total_files}")
-        logger.info(f"Concurrency: {self.max_concurrent_files}")
+        if not self.stage_scheduling:
+            logger.info(f"Concurrency: {self.max_concurrent_files}")
         
         # Log system info if monitoring enabled
         if PSUTIL_AVAILABLE and self.enable_cpu_monitoring:
@@ -188,30 +211,15 @@ class MultiFileOrchestrator:
             }
         
         # Check if should use sequential processing
-        concurrent_limit = self.max_concurrent_files
-        if self._should_fallback_to_sequential():
-            concurrent_limit = 1
-            logger.info(f"Using sequential processing (concurrency=1) due to CPU constraints")
-        
-        # Process files with semaphore for concurrency control
-        semaphore = asyncio.Semaphore(concurrent_limit)
-        
-        logger.info(f"[Multi-File] Created semaphore with limit: {concurrent_limit}")
-        logger.info(f"[Multi-File] Will process {len(doc_ids)} files with max {concurrent_limit} concurrent")
-        
-        async def process_single_file(doc_id: str, index: int) -> Dict[str, Any]:
-            """Process a single file with semaphore"""
-            logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) waiting for semaphore slot...")
-            async with semaphore:
-                logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) acquired semaphore, starting processing...")
-                result = await self._process_file(doc_id)
-                logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) released semaphore")
-                return result
+        cpu_constrained = self._should_fallback_to_sequential()
+        stage_stats = None
         
-        # Execute all files
         try:
-            tasks = [process_single_file(doc_id, idx) for idx, doc_id in enumerate(doc_ids)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if self.stage_scheduling:
+                results, concurrency_used, stage_stats = await self._process_files_staged(doc_ids, cpu_constrained)
+            else:
+                results = await self._process_files_whole(doc_ids, cpu_constrained)
+                concurrency_used = 1 if cpu_constrained else self.max_concurrent_files
         finally:
             # Stop monitoring task
             if monitor_task:
@@ -231,6 +239,8 @@ class MultiFileOrchestrator:
                 self.file_statuses[doc_id] = result
                 self.completed_files += 1
             else:
+                if result:
+                    self.file_statuses[doc_id] = result
                 self.failed_files += 1
         
         total_duration = (datetime.now() - start_time).total_seconds()
@@ -242,7 +252,9 @@ class MultiFileOrchestrator:
             "failed": self.failed_files,
             "total_duration_seconds": total_duration,
             "avg_duration_per_file": total_duration / self.total_files if self.total_files > 0 else 0,
-            "concurrency_used": concurrent_limit,
+            "throughput_files_per_minute": self.completed_files * 60 / total_duration if total_duration > 0 else 0,
+            "concurrency_used": concurrency_used,
+            "stage_stats": stage_stats,
             "file_statuses": self.file_statuses,
             "namespace": self.namespace
         }
@@ -251,9 +263,144 @@ class MultiFileOrchestrator:
         logger.info(f"Results: {self.completed_files} completed, {self.failed_files} failed")
         logger.info(f"Total duration: {total_duration:.1f}s")
         logger.info(f"Avg per file: {summary['avg_duration_per_file']:.1f}s")
+        logger.info(f"Throughput: {summary['throughput_files_per_minute']:.2f} files/min")
+        for stage_name, stats in (stage_stats or {}).items():
+            logger.info(
+                f"  {stage_name}: limit {stats['limit']}, busy {stats['busy_seconds']:.1f}s, "
+                f"queued {stats['queue_wait_seconds']:.1f}s, peak {stats['max_active']} active"
+            )
         
         return summary
     
+    async def _process_files_whole(self, doc_ids: List[str], cpu_constrained: bool) -> List[Any]:
+        """
+        Legacy scheduling: each file holds one semaphore slot for its whole pipeline.
+        
+        Returns:
+            One result (or exception) per document, in input order
+        """
+        concurrent_limit = self.max_concurrent_files
+        if cpu_constrained:
+            concurrent_limit = 1
+            logger.info(f"Using sequential processing (concurrency=1) due to CPU constraints")
+        
+        # Process files with semaphore for concurrency control
+        semaphore = asyncio.Semaphore(concurrent_limit)
+        
+        logger.info(f"[Multi-File] Created semaphore with limit: {concurrent_limit}")
+        logger.info(f"[Multi-File] Will process {len(doc_ids)} files with max {concurrent_limit} concurrent")
+        
+        async def process_single_file(doc_id: str, index: int) -> Dict[str, Any]:
+            """Process a single file with semaphore"""
+            logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) waiting for semaphore slot...")
+            async with semaphore:
+                logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) acquired semaphore, starting processing...")
+                result = await self._process_file(doc_id)
+                logger.info(f"[Multi-File] File {index+1}/{len(doc_ids)} ({doc_id[:8]}...) released semaphore")
+                return result
+        
+        # Execute all files
+        tasks = [process_single_file(doc_id, idx) for idx, doc_id in enumerate(doc_ids)]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _process_files_staged(
+        self,
+        doc_ids: List[str],
+        cpu_constrained: bool
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, Dict[str, Any]]]:
+        """
+        Stage-aware scheduling: documents queue per stage instead of per pipeline.
+        
+        - extraction: warm process pool (max_cpu_cores_dedicated workers), one
+          document per CPU slot at a time (page workers split the dedicated
+          cores between the documents extracted at once)
+        - enhancement (+ auto-approval, synthesis): async, max_concurrent_enhancements
+        - vectorization: async, max_concurrent_vectorizations; Pinecone upserts
+          across documents bounded by vectorstore.max_concurrent_batches
+        
+        Returns:
+            (one result per document in input order, stage limits, stage stats)
+        """
+        extraction_slots = 1 if cpu_constrained else max(1, min(self.max_cpu_cores, len(doc_ids)))
+        page_workers = max(1, self.max_cpu_cores // extraction_slots) if self.enable_page_parallel else 1
+        upsert_slots = threading.BoundedSemaphore(self.max_concurrent_upserts)
+        orchestrators: Dict[str, DocumentOrchestrator] = {}
+        
+        logger.info(
+            f"[Multi-File] Stage scheduling: extraction {extraction_slots} process(es) x {page_workers} page worker(s), "
+            f"enhancement {self.max_concurrent_enhancements}, vectorization {self.max_concurrent_vectorizations}"
+        )
+        
+        if self.extraction_process_pool:
+            # Process-wide warm workers, shared with single-document runs and later batches
+            extraction_pool = get_extraction_pool(self.max_cpu_cores, self.extraction_worker_max_documents)
+        else:
+            extraction_pool = ProcessPoolExecutor(
+                max_workers=extraction_slots,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        
+        async def extract(doc_id: str):
+            orchestrators[doc_id] = DocumentOrchestrator(
+                doc_id=doc_id,
+                namespace=self.namespace,
+                artefacts_dir=str(self.artefacts_dir)
+            )
+            await orchestrators[doc_id].run_extraction_stage(executor=extraction_pool, page_workers=page_workers)
+        
+        async def enhance(doc_id: str):
+            await orchestrators[doc_id].run_enhancement_stage()
+        
+        async def vectorize(doc_id: str) -> Dict[str, Any]:
+            return await orchestrators[doc_id].run_vectorization_stage(upsert_slots=upsert_slots)
+        
+        def on_stage_start(doc_id: str, stage_name: str):
+            status = self.file_statuses[doc_id]
+            if status["start_time"] is None:
+                status["start_time"] = datetime.now().isoformat()
+            status["status"] = "processing"
+            status["stage"] = stage_name
+        
+        def on_finish(doc_id: str, outcome: Dict[str, Any]):
+            status = self.file_statuses[doc_id]
+            end_time = datetime.now()
+            status["end_time"] = end_time.isoformat()
+            if status["start_time"]:
+                status["duration_seconds"] = (end_time - datetime.fromisoformat(status["start_time"])).total_seconds()
+            status["stage_seconds"] = outcome["stage_seconds"]
+            if outcome["status"] == "completed":
+                logger.info(f"[Multi-File] ✓ COMPLETED file: {doc_id[:8]}... ({status['duration_seconds']:.1f}s)")
+            else:
+                status["error"] = outcome["error"]
+                logger.error(f"[Multi-File] ✗ FAILED file: {doc_id[:8]}... in {outcome['failed_stage']} - {outcome['error']}")
+            status["status"] = outcome["status"]
+        
+        stages = [
+            Stage("extraction", extraction_slots, extract),
+            Stage("enhancement", self.max_concurrent_enhancements, enhance),
+            Stage("vectorization", self.max_concurrent_vectorizations, vectorize),
+        ]
+        scheduler = StageScheduler(stages, on_stage_start=on_stage_start, on_finish=on_finish)
+        try:
+            outcomes = await scheduler.run(doc_ids)
+        finally:
+            if not self.extraction_process_pool:
+                extraction_pool.shutdown(wait=False, cancel_futures=True)
+        
+        results = []
+        for doc_id in doc_ids:
+            outcome = outcomes[doc_id]
+            results.append({
+                **self.file_statuses[doc_id],
+                "status": outcome["status"],
+                "error": outcome["error"],
+                "failed_stage": outcome["failed_stage"],
+                "result": outcome["result"],
+            })
+        
+        limits = {stage.name: stage.limit for stage in stages}
+        return results, limits, scheduler.stats_dict()
+    
     async def _process_file(self, doc_id: str) -> Dict[str, Any]:
         """
         Process a single file.
@@ -0,0 +1,166 @@
+"""
+Stage Scheduler
+
+Moves a batch of documents through pipeline stages, each with its own queue
+and concurrency limit, instead of holding one slot per document for the whole
+pipeline:
+
+    extraction (CPU, process pool) → enhancement (LLM I/O) → vectorization (embedding + upsert I/O)
+
+A document leaves a stage's slot as soon as that stage is done and waits in the
+next stage's queue, so a document spending minutes on LLM calls does not keep
+the next file from being extracted. Stages run concurrently; a document that
+fails a stage is not passed on.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+@dataclass
+class Stage:
+    """One pipeline stage: `run(doc_id)` is awaited by up to `limit` workers at a time"""
+    name: str
+    limit: int
+    run: Callable[[str], Awaitable[Any]]
+
+
+@dataclass
+class StageStats:
+    """Per-stage timings of one batch"""
+    limit: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+    max_active: int = 0
+    _active: int = field(default=0, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "queue_wait_seconds": round(self.queue_wait_seconds, 3),
+            "max_active": self.max_active,
+        }
+
+
+class StageScheduler:
+    """
+    Runs documents through `stages` in order.
+
+    Each stage has an asyncio.Queue and `limit` worker tasks; a document is
+    queued for the next stage when the current one returns.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        on_stage_start: Optional[Callable[[str, str], None]] = None,
+        on_finish: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
+        """
+        Args:
+            stages: Stages in pipeline order
+            on_stage_start: Optional callback(doc_id, stage_name) when a document enters a stage
+            on_finish: Optional callback(doc_id, result) when a document completes or fails
+        """
+        if not stages:
+            raise ValueError("StageScheduler needs at least one stage")
+        self.stages = stages
+        self.on_stage_start = on_stage_start
+        self.on_finish = on_finish
+        self.stats: Dict[str, StageStats] = {s.name: StageStats(limit=s.limit) for s in stages}
+
+    async def run(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Process all documents.
+
+        Returns:
+            {doc_id: {"status": "completed" | "failed", "result": last stage's return value,
+                      "failed_stage", "error", "stage_seconds": {stage: seconds}}}
+        """
+        results: Dict[str, Dict[str, Any]] = {
+            doc_id: {"status": "pending", "result": None, "failed_stage": None,
+                     "error": None, "stage_seconds": {}}
+            for doc_id in doc_ids
+        }
+        if not doc_ids:
+            return results
+
+        queues = [asyncio.Queue() for _ in self.stages]
+        remaining = len(doc_ids)
+        all_done = asyncio.Event()
+
+        def finish(doc_id: str, status: str):
+            nonlocal remaining
+            results[doc_id]["status"] = status
+            if self.on_finish:
+                self.on_finish(doc_id, results[doc_id])
+            remaining -= 1
+            if remaining == 0:
+                all_done.set()
+
+        async def worker(index: int):
+            stage = self.stages[index]
+            stats = self.stats[stage.name]
+            queue = queues[index]
+            while True:
+                doc_id, queued_at = await queue.get()
+                started = time.perf_counter()
+                stats.queue_wait_seconds += started - queued_at
+                stats._active += 1
+                stats.max_active = max(stats.max_active, stats._active)
+                error = None
+                try:
+                    if self.on_stage_start:
+                        self.on_stage_start(doc_id, stage.name)
+                    result = await stage.run(doc_id)
+                except Exception as e:
+                    error = e
+                elapsed = time.perf_counter() - started
+                stats._active -= 1
+                stats.busy_seconds += elapsed
+                results[doc_id]["stage_seconds"][stage.name] = round(elapsed, 3)
+
+                if error is not None:
+                    logger.error(f"[Scheduler] {doc_id[:8]}... failed in {stage.name}: {error}")
+                    stats.failed += 1
+                    results[doc_id].update(failed_stage=stage.name, error=str(error))
+                    finish(doc_id, "failed")
+                    continue
+
+                stats.processed += 1
+                results[doc_id]["result"] = result
+                if index + 1 < len(self.stages):
+                    queues[index + 1].put_nowait((doc_id, time.perf_counter()))
+                else:
+                    finish(doc_id, "completed")
+
+        now = time.perf_counter()
+        for doc_id in doc_ids:
+            queues[0].put_nowait((doc_id, now))
+
+        workers = [
+            asyncio.create_task(worker(index))
+            for index, stage in enumerate(self.stages)
+            for _ in range(max(1, stage.limit))
+        ]
+        try:
+            await all_done.wait()
+        finally:
+            # Idle once every document finished; on cancellation this also stops running stages
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    def stats_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
@@ -21,5 +21,18 @@ __all__ = [
     'default_markdown_filename',
     'set_markdown_info',
     'set_original_pdf_filename',
-    'get_original_pdf_filename'
+    'get_original_pdf_filename',
+    'UNIT_STORE_FILENAME',
+    'UnitStore',
+    'UnitRecord'
 ]
+
+_UNIT_STORE_NAMES = ('UNIT_STORE_FILENAME', 'UnitStore', 'UnitRecord')
+
+
+def __getattr__(name):
+    # Importing a light submodule (patterns, document_meta, ...) does not load NumPy
+    if name in _UNIT_STORE_NAMES:
+        from . import unit_store
+        return getattr(unit_store, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
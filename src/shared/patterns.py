@@ -0,0 +1,194 @@
+"""
+Shared Text Pattern Bank
+
+Precompiled patterns used by extraction (document properties written to the
+markdown frontmatter) and enhancement (numeric patterns of each window), so
+both stages match dates, periods, currencies and numbers the same way and no
+pattern is recompiled or re-looked-up per call.
+
+Patterns that can share a scan are combined into one alternation:
+
+- ``DATE_PATTERN`` - Indonesian, ISO and short numeric dates in one pass;
+  day names ("Kamis, ...") and English months are only looked up right in
+  front of a candidate date instead of scanning the text for every name,
+- ``TEMPORAL_PATTERN`` - "Q1 2025", "FY2025", "tahun 2025", "year 2025",
+- ``CURRENCY_PATTERN`` / ``QUANTITY_PATTERN`` - IDR/USD amounts; percentages
+  and periods.
+
+Python's ``re`` backtracks position by position, so an alternation only pays
+off when its scan can still jump ahead on a leading literal or character
+class; patterns are written to start that way.
+
+Finders yield matches lazily, so ``unique`` stops scanning as soon as enough
+distinct values are collected. ``NumericPatterns`` keeps per-type counts and
+the first few samples of a text instead of one dict per matched number.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+MONTHS_ID = 'Januari|Februari|Maret|April|Mei|Juni|Juli|Agustus|September|Oktober|November|Desember'
+MONTHS_EN = 'January|February|March|April|May|June|July|August|September|October|November|December'
+DAYS_ID = 'Senin|Selasa|Rabu|Kamis|Jumat|Sabtu|Minggu'
+
+# Python's backtracking engine only skips ahead quickly when a pattern starts
+# with a literal or a character class, so "\b\d" is written as
+# "\d(?<=\b\d)": same match, but the scan jumps from digit to digit.
+
+# Digit-led dates in one pass: "13 Februari 2025", "2025-02-13", "13/02/2025"
+DATE_PATTERN = re.compile(
+    r'(?P<lead>\d)(?<=\b\d)(?:'
+    rf'(?P<id_d>\d?)\s+(?P<id_m>(?i:{MONTHS_ID}))\s+(?P<id_y>\d{{4}})\b'
+    r'|(?P<iso_y>\d{3})[-/](?P<iso_m>\d{1,2})[-/](?P<iso_d>\d{1,2})\b'
+    r'|(?P<s_d>\d?)[-/](?P<s_m>\d{1,2})[-/](?P<s_y>\d{4})\b'
+    r')'
+)
+# Day name in front of an Indonesian date ("Kamis, 13 Februari 2025"), matched at the end of a short lookback
+DAY_BEFORE = re.compile(rf'\b(?P<day>{DAYS_ID}),?\s+\Z', re.IGNORECASE)
+# English dates: day and year ("13, 2025") first, then the month in front of them
+EN_DAY_YEAR = re.compile(r'\d(?<=\s\d)\d?,?\s+\d{4}\b')
+EN_DATE = re.compile(rf'(?P<en_m>{MONTHS_EN})\s+(?P<en_d>\d{{1,2}}),?\s+(?P<en_y>\d{{4}})\b', re.IGNORECASE)
+MONTH_BEFORE = re.compile(rf'\b(?:{MONTHS_EN})\s+\Z', re.IGNORECASE)
+# Characters searched back from a date for a day or month name (name plus separating whitespace)
+LOOKBACK_CHARS = 64
+
+TEMPORAL_PATTERN = re.compile(r'\b(Q[1-4]\s+\d{4}|FY\s*\d{4}|tahun\s+\d{4}|year\s+\d{4})\b', re.IGNORECASE)
+
+# "5.75%" (value without the sign)
+PERCENT_NUMBER = re.compile(r'(\d(?<=\b\d)\d*[,.]\d+)%')
+# "1.250.000", "3,5", "42"
+GROUPED_NUMBER = re.compile(r'\d(?<=\b\d)\d{0,2}(?:[.,]\d{3})*(?:[.,]\d+)?\b')
+
+URL_PATTERN = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+', re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Window numeric patterns: currencies, then percentages and periods (which share the leading digits)
+CURRENCY_PATTERN = re.compile(
+    r'(?P<idr>(?:[Rr][Pp]|[Ii][Dd][Rr])\s?[\d,.]+(?:\s*(?i:ribu|juta|miliar|triliun))?)'
+    r'|(?P<usd>(?:[Uu][Ss][Dd]|\$)\s?[\d,.]+(?:\s*(?i:thousand|million|billion))?)'
+)
+QUANTITY_PATTERN = re.compile(
+    r'\d+(?:(?P<percentage>(?:[.,]\d+)?\s*%)|(?P<period>\s*(?i:tahun|bulan|hari|minggu|kuartal|semester)))'
+)
+# Reporting type of each pattern group, in summary order (plain numbers last)
+NUMERIC_KINDS = (('idr', 'currency'), ('usd', 'currency'), ('percentage', 'percentage'),
+                 ('period', 'period'), ('number', 'number'))
+
+
+def unique(values: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """First `limit` distinct values in order of first occurrence (stops consuming early)"""
+    return list(islice(_distinct(values), limit))
+
+
+def _distinct(values: Iterable[str]) -> Iterator[str]:
+    seen = set()
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            yield value
+
+
+def iter_dates(text: str) -> Iterator[str]:
+    """
+    Dates as space-joined parts: "13 Februari 2025" (with a day name in front
+    also "Kamis 13 Februari 2025"), "2025 02 13", "13 02 2025", "January 13 2025"
+    """
+    for match in DATE_PATTERN.finditer(text):
+        start = match.start()
+        if match['id_m'] is not None:
+            date = f"{match['lead']}{match['id_d']} {match['id_m']} {match['id_y']}"
+            day = DAY_BEFORE.search(text, max(0, start - LOOKBACK_CHARS), start)
+            if day:
+                yield f"{day['day']} {date}"
+            yield date
+        elif match['iso_m'] is not None:
+            yield f"{match['lead']}{match['iso_y']} {match['iso_m']} {match['iso_d']}"
+        else:
+            yield f"{match['lead']}{match['s_d']} {match['s_m']} {match['s_y']}"
+
+    for candidate in EN_DAY_YEAR.finditer(text):
+        day_start = candidate.start()
+        month = MONTH_BEFORE.search(text, max(0, day_start - LOOKBACK_CHARS), day_start)
+        if month:
+            match = EN_DATE.match(text, month.start())
+            if match:
+                yield ' '.join(match.groups())
+
+
+def iter_numbers(text: str) -> Iterator[str]:
+    """Percentage values first, then every grouped number"""
+    yield from PERCENT_NUMBER.findall(text)
+    for match in GROUPED_NUMBER.finditer(text):
+        yield match.group()
+
+
+def find_urls(text: str) -> List[str]:
+    folded = text.lower()
+    if 'http' not in folded and 'www.' not in folded:
+        return []
+    return URL_PATTERN.findall(text)
+
+
+def find_emails(text: str) -> List[str]:
+    return EMAIL_PATTERN.findall(text) if '@' in text else []
+
+
+class NumericPatterns:
+    """
+    Currency, percentage, period and number occurrences of one text.
+
+    Scans on first use and keeps only counts per kind and the first
+    `max_samples` values of each kind.
+    """
+
+    __slots__ = ('_text', '_max_samples', '_counts', '_samples')
+
+    def __init__(self, text: str, max_samples: int = 5):
+        self._text = text
+        self._max_samples = max_samples
+        self._counts: Optional[Dict[str, int]] = None
+        self._samples: Dict[str, List[str]] = {}
+
+    def _scan(self) -> Dict[str, int]:
+        if self._counts is None:
+            counts = dict.fromkeys((name for name, _ in NUMERIC_KINDS), 0)
+            samples: Dict[str, List[str]] = {name: [] for name, _ in NUMERIC_KINDS}
+            limit = self._max_samples
+            for pattern in (CURRENCY_PATTERN, QUANTITY_PATTERN):
+                for match in pattern.finditer(self._text):
+                    kind = match.lastgroup
+                    counts[kind] += 1
+                    if len(samples[kind]) < limit:
+                        samples[kind].append(match.group())
+            numbers = GROUPED_NUMBER.finditer(self._text)
+            samples['number'] = [match.group() for match in islice(numbers, limit)]
+            counts['number'] = len(samples['number']) + sum(1 for _ in numbers)
+            self._counts, self._samples, self._text = counts, samples, ''
+        return self._counts
+
+    def __len__(self) -> int:
+        return sum(self._scan().values())
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Occurrences per reported type ('currency', 'percentage', 'period', 'number'), zero counts omitted"""
+        counts: Dict[str, int] = {}
+        for name, kind in NUMERIC_KINDS:
+            if self._scan()[name]:
+                counts[kind] = counts.get(kind, 0) + self._counts[name]
+        return counts
+
+    def samples(self, n: int = 5) -> List[Tuple[str, str]]:
+        """First `n` (value, type) pairs, currencies first and plain numbers last"""
+        self._scan()
+        pairs = ((value, kind) for name, kind in NUMERIC_KINDS for value in self._samples[name])
+        return list(islice(pairs, n))
+
+    def __repr__(self) -> str:
+        return f"NumericPatterns({self.counts})"
@@ -0,0 +1,236 @@
+"""
+Columnar Unit Store
+
+Compact, array-backed storage for the content units produced by extraction.
+Instead of one JSON object per unit, every field is a column:
+
+- page / y0 / bbox as NumPy number arrays,
+- doc_id, unit_type, column and source as small-integer codes into a level list,
+- unit_id, anchor, content and extra (JSON text) as one UTF-8 byte blob per
+  column plus an offsets array.
+
+The store is written once as an uncompressed ``.npz`` (a plain memory copy per
+column, no text formatting). Loading copies the columns back without parsing
+anything; strings are decoded per unit on access, so consumers that only sort
+by position or read a few fields never decode the whole document.
+
+``UnitStore.records()`` returns read-only mapping views with the same keys and
+values as the dicts in the legacy ``units_metadata.json`` export, so code
+written against those dicts (``unit.get('content', '')``) keeps working.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+UNIT_STORE_FILENAME = "units.npz"
+FORMAT_VERSION = 1
+
+# Field order of extraction.Unit (and of the legacy JSON export)
+FIELDS = ('unit_id', 'doc_id', 'page', 'unit_type', 'column', 'bbox', 'y0',
+          'source', 'anchor', 'content', 'extra')
+# Low-cardinality fields stored as codes into a level list
+CATEGORICAL_FIELDS = ('doc_id', 'unit_type', 'column', 'source')
+# Free-text fields stored as blob + offsets (None kept via a null mask)
+STRING_FIELDS = ('unit_id', 'anchor', 'content')
+FIELD_KINDS = {
+    **{name: 'string' for name in STRING_FIELDS},
+    **{name: 'category' for name in CATEGORICAL_FIELDS},
+    'page': 'number', 'y0': 'number', 'bbox': 'bbox', 'extra': 'extra',
+}
+
+
+def _encode_strings(values: Sequence[Optional[str]]) -> Dict[str, np.ndarray]:
+    encoded = [b'' if v is None else v.encode('utf-8') for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    return {
+        'blob': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+        'offsets': offsets,
+        'null': np.fromiter((v is None for v in values), dtype=bool, count=len(values)),
+    }
+
+
+def _encode_categories(values: Sequence[Any]) -> Dict[str, np.ndarray]:
+    index: Dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+    return {'codes': codes, 'levels': np.array(json.dumps(list(index)))}
+
+
+def export_json(units: Sequence[Any], path: Union[str, Path]) -> Path:
+    """
+    Write the legacy units_metadata.json (same bytes as json.dumps of Unit.to_dict()
+    with indent=2), reading fields directly instead of deep-copying every unit
+    """
+    path = Path(path)
+    records = [{name: getattr(unit, name) for name in FIELDS} for unit in units]
+    path.write_text(json.dumps(records, indent=2), encoding='utf-8')
+    return path
+
+
+class UnitStore:
+    """Column arrays for N units; see the module docstring for the layout"""
+
+    __slots__ = ('_columns', '_cache', '_len')
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._columns = columns
+        # Python-side views built on first use (lists, memoryviews, level lists)
+        self._cache: Dict[str, Any] = {}
+        self._len = int(columns['page'].shape[0])
+
+    # -- construction / persistence ---------------------------------------------------
+
+    @classmethod
+    def from_units(cls, units: Sequence[Any]) -> "UnitStore":
+        """Build from extraction Unit objects or legacy unit dicts"""
+        if units and isinstance(units[0], Mapping):
+            get: Callable[[Any, str], Any] = lambda unit, key: unit.get(key)
+        else:
+            get = getattr
+
+        def column(name):
+            return [get(unit, name) for unit in units]
+
+        n = len(units)
+        columns = {
+            'format_version': np.array(FORMAT_VERSION),
+            'page': np.fromiter(column('page'), dtype=np.int32, count=n),
+            'y0': np.fromiter(column('y0'), dtype=np.float64, count=n),
+            'bbox': np.array(column('bbox'), dtype=np.float64).reshape(n, 4),
+        }
+        for name in CATEGORICAL_FIELDS:
+            for part, array in _encode_categories(column(name)).items():
+                columns[f'{name}_{part}'] = array
+        extras = [json.dumps(extra, ensure_ascii=False) for extra in column('extra')]
+        for name, values in list(zip(STRING_FIELDS, map(column, STRING_FIELDS))) + [('extra', extras)]:
+            for part, array in _encode_strings(values).items():
+                columns[f'{name}_{part}'] = array
+        return cls(columns)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write all columns to one uncompressed .npz file"""
+        path = Path(path)
+        with path.open('wb') as f:
+            np.savez(f, **self._columns)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "UnitStore":
+        """Read a store file (one read, one memory copy per column; no text is parsed)"""
+        with np.load(io.BytesIO(Path(path).read_bytes()), allow_pickle=False) as npz:
+            columns = {name: npz[name] for name in npz.files}
+        version = int(columns['format_version'])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported unit store version {version} in {path}")
+        return cls(columns)
+
+    # -- column access ----------------------------------------------------------------
+
+    def _list(self, name: str) -> List[Any]:
+        values = self._cache.get(name)
+        if values is None:
+            values = self._cache[name] = self._columns[name].tolist()
+        return values
+
+    def _string(self, name: str, index: int) -> Optional[str]:
+        if self._list(f'{name}_null')[index]:
+            return None
+        key = f'{name}_blob'
+        blob = self._cache.get(key)
+        if blob is None:
+            blob = self._cache[key] = memoryview(self._columns[key])
+        offsets = self._list(f'{name}_offsets')
+        return str(blob[offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def _category(self, name: str, index: int) -> Any:
+        key = f'{name}_levels'
+        levels = self._cache.get(key)
+        if levels is None:
+            levels = self._cache[key] = json.loads(str(self._columns[key]))
+        return levels[self._list(f'{name}_codes')[index]]
+
+    def field(self, name: str, index: int) -> Any:
+        """Value of one field of unit `index`, as in the legacy JSON"""
+        kind = FIELD_KINDS[name]
+        if kind == 'string':
+            return self._string(name, index)
+        if kind == 'category':
+            return self._category(name, index)
+        if kind == 'extra':
+            return json.loads(self._string(name, index))
+        value = self._list(name)[index]
+        # bbox rows are handed out as fresh lists (callers may mutate the dicts they get)
+        return list(value) if kind == 'bbox' else value
+
+    @property
+    def pages(self) -> np.ndarray:
+        return self._columns['page']
+
+    @property
+    def bboxes(self) -> np.ndarray:
+        return self._columns['bbox']
+
+    # -- record views -----------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> "UnitRecord":
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        return UnitRecord(self, index)
+
+    def __iter__(self) -> Iterator["UnitRecord"]:
+        return (UnitRecord(self, i) for i in range(self._len))
+
+    def records(self) -> List["UnitRecord"]:
+        return list(self)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every unit as a plain dict"""
+        return [dict(record) for record in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the column arrays"""
+        return sum(array.nbytes for array in self._columns.values())
+
+
+class UnitRecord(Mapping):
+    """Read-only dict view of one unit; fields are decoded on access"""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: UnitStore, index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store.field(key, self._index)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self._store.field(key, self._index)
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in FIELD_KINDS
+
+    def __repr__(self) -> str:
+        return f"UnitRecord({self._store.field('unit_id', self._index)!r})"
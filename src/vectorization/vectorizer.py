@@ -26,6 +26,7 @@ def vectorize_and_store(
     version: str,
     embeddings: OpenAIEmbeddings | None = None,
     namespace: str = "",
+    upsert_slots=None,
 ) -> bool:
     """
     Melakukan vektorisasi pada file markdown dan menyimpannya ke dalam Pinecone.
@@ -42,6 +43,8 @@ def vectorize_and_store(
         version (str): Versi dokumen ('v1' atau 'v2') untuk metadata.
         embeddings (OpenAIEmbeddings | None): Fungsi embedding yang sudah diinisialisasi.
         namespace (str): Namespace Pinecone untuk isolasi data (default: "" untuk testing).
+        upsert_slots: Semaphore (threading) opsional yang membatasi upsert Pinecone
+            yang berjalan bersamaan antar dokumen (scheduler multi-file).
 
     Returns:
         bool: True jika berhasil, False jika terjadi kesalahan.
@@ -192,7 +195,11 @@ def vectorize_and_store(
     num_batches = (len(vectors_to_upsert) + batch_size - 1) // batch_size
     for i in range(0, len(vectors_to_upsert), batch_size):
         batch = vectors_to_upsert[i:i + batch_size]
-        pinecone_index.upsert(vectors=batch, namespace=namespace)
+        if upsert_slots is not None:
+            with upsert_slots:
+                pinecone_index.upsert(vectors=batch, namespace=namespace)
+        else:
+            pinecone_index.upsert(vectors=batch, namespace=namespace)
     
     # Log simplified (only if multiple batches)
     if num_batches > 1: